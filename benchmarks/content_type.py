@@ -0,0 +1,49 @@
+"""
+Benchmark :func:`slack.sansio.parse_content_type` against the previous :func:`cgi.parse_header` based implementation.
+
+Usage: PYTHONPATH=. python benchmarks/content_type.py
+"""
+import timeit
+
+from slack import sansio
+
+try:
+    import cgi
+except ImportError:  # removed in python 3.13
+    cgi = None  # type: ignore
+
+HEADERS = (
+    {"content-type": "application/json; charset=utf-8"},
+    {"content-type": "text/plain; charset=utf-8"},
+    {"content-type": "application/json"},
+)
+NUMBER = 100000
+
+
+def parse_content_type_cgi(headers):
+    content_type = headers.get("content-type")
+    if not content_type:
+        return None, "utf-8"
+    else:
+        type_, parameters = cgi.parse_header(content_type)
+        encoding = parameters.get("charset", "utf-8")
+        return type_, encoding
+
+
+def bench(function):
+    return min(
+        timeit.repeat(
+            lambda: [function(headers) for headers in HEADERS], number=NUMBER, repeat=5,
+        )
+    )
+
+
+if __name__ == "__main__":
+    calls = NUMBER * len(HEADERS)
+    current = bench(sansio.parse_content_type)
+    print(f"sansio.parse_content_type: {current / calls * 1e9:.0f} ns per call")
+
+    if cgi:
+        previous = bench(parse_content_type_cgi)
+        print(f"cgi.parse_header:          {previous / calls * 1e9:.0f} ns per call")
+        print(f"speedup:                   x{previous / current:.1f}")
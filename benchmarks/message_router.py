@@ -0,0 +1,66 @@
+"""
+Benchmark :class:`slack.events.MessageRouter` dispatch with and without compiled routes.
+
+Usage: PYTHONPATH=. python benchmarks/message_router.py
+"""
+import random
+import timeit
+
+from slack.events import Message, MessageRouter
+
+PATTERNS = 300
+NUMBER = 2000
+WORDS = ("deploy", "status", "help", "weather", "release", "karma", "remind", "poll")
+
+
+def make_router(compiled):
+    router = MessageRouter(compiled=compiled)
+    for i in range(PATTERNS):
+        word = WORDS[i % len(WORDS)]
+        if i % 3 == 0:
+            router.register(f"^!{word}{i} (\\w+)", f"handler_{i}")
+        elif i % 3 == 1:
+            router.register(f"{word}{i}", f"handler_{i}", channel="C00000A00")
+        else:
+            router.register(f"{word}-{i}\\s+\\d+", f"handler_{i}")
+    return router
+
+
+def make_messages():
+    rng = random.Random(0)
+    messages = []
+    for i in range(100):
+        if i % 10 == 0:
+            text = f"!{WORDS[0]}0 production"
+        else:
+            text = " ".join(
+                rng.choice(("hello", "the", "build", "is", "green", "today"))
+                for _ in range(12)
+            )
+        messages.append(Message({"channel": "C00000A00", "text": text}))
+    return messages
+
+
+def bench(router, messages):
+    return min(
+        timeit.repeat(
+            lambda: [list(router.dispatch(message)) for message in messages],
+            number=NUMBER // len(messages),
+            repeat=5,
+        )
+    )
+
+
+if __name__ == "__main__":
+    messages = make_messages()
+    plain, compiled = make_router(False), make_router(True)
+    assert [list(plain.dispatch(m)) for m in messages] == [
+        list(compiled.dispatch(m)) for m in messages
+    ]
+
+    plain_time = bench(plain, messages)
+    compiled_time = bench(compiled, messages)
+    print(f"{PATTERNS} patterns")
+    print(f"plain:    {plain_time / NUMBER * 1e6:.1f} us per message")
+    print(f"compiled: {compiled_time / NUMBER * 1e6:.1f} us per message")
+    print(f"speedup:  x{plain_time / compiled_time:.1f}")
@@ -0,0 +1,51 @@
+"""
+Benchmark incoming request signature validation with a text body and with the raw bytes body.
+
+Usage: PYTHONPATH=. python benchmarks/signature.py
+"""
+import hmac
+import time
+import timeit
+import hashlib
+
+from slack import sansio
+
+SIGNING_SECRET = "mysupersecret"
+BODY = (
+    b'{"token":"abcdefghijkl","team_id":"T000000","event":{"type":"message","text":"%s"}}'
+    % (b"x" * 2000)
+)
+TIMESTAMP = str(int(time.time()))
+HEADERS = {
+    "X-Slack-Request-Timestamp": TIMESTAMP,
+    "X-Slack-Signature": "v0="
+    + hmac.new(
+        SIGNING_SECRET.encode("utf-8"),
+        b"v0:" + TIMESTAMP.encode("ascii") + b":" + BODY,
+        digestmod=hashlib.sha256,
+    ).hexdigest(),
+}
+NUMBER = 100000
+
+
+def bench(function):
+    return min(timeit.repeat(function, number=NUMBER, repeat=5))
+
+
+if __name__ == "__main__":
+    validator = sansio.SignatureValidator(SIGNING_SECRET)
+    cases = (
+        (
+            "text body",
+            lambda: sansio.validate_request_signature(
+                BODY.decode("utf-8"), HEADERS, SIGNING_SECRET
+            ),
+        ),
+        (
+            "bytes body",
+            lambda: sansio.validate_request_signature(BODY, HEADERS, SIGNING_SECRET),
+        ),
+        ("SignatureValidator", lambda: validator.validate(BODY, HEADERS)),
+    )
+    for name, function in cases:
+        print(f"{name:<20} {NUMBER / bench(function):.0f} requests per second")
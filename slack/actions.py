@@ -23,6 +23,8 @@ class Action(MutableMapping):
                                                       incoming event's
     """
 
+    __slots__ = ("action",)
+
     def __init__(
         self,
         raw_action: typing.MutableMapping,
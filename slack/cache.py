@@ -0,0 +1,302 @@
+"""
+Caching of slack API responses for idempotent read methods.
+
+Methods marked `cacheable` in :class:`slack.methods` (e.g. `users.info`, `conversations.info`) can be answered from a
+cache given to :class:`SlackAPI <slack.io.abc.SlackAPI>`. Responses are keyed on the method url, the request data and
+the token. Only successful responses are cached.
+
+The same stores hold the result of the RTM bootstrap (the bot id found with `auth.test` and `users.info`) when given
+as the `bootstrap_cache` of the client. A :class:`slack.cache.FileResponseCache` in a shared directory lets all the
+workers of a host reuse it.
+"""
+
+import os
+import copy
+import json
+import time
+import hashlib
+import threading
+from typing import Tuple, Union, Optional, MutableMapping
+from collections import OrderedDict
+
+from .methods import ROOT_URL, Methods
+from .checkpoint import _write_json
+
+_CACHEABLE_URLS = frozenset(item.value.url for item in Methods if item.value.cacheable)
+
+
+def is_cacheable(url: Union[str, Methods]) -> bool:
+    """
+    Check if the responses of a slack API method can be cached
+
+    Args:
+        url: :class:`slack.methods` or url string
+
+    Returns:
+        `True` for the methods marked `cacheable`
+    """
+    if isinstance(url, Methods):
+        return url.value.cacheable
+    return method_prefix(url)[:-1] in _CACHEABLE_URLS
+
+
+def cache_key(
+    url: Union[str, Methods], data: Optional[MutableMapping], token: Optional[str]
+) -> str:
+    """
+    Build the cache key of a request
+
+    The key starts with the method url, followed by a digest of the normalized data and token, so the cached responses
+    of a method can be invalidated by prefix.
+
+    Args:
+        url: :class:`slack.methods` or url string
+        data: Data of the request
+        token: Slack API token of the request
+
+    Returns:
+        The cache key
+    """
+    normalized = json.dumps([data or {}, token], sort_keys=True, default=str)
+    digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    return method_prefix(url) + digest
+
+
+def bootstrap_key(token: Optional[str]) -> str:
+    """
+    Build the cache key of the RTM bootstrap of a token
+
+    Args:
+        token: Slack API token of the client
+
+    Returns:
+        The cache key
+    """
+    return "bootstrap#" + hashlib.sha256((token or "").encode("utf-8")).hexdigest()
+
+
+def method_prefix(url: Union[str, Methods]) -> str:
+    """
+    Prefix of the cache keys of a slack API method
+
+    Args:
+        url: :class:`slack.methods` or url string
+
+    Returns:
+        The prefix given to :meth:`AbstractResponseCache.invalidate <slack.cache.AbstractResponseCache.invalidate>`
+        to invalidate all the cached responses of the method
+    """
+    if isinstance(url, Methods):
+        return url.value.url + "#"
+    elif not url.startswith("https://"):
+        return ROOT_URL + url + "#"
+    return url + "#"
+
+
+class AbstractResponseCache:
+    """
+    Base class for response cache backends
+
+    Backends must return their own copy of the cached responses as callers are free to modify them.
+    """
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Get a cached response
+
+        Args:
+            key: Key of the request (see :func:`slack.cache.cache_key`)
+
+        Returns:
+            The cached response or `None` if it is not cached or expired
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, response: dict) -> None:
+        """
+        Cache a response
+
+        Args:
+            key: Key of the request (see :func:`slack.cache.cache_key`)
+            response: Decoded response of the request
+        """
+        raise NotImplementedError
+
+    def invalidate(self, prefix: str = "") -> None:
+        """
+        Remove the cached responses whose key start with `prefix`
+
+        Args:
+            prefix: A :func:`method prefix <slack.cache.method_prefix>` to invalidate all the responses of a method, a
+             full key or an empty string to clear the cache
+        """
+        raise NotImplementedError
+
+
+class ResponseCache(AbstractResponseCache):
+    """
+    Bounded in-process response cache
+
+    Responses expire `ttl` seconds after being cached. When the cache is full the least recently used response is
+    evicted.
+
+    The cache is thread safe.
+
+    Args:
+        maxsize: Maximum number of responses kept in the cache
+        ttl: Time (in seconds) a response is kept in the cache
+
+    Attributes:
+        hits: Number of responses found in the cache
+        misses: Number of responses not found or expired
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._responses: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def get(self, key: str, now: Optional[float] = None) -> Optional[dict]:
+        """
+        Get a cached response
+
+        Args:
+            key: Key of the request (see :func:`slack.cache.cache_key`)
+            now: Current time (default to :func:`time.monotonic`)
+
+        Returns:
+            A copy of the cached response or `None` if it is not cached or expired
+        """
+        if now is None:
+            now = time.monotonic()
+
+        with self._lock:
+            entry = self._responses.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._responses[key]
+                self.misses += 1
+                return None
+
+            self._responses.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(entry[1])
+
+    def set(self, key: str, response: dict, now: Optional[float] = None) -> None:
+        """
+        Cache a response
+
+        Args:
+            key: Key of the request (see :func:`slack.cache.cache_key`)
+            response: Decoded response of the request
+            now: Current time (default to :func:`time.monotonic`)
+        """
+        if now is None:
+            now = time.monotonic()
+
+        response = copy.deepcopy(response)
+        with self._lock:
+            self._responses[key] = (now + self.ttl, response)
+            self._responses.move_to_end(key)
+            while len(self._responses) > self.maxsize:
+                self._responses.popitem(last=False)
+
+    def invalidate(self, prefix: str = "") -> None:
+        with self._lock:
+            if not prefix:
+                self._responses.clear()
+                return
+
+            for key in [key for key in self._responses if key.startswith(prefix)]:
+                del self._responses[key]
+
+
+class FileResponseCache(AbstractResponseCache):
+    """
+    Response cache shared between processes through JSON files in a local directory
+
+    Responses expire `ttl` seconds (wall clock) after being cached. Files are replaced atomically and expired files
+    are removed when read.
+
+    Args:
+        directory: Directory of the cache files, created if it doesn't exist
+        ttl: Time (in seconds) a response is kept in the cache
+    """
+
+    def __init__(self, directory: str, ttl: float = 3600) -> None:
+        self.directory = directory
+        self.ttl = ttl
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, key: str, now: Optional[float] = None) -> Optional[dict]:
+        """
+        Get a cached response
+
+        Args:
+            key: Key of the request (see :func:`slack.cache.cache_key`)
+            now: Current time (default to :func:`time.time`)
+
+        Returns:
+            The cached response or `None` if it is not cached or expired
+        """
+        if now is None:
+            now = time.time()
+
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        if entry["expires"] <= now:
+            self._unlink(path)
+            return None
+        return entry["response"]
+
+    def set(self, key: str, response: dict, now: Optional[float] = None) -> None:
+        """
+        Cache a response
+
+        Args:
+            key: Key of the request (see :func:`slack.cache.cache_key`)
+            response: Decoded response of the request
+            now: Current time (default to :func:`time.time`)
+        """
+        if now is None:
+            now = time.time()
+
+        entry = {"key": key, "expires": now + self.ttl, "response": response}
+        _write_json(self.directory, self._path(key), entry)
+
+    def invalidate(self, prefix: str = "") -> None:
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+
+            path = os.path.join(self.directory, name)
+            if prefix:
+                try:
+                    with open(path, encoding="utf-8") as f:
+                        if not json.load(f)["key"].startswith(prefix):
+                            continue
+                except (FileNotFoundError, ValueError):
+                    continue
+            self._unlink(path)
+
+    @staticmethod
+    def _unlink(path: str) -> None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,193 @@
+"""
+Checkpoints of paginated iterations.
+
+An :class:`slack.checkpoint.IterState` describes an iteration (method, data, iteration mode) and how far it went.
+When :meth:`SlackAPI.iter <slack.io.abc.SlackAPI.iter>` is given a store the state is saved after each page is
+consumed, so a long export interrupted by a crash or a deploy restarts from the last consumed page instead of the
+first one. Items of a page being consumed when the iteration stopped are yielded again on restart. The state of a
+finished iteration is deleted from the store.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+from typing import Any, Dict, Union, Optional, MutableMapping
+
+from .methods import Methods
+
+
+def _write_json(directory: str, path: str, document: Any) -> None:
+    """
+    Write a JSON document through a temporary file of `directory` replacing `path`, so readers never see a
+    partially written file
+    """
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(document, f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class IterState:
+    """
+    Serializable state of a paginated iteration
+
+    Args:
+        url: :class:`slack.methods` or url string
+        data: Data of the request, without the iteration parameters
+        iterkey: Key in response data to iterate over
+        itermode: Iteration mode (one of `cursor`, `page` or `timeline`)
+        itervalue: Value of the next page (cursor hash, page or timestamp depending on the itermode)
+        done: The last page was consumed
+    """
+
+    def __init__(
+        self,
+        url: Union[str, Methods],
+        data: Optional[MutableMapping] = None,
+        *,
+        iterkey: Optional[str] = None,
+        itermode: Optional[str] = None,
+        itervalue: Optional[Union[str, int]] = None,
+        done: bool = False,
+    ) -> None:
+        self.url = url
+        self.data = dict(data or {})
+        self.iterkey = iterkey
+        self.itermode = itermode
+        self.itervalue = itervalue
+        self.done = done
+
+    def __repr__(self) -> str:
+        return f"<IterState {self.key}: {self.itervalue!r} done={self.done}>"
+
+    @property
+    def key(self) -> str:
+        """
+        Identifier of the iteration, derived from the url, data, iterkey and itermode
+        """
+        identity = self.to_dict()
+        del identity["itervalue"], identity["done"]
+        raw = json.dumps(identity, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(raw).hexdigest()
+
+    def advance(self, itervalue: Optional[Union[str, int]]) -> None:
+        """
+        Record a consumed page
+
+        Args:
+            itervalue: Value of the next page, `None` or empty after the last page
+        """
+        self.itervalue = itervalue or None
+        self.done = not itervalue
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON serializable representation of the state
+        """
+        if isinstance(self.url, Methods):
+            method: Dict[str, Any] = {"method": self.url.name}
+        else:
+            method = {"url": self.url}
+
+        return {
+            **method,
+            "data": self.data,
+            "iterkey": self.iterkey,
+            "itermode": self.itermode,
+            "itervalue": self.itervalue,
+            "done": self.done,
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "IterState":
+        """
+        Load a state serialized with :meth:`to_dict <slack.checkpoint.IterState.to_dict>`
+        """
+        if "method" in state:
+            url: Union[str, Methods] = Methods[state["method"]]
+        else:
+            url = state["url"]
+
+        return cls(
+            url,
+            state["data"],
+            iterkey=state["iterkey"],
+            itermode=state["itermode"],
+            itervalue=state["itervalue"],
+            done=state["done"],
+        )
+
+
+class AbstractCheckpointStore:
+    """
+    Base class for iteration state stores
+    """
+
+    def load(self, key: str) -> Optional[IterState]:
+        """
+        Load the state of an iteration
+
+        Args:
+            key: :attr:`IterState.key <slack.checkpoint.IterState.key>` of the iteration
+
+        Returns:
+            The saved state or `None` if the iteration was never saved
+        """
+        raise NotImplementedError
+
+    def save(self, state: IterState) -> None:
+        """
+        Save the state of an iteration, replacing the previous one
+
+        Args:
+            state: State of the iteration
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """
+        Forget the state of an iteration
+
+        Args:
+            key: :attr:`IterState.key <slack.checkpoint.IterState.key>` of the iteration
+        """
+        raise NotImplementedError
+
+
+class FileCheckpointStore(AbstractCheckpointStore):
+    """
+    Store the iteration states as JSON files in a local directory
+
+    Files are replaced atomically so a crash while saving keeps the previous state.
+
+    Args:
+        directory: Directory of the state files, created if it doesn't exist
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, key: str) -> Optional[IterState]:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return IterState.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+
+    def save(self, state: IterState) -> None:
+        _write_json(self.directory, self._path(state.key), state.to_dict())
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,102 @@
+"""
+JSON codecs used to encode requests and decode responses or events.
+
+The standard library :mod:`json` is used by default. Faster implementations can be provided to
+:class:`SlackAPI <slack.io.abc.SlackAPI>` when installed (`orjson <https://github.com/ijl/orjson>`_,
+`ujson <https://github.com/ultrajson/ultrajson>`_) or as a custom subclass of :class:`slack.codec.JSONCodec`.
+"""
+
+import json
+from typing import Any, Union
+
+
+class JSONCodec:
+    """
+    JSON codec using the standard library :mod:`json`.
+
+    Base class for custom codecs.
+    """
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        Decode a JSON document
+
+        Args:
+            data: UTF-8 encoded bytes or string
+
+        Returns:
+            Decoded object
+        """
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        """
+        Encode an object to a JSON document
+
+        Args:
+            obj: JSON serializable object
+
+        Returns:
+            JSON document
+        """
+        return json.dumps(obj)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    JSON codec using `orjson <https://github.com/ijl/orjson>`_
+
+    Raises:
+        :py:exc:`ImportError`: when orjson is not installed
+    """
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson: Any = orjson
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return self._orjson.dumps(obj).decode("utf-8")
+
+
+class UjsonCodec(JSONCodec):
+    """
+    JSON codec using `ujson <https://github.com/ultrajson/ultrajson>`_
+
+    Raises:
+        :py:exc:`ImportError`: when ujson is not installed
+    """
+
+    def __init__(self) -> None:
+        import ujson
+
+        self._ujson: Any = ujson
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._ujson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return self._ujson.dumps(obj, escape_forward_slashes=False)
+
+
+DEFAULT = JSONCodec()
+"""Default codec (standard library :mod:`json`)"""
+
+
+def find_codec() -> JSONCodec:
+    """
+    Find the fastest installed codec
+
+    Returns:
+        :class:`slack.codec.OrjsonCodec`, :class:`slack.codec.UjsonCodec` or the default codec, depending on
+        the installed libraries
+    """
+    for codec in (OrjsonCodec, UjsonCodec):
+        try:
+            return codec()
+        except ImportError:
+            continue
+    return DEFAULT
@@ -21,6 +21,8 @@ class Command(MutableMapping):
                                                       incoming command's
     """
 
+    __slots__ = ("command",)
+
     def __init__(
         self,
         raw_command: typing.MutableMapping,
@@ -0,0 +1,144 @@
+"""
+In-memory directory of the users and channels of a workspace.
+
+The directory is warmed once with :meth:`SlackAPI.warm_directory() <slack.io.abc.SlackAPI.warm_directory>` then kept
+up to date by the `user_change`, `team_join`, `channel_created`, `channel_rename` and `channel_deleted` events once
+registered to a :class:`slack.events.EventRouter`. Lookups by id, name or bot id don't query the slack API.
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+from .events import Event, EventRouter
+
+
+class _Index:
+    """
+    Entities indexed by id and by name
+    """
+
+    def __init__(self) -> None:
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        self.by_name: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, entity: Dict[str, Any]) -> Dict[str, Any]:
+        previous = self.by_id.get(entity["id"])
+        if previous is not None:
+            self._unname(previous)
+            entity = {**previous, **entity}
+
+        self.by_id[entity["id"]] = entity
+        if entity.get("name"):
+            self.by_name[entity["name"]] = entity
+        return entity
+
+    def remove(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        entity = self.by_id.pop(entity_id, None)
+        if entity is not None:
+            self._unname(entity)
+        return entity
+
+    def _unname(self, entity: Dict[str, Any]) -> None:
+        name = entity.get("name")
+        if name and self.by_name.get(name) is entity:
+            del self.by_name[name]
+
+
+class Directory:
+    """
+    Users and channels of a workspace indexed by id and by name
+
+    Updated entities are merged with the known ones, so partial objects (e.g. the channel of a `channel_rename`
+    event) keep the other attributes.
+    """
+
+    def __init__(self) -> None:
+        self._users = _Index()
+        self._channels = _Index()
+        self._bots: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._users.by_id) + len(self._channels.by_id)
+
+    def user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a user by id
+        """
+        return self._users.by_id.get(user_id)
+
+    def user_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a user by name
+        """
+        return self._users.by_name.get(name)
+
+    def bot(self, bot_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the user of a bot by bot id (e.g. the `bot_id` of a :class:`slack.events.Message`)
+        """
+        return self._bots.get(bot_id)
+
+    def channel(self, channel_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a channel by id
+        """
+        return self._channels.by_id.get(channel_id)
+
+    def channel_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a channel by name (without the leading `#`)
+        """
+        return self._channels.by_name.get(name)
+
+    def add_users(self, users: Iterable[Dict[str, Any]]) -> None:
+        """
+        Add or update users (e.g. the members of `users.list`)
+        """
+        for user in users:
+            user = self._users.add(user)
+            bot_id = user.get("profile", {}).get("bot_id")
+            if bot_id:
+                self._bots[bot_id] = user
+
+    def add_channels(self, channels: Iterable[Dict[str, Any]]) -> None:
+        """
+        Add or update channels (e.g. the channels of `conversations.list`)
+        """
+        for channel in channels:
+            self._channels.add(channel)
+
+    def remove_channel(self, channel_id: str) -> None:
+        """
+        Remove a channel
+        """
+        self._channels.remove(channel_id)
+
+    def register(self, router: EventRouter) -> None:
+        """
+        Register the handlers keeping the directory up to date
+
+        Args:
+            router: :class:`slack.events.EventRouter` of the incoming events
+        """
+        router.register("user_change", self.on_user_event)
+        router.register("team_join", self.on_user_event)
+        router.register("channel_created", self.on_channel_event)
+        router.register("channel_rename", self.on_channel_event)
+        router.register("channel_deleted", self.on_channel_deleted)
+
+    def on_user_event(self, event: Event) -> None:
+        """
+        Handler of the `user_change` and `team_join` events
+        """
+        self.add_users((event["user"],))
+
+    def on_channel_event(self, event: Event) -> None:
+        """
+        Handler of the `channel_created` and `channel_rename` events
+        """
+        self.add_channels((event["channel"],))
+
+    def on_channel_deleted(self, event: Event) -> None:
+        """
+        Handler of the `channel_deleted` event
+        """
+        self.remove_channel(event["channel"])
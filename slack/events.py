@@ -1,17 +1,37 @@
 import re
 import copy
-import json
 import logging
+import warnings
 import itertools
-from typing import Any, Dict, Iterator, Optional
+from typing import Any, Dict, List, Tuple, Union, Pattern, Iterator, Optional
 from collections import defaultdict
 from collections.abc import MutableMapping
 
 from . import exceptions
+from .codec import DEFAULT as DEFAULT_CODEC
+from .codec import JSONCodec
 
 LOG = logging.getLogger(__name__)
 
 
+_IMMUTABLE = (str, int, float, bool, type(None))
+
+
+def _copy(value: Any) -> Any:
+    """
+    Copy decoded JSON data.
+
+    Dicts and lists are copied, immutable values are shared with the original. Other objects are deep copied.
+    """
+    if type(value) is dict:
+        return {key: _copy(item) for key, item in value.items()}
+    elif type(value) is list:
+        return [_copy(item) for item in value]
+    elif isinstance(value, _IMMUTABLE):
+        return value
+    return copy.deepcopy(value)
+
+
 class Event(MutableMapping):
     """
     MutableMapping representing a slack event coming from the RTM API or the Event API.
@@ -21,6 +41,8 @@ class Event(MutableMapping):
                   (see `slack event API documentation <https://api.slack.com/events-api#receiving_events>`_)
     """
 
+    __slots__ = ("event", "metadata")
+
     def __init__(
         self, raw_event: MutableMapping, metadata: Optional[MutableMapping] = None
     ) -> None:
@@ -49,29 +71,53 @@ class Event(MutableMapping):
         """
         Clone the event
 
+        Only the dicts and lists of the event are copied, immutable values are shared with the original event.
+
         Returns:
             :class:`slack.events.Event`
 
         """
-        return self.__class__(copy.deepcopy(self.event), copy.deepcopy(self.metadata))
+        return self.__class__(_copy(self.event), _copy(self.metadata))
 
     @classmethod
-    def from_rtm(cls, raw_event: MutableMapping) -> "Event":
+    def from_rtm(
+        cls,
+        raw_event: Union[MutableMapping, str, bytes],
+        codec: Optional[JSONCodec] = None,
+        lazy: bool = False,
+    ) -> "Event":
         """
         Create an event with data coming from the RTM API.
 
         If the event type is a message a :class:`slack.events.Message` is returned.
 
+        When `lazy` is set and the type of a raw frame can be read without decoding it (the ``type`` key comes first,
+        as sent by slack), decoding the frame is deferred until the event data is first accessed. Reading the event
+        ``type`` does not decode it.
+
         Args:
-            raw_event: JSON decoded data from the RTM API
+            raw_event: JSON decoded data or raw websocket frame from the RTM API
+            codec: :class:`slack.codec.JSONCodec` used to decode a raw frame (default to :data:`slack.codec.DEFAULT`)
+            lazy: Defer the decoding of a raw frame
 
         Returns:
             :class:`slack.events.Event` or :class:`slack.events.Message`
         """
-        if raw_event["type"].startswith("message"):
-            return Message(raw_event)
+        if isinstance(raw_event, (str, bytes)):
+            event_type = _peek_type(raw_event) if lazy else None
+            if event_type is not None:
+                lazy_cls = (
+                    _LazyMessage if event_type.startswith("message") else _LazyEvent
+                )
+                return lazy_cls(raw_event, event_type, codec or DEFAULT_CODEC)
+            event = (codec or DEFAULT_CODEC).loads(raw_event)
+        else:
+            event = raw_event
+
+        if event["type"].startswith("message"):
+            return Message(event)
         else:
-            return Event(raw_event)
+            return Event(event)
 
     @classmethod
     def from_http(
@@ -114,6 +160,8 @@ class Message(Event):
     Type of :class:`slack.events.Event` corresponding to a message event type
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         msg: Optional[MutableMapping] = None,
@@ -156,20 +204,98 @@ class Message(Event):
 
         return Message(data)
 
-    def serialize(self) -> dict:
+    def serialize(self, codec: Optional[JSONCodec] = None) -> dict:
         """
         Serialize the message for sending to slack API
 
+        Args:
+            codec: :class:`slack.codec.JSONCodec` used to encode the attachments (default to
+             :data:`slack.codec.DEFAULT`)
+
         Returns:
             serialized message
         """
-        data = {**self}
-        if "attachments" in self:
-            data["attachments"] = json.dumps(self["attachments"])
+        data = dict(self.event)
+        if "attachments" in data:
+            data["attachments"] = (codec or DEFAULT_CODEC).dumps(self["attachments"])
         return data
 
-    def to_json(self) -> str:
-        return json.dumps({**self})
+    def to_json(self, codec: Optional[JSONCodec] = None) -> str:
+        """
+        Encode the message to JSON for sending to slack API
+
+        Args:
+            codec: :class:`slack.codec.JSONCodec` used to encode the message (default to :data:`slack.codec.DEFAULT`)
+
+        Returns:
+            JSON encoded message
+        """
+        data = self.event if isinstance(self.event, dict) else dict(self.event)
+        return (codec or DEFAULT_CODEC).dumps(data)
+
+
+_PEEK_TYPE = re.compile(r'\s*{\s*"type"\s*:\s*"([\w.]+)"')
+_PEEK_TYPE_BYTES = re.compile(_PEEK_TYPE.pattern.encode(), re.ASCII)
+
+
+def _peek_type(raw_event: Union[str, bytes]) -> Optional[str]:
+    """
+    Read the type of a raw RTM frame when it is the first key of the event.
+    """
+    if isinstance(raw_event, bytes):
+        match_bytes = _PEEK_TYPE_BYTES.match(raw_event)
+        return match_bytes.group(1).decode("ascii") if match_bytes else None
+    else:
+        match = _PEEK_TYPE.match(raw_event)
+        return match.group(1) if match else None
+
+
+class _Lazy:
+    """
+    Mixin deferring the decoding of a raw RTM frame until the event data is first accessed.
+
+    Attributes:
+        raw: Raw frame, `None` once decoded
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self, raw_event: Union[str, bytes], event_type: str, codec: JSONCodec
+    ) -> None:
+        self.metadata: Optional[MutableMapping] = None
+        self.raw: Optional[Union[str, bytes]] = raw_event
+        self._type = event_type
+        self._codec = codec
+
+    def __getattr__(self, name: str) -> Any:
+        if name != "event" or self.raw is None:
+            raise AttributeError(name)
+
+        self.event = self._codec.loads(self.raw)
+        self.raw = None
+        return self.event
+
+    def __getitem__(self, item):
+        if item == "type" and self.raw is not None:
+            return self._type
+        return self.event[item]
+
+    def clone(self) -> Event:
+        return self._eager(_copy(self.event), _copy(self.metadata))
+
+
+class _LazyEvent(_Lazy, Event):
+    __slots__ = ("raw", "_type", "_codec")
+    _eager = Event
+
+
+class _LazyMessage(_Lazy, Message):
+    __slots__ = ("raw", "_type", "_codec")
+    _eager = Message
+
+
+_DispatchPlan = Tuple[Tuple[Optional[str], Any], ...]
 
 
 class EventRouter:
@@ -177,10 +303,14 @@ class EventRouter:
     When receiving an event from the RTM API or the slack API it is useful to have a routing mechanisms for
     dispatching event to individual function/coroutine. This class provide such mechanisms for any
     :class:`slack.events.Event`.
+
+    The routes of each event type are flattened into an immutable dispatch plan when a handler is registered, so
+    dispatching an event only needs a single lookup of its type.
     """
 
     def __init__(self):
         self._routes: Dict[str, Dict] = defaultdict(dict)
+        self._plans: Dict[str, _DispatchPlan] = {}
 
     def register(self, event_type: str, handler: Any, **detail: Any) -> None:
         """
@@ -210,6 +340,25 @@ class EventRouter:
             self._routes[event_type][detail_key][detail_value] = []
 
         self._routes[event_type][detail_key][detail_value].append(handler)
+        self._plans[event_type] = self._build_plan(self._routes[event_type])
+
+    @staticmethod
+    def _build_plan(routes: Dict[str, Dict[Any, List[Any]]]) -> _DispatchPlan:
+        plan: List[Tuple[Optional[str], Any]] = []
+        for detail_key, detail_values in routes.items():
+            if detail_key == "*":
+                plan.append((None, tuple(detail_values.get("*", ()))))
+            else:
+                plan.append(
+                    (
+                        detail_key,
+                        {
+                            value: tuple(handlers)
+                            for value, handlers in detail_values.items()
+                        },
+                    )
+                )
+        return tuple(plan)
 
     def dispatch(self, event: Event) -> Iterator[Any]:
         """
@@ -222,14 +371,115 @@ class EventRouter:
             handler
         """
         LOG.debug('Dispatching event "%s"', event.get("type"))
-        if event["type"] in self._routes:
-            for detail_key, detail_values in self._routes.get(
-                event["type"], {}
-            ).items():
-                event_value = event.get(detail_key, "*")
-                yield from detail_values.get(event_value, [])
-        else:
-            return
+        for detail_key, handlers in self._plans.get(event["type"], ()):
+            if detail_key is None:
+                yield from handlers
+            else:
+                yield from handlers.get(event.get(detail_key, "*"), ())
+
+
+_REGEX_SPECIAL = frozenset(".^$*+?{}[]\\|()")
+_REGEX_OPTIONAL = frozenset("?*{")
+_REGEX_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+_REGEX_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+    (re.ASCII, "a"),
+)
+
+
+def _required_literal(match: Pattern) -> Optional[str]:
+    """
+    Find a literal string that must be present in a text for the pattern to match.
+
+    Only the literal characters at the start of the pattern (after a ``^`` anchor) are considered. Patterns with
+    alternations, case insensitive or verbose patterns have no required literal.
+    """
+    pattern = match.pattern
+    if (
+        not isinstance(pattern, str)
+        or "|" in pattern
+        or match.flags & (re.IGNORECASE | re.VERBOSE)
+    ):
+        return None
+
+    start = 1 if pattern.startswith("^") else 0
+    end = start
+    while end < len(pattern) and pattern[end] not in _REGEX_SPECIAL:
+        end += 1
+
+    if end < len(pattern) and pattern[end] in _REGEX_OPTIONAL:
+        end -= 1
+    return pattern[start:end] or None
+
+
+def _combine_patterns(matches: List[Pattern]) -> Optional[Pattern]:
+    """
+    Combine patterns into a single alternation matching if any of the patterns match.
+
+    Flags are scoped to each alternative. Patterns that can not be combined without changing their meaning (e.g.
+    using backreferences or global inline flags) disable the combination.
+    """
+    alternatives = []
+    for match in matches:
+        if not isinstance(match.pattern, str) or _REGEX_BACKREFERENCE.search(
+            match.pattern
+        ):
+            return None
+
+        flags = "".join(char for flag, char in _REGEX_FLAGS if match.flags & flag)
+        newline = "\n" if match.flags & re.VERBOSE else ""
+        alternatives.append(f"(?{flags}:{match.pattern}{newline})")
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            return re.compile("|".join(alternatives))
+    except (re.error, Warning):
+        return None
+
+
+class _CompiledRoutes:
+    """
+    Precompiled routes of a :class:`slack.events.MessageRouter` channel and subtype.
+
+    Patterns with a required literal are prefiltered: patterns anchored at the start of the text are indexed by the
+    first character of their literal, the others by a substring check. Patterns without literal are combined into a
+    single regex so one search discards all of them when none match. Candidate patterns are then searched in
+    registration order.
+    """
+
+    def __init__(self, routes: Dict[Pattern, List[Any]]) -> None:
+        self.routes: List[Tuple[Pattern, List[Any]]] = list(routes.items())
+        self.anchored: Dict[str, List[int]] = defaultdict(list)
+        self.literals: List[Tuple[str, int]] = []
+        self.others: List[int] = []
+
+        for index, match in enumerate(routes):
+            literal = _required_literal(match)
+            if literal is None:
+                self.others.append(index)
+            elif match.pattern.startswith("^") and not match.flags & re.MULTILINE:
+                self.anchored[literal[0]].append(index)
+            else:
+                self.literals.append((literal, index))
+
+        self.combined = None
+        if len(self.others) > 1:
+            self.combined = _combine_patterns([self.routes[i][0] for i in self.others])
+
+    def dispatch(self, text: str) -> Iterator[Any]:
+        candidates = self.anchored.get(text[:1], [])
+        candidates = candidates + [i for literal, i in self.literals if literal in text]
+        if self.combined is None or self.combined.search(text):
+            candidates.extend(self.others)
+
+        for index in sorted(candidates):
+            match, endpoints = self.routes[index]
+            if match.search(text):
+                yield from endpoints
 
 
 class MessageRouter:
@@ -239,10 +489,22 @@ class MessageRouter:
     :class:`slack.events.Message`.
 
     The routing is based on regex pattern matching of the message text and the receiving channel.
+
+    With a large number of patterns the routes can be compiled: patterns are prefiltered by their literal prefix and
+    the patterns without literal are combined into a single regex, so only the patterns that can match are searched.
+    Compiled routes are built lazily and invalidated when a new handler is registered. Handlers are yielded in the
+    same order in both modes.
+
+    Args:
+        compiled: Compile the routes
     """
 
-    def __init__(self):
+    def __init__(self, compiled: bool = False):
         self._routes: Dict[str, Dict] = defaultdict(dict)
+        self.compiled = compiled
+        self._compiled_routes: Dict[
+            str, List[Tuple[Optional[str], _CompiledRoutes]]
+        ] = {}
 
     def register(
         self,
@@ -266,6 +528,7 @@ class MessageRouter:
         """
         LOG.debug('Registering message endpoint "%s: %s"', pattern, handler)
         match = re.compile(pattern, flags)
+        self._compiled_routes = {}
 
         if subtype not in self._routes[channel]:
             self._routes[channel][subtype] = dict()
@@ -294,6 +557,10 @@ class MessageRouter:
 
         msg_subtype = message.get("subtype")
 
+        if self.compiled:
+            yield from self._dispatch_compiled(message["channel"], msg_subtype, text)
+            return
+
         for subtype, matchs in itertools.chain(
             self._routes[message["channel"]].items(), self._routes["*"].items()
         ):
@@ -301,3 +568,22 @@ class MessageRouter:
                 for match, endpoints in matchs.items():
                     if match.search(text):
                         yield from endpoints
+
+    def _dispatch_compiled(
+        self, channel: str, msg_subtype: Optional[str], text: str
+    ) -> Iterator[Any]:
+        for subtype, routes in itertools.chain(
+            self._compile(channel), self._compile("*")
+        ):
+            if msg_subtype == subtype or subtype is None:
+                yield from routes.dispatch(text)
+
+    def _compile(self, channel: str) -> List[Tuple[Optional[str], _CompiledRoutes]]:
+        if channel not in self._routes:
+            return []
+        elif channel not in self._compiled_routes:
+            self._compiled_routes[channel] = [
+                (subtype, _CompiledRoutes(matchs))
+                for subtype, matchs in self._routes[channel].items()
+            ]
+        return self._compiled_routes[channel]
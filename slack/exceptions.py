@@ -113,3 +113,17 @@ class InvalidTimestamp(InvalidRequest):
 
     def __init__(self, timestamp: float) -> None:
         self.timestamp = timestamp
+
+
+class ReplayedRequest(InvalidRequest):
+    """
+    Raised when the incoming request was already received
+
+    Attributes:
+        timestamp: Timestamp of the incoming request
+        slack_signature: Signature sent by slack
+    """
+
+    def __init__(self, timestamp: float, slack_signature: str) -> None:
+        self.timestamp = timestamp
+        self.slack_signature = slack_signature
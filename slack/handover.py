@@ -0,0 +1,133 @@
+"""
+Handover between RTM connections without interruption.
+
+Slack announces a disconnection with a `goodbye` or `team_migration_started` event. In warm-standby mode
+:meth:`SlackAPI.rtm <slack.io.abc.SlackAPI.rtm>` opens the next connection as soon as such an event arrives (or at a
+fixed interval) while the previous one keeps being read. Once the new connection says `hello` the previous one is
+closed. Events received on both connections during the overlap are delivered once.
+
+:class:`slack.handover.Handover` holds the state of the connections, the I/O is left to the client.
+"""
+
+import time
+from typing import Set, Optional
+
+from . import events, sansio
+from .replay import ReplayCache
+
+
+def event_key(event: events.Event) -> Optional[str]:
+    """
+    Identify an event received on multiple connections
+
+    Args:
+        event: Incoming :class:`slack.events.Event`
+
+    Returns:
+        A key built from the event type, subtype, channel and timestamp, `None` for events without timestamp (e.g.
+        `hello` or `pong`)
+    """
+    ts = event.get("event_ts") or event.get("ts")
+    if not ts:
+        return None
+
+    channel = event.get("channel")
+    if not isinstance(channel, str):
+        channel = ""
+    return f"{event['type']}:{event.get('subtype', '')}:{channel}:{ts}"
+
+
+class Handover:
+    """
+    State of the RTM connections of a warm-standby client
+
+    A connection is `live` until a reconnection event is received on it or a refresh is requested, it is then
+    `draining`: its events are still delivered until a newer connection says `hello`, then it is asked to stop.
+
+    Args:
+        bot_id: Id of the connected bot, its own messages are discarded
+        window: Time (in seconds) an event key is remembered to discard duplicates
+        maxsize: Maximum number of event keys remembered
+    """
+
+    def __init__(
+        self, bot_id: Optional[str] = None, window: float = 60, maxsize: int = 10000
+    ) -> None:
+        self.bot_id = bot_id
+        self.window = window
+        self._seen = ReplayCache(maxsize)
+        self._last = 0
+        self._live: Set[int] = set()
+        self._draining: Set[int] = set()
+        self._stopping: Set[int] = set()
+
+    def wants_connection(self) -> bool:
+        """
+        Check if a new connection must be opened
+        """
+        return not self._live
+
+    def connect(self) -> int:
+        """
+        Record a new connection
+
+        Returns:
+            Id of the connection
+        """
+        self._last += 1
+        self._live.add(self._last)
+        return self._last
+
+    def refresh(self) -> None:
+        """
+        Request a new connection replacing the live ones
+        """
+        self._draining |= self._live
+        self._live.clear()
+
+    def stopped(self, connection: int) -> bool:
+        """
+        Check if a connection was replaced and should be closed
+        """
+        return connection in self._stopping
+
+    def closed(self, connection: int) -> None:
+        """
+        Record a closed connection
+        """
+        self._live.discard(connection)
+        self._draining.discard(connection)
+        self._stopping.discard(connection)
+
+    def receive(
+        self, connection: int, event: events.Event, now: Optional[float] = None
+    ) -> bool:
+        """
+        Record an event received on a connection
+
+        Args:
+            connection: Id of the connection
+            event: Incoming :class:`slack.events.Event`
+            now: Current time (default to :func:`time.time`)
+
+        Returns:
+            `True` if the event must be delivered
+        """
+        if sansio.need_reconnect(event):
+            if connection in self._live:
+                self._live.discard(connection)
+                self._draining.add(connection)
+            return False
+        elif event["type"] == "hello":
+            self._stopping |= {old for old in self._draining if old < connection}
+            self._draining -= self._stopping
+        elif sansio.discard_event(event, self.bot_id):
+            return False
+
+        key = event_key(event)
+        if key is None:
+            return True
+
+        if now is None:
+            now = time.time()
+        return self._seen.add(key, now + self.window, now=now)
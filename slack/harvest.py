@@ -0,0 +1,118 @@
+"""
+Scheduling of paginated iterations over many channels.
+
+:meth:`SlackAPI.harvest <slack.io.abc.SlackAPI.harvest>` iterates a method (e.g. `conversations.history`) for
+each channel of a workspace. The unit of work is a page: a channel with a next page goes back at the end of the
+queue, so the channels being harvested progress at the same pace and a huge channel doesn't hold the others back.
+At most `max_active` channels are in progress at the same time, bounding the state kept in memory.
+"""
+
+from typing import Any, Dict, Deque, Union, Iterable, Optional
+from collections import deque, namedtuple
+
+HarvestItem = namedtuple("HarvestItem", ("channel", "item"))
+"""
+Item harvested by :meth:`SlackAPI.harvest() <slack.io.abc.SlackAPI.harvest>` with the channel it comes from.
+"""
+
+
+class ChannelProgress:
+    """
+    Progress of the harvest of a channel
+
+    Attributes:
+        channel: Channel id
+        pages: Number of pages received
+        items: Number of items received
+        itervalue: Value of the next page
+        done: The last page was received or the harvest of the channel failed
+        error: Exception that stopped the harvest of the channel
+    """
+
+    __slots__ = ("channel", "pages", "items", "itervalue", "done", "error")
+
+    def __init__(self, channel: str) -> None:
+        self.channel = channel
+        self.pages = 0
+        self.items = 0
+        self.itervalue: Optional[Union[str, int]] = None
+        self.done = False
+        self.error: Optional[Exception] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"<ChannelProgress {self.channel}: {self.pages} pages, {self.items} items"
+            f"{' done' if self.done else ''}>"
+        )
+
+
+class Scheduler:
+    """
+    Round robin scheduler of the pages of many channel iterations
+
+    Args:
+        channels: Channel ids to harvest, consumed lazily
+        max_active: Maximum number of channels in progress at the same time
+
+    Attributes:
+        progress: :class:`slack.harvest.ChannelProgress` of the started channels by channel id
+    """
+
+    def __init__(self, channels: Iterable[str], max_active: int = 100) -> None:
+        self.max_active = max_active
+        self.progress: Dict[str, ChannelProgress] = {}
+        self._pending = iter(channels)
+        self._ready: Deque[ChannelProgress] = deque()
+        self._active = 0
+
+    def next(self) -> Optional[ChannelProgress]:
+        """
+        Select the channel of the next page to request
+
+        Returns:
+            The channel progress or `None` if no page can be requested until a requested page is recorded
+        """
+        if self._active < self.max_active:
+            channel = next(self._pending, None)
+            if channel is not None:
+                self._active += 1
+                progress = self.progress[channel] = ChannelProgress(channel)
+                return progress
+
+        if self._ready:
+            return self._ready.popleft()
+        return None
+
+    def record(
+        self, progress: ChannelProgress, items: int, itervalue: Optional[Any]
+    ) -> None:
+        """
+        Record a received page
+
+        Args:
+            progress: Progress of the channel
+            items: Number of items in the page
+            itervalue: Value of the next page, `None` or empty after the last page
+        """
+        progress.pages += 1
+        progress.items += items
+        progress.itervalue = itervalue or None
+        if itervalue:
+            self._ready.append(progress)
+        else:
+            self._finish(progress)
+
+    def fail(self, progress: ChannelProgress, exc: Exception) -> None:
+        """
+        Record the failure of a page, stopping the harvest of its channel
+
+        Args:
+            progress: Progress of the channel
+            exc: Exception raised by the request
+        """
+        progress.error = exc
+        self._finish(progress)
+
+    def _finish(self, progress: ChannelProgress) -> None:
+        progress.done = True
+        self._active -= 1
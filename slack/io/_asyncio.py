@@ -0,0 +1,52 @@
+"""
+:mod:`asyncio` primitives of the asyncio based implementations of :class:`slack.io.abc.SlackAPI`
+"""
+
+import asyncio
+from typing import Any, List, Callable
+
+
+class TaskGroup:
+    """
+    Minimal task group on top of :mod:`asyncio` tasks
+    """
+
+    def __init__(self) -> None:
+        self._tasks: List[asyncio.Future] = []
+
+    async def __aenter__(self) -> "TaskGroup":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            await self.cancel()
+        else:
+            await asyncio.gather(*self._tasks)
+
+    async def spawn(self, function: Callable, *args: Any) -> None:
+        self._tasks.append(asyncio.ensure_future(function(*args)))
+
+    async def cancel(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+class Event(asyncio.Event):
+    """
+    :class:`asyncio.Event` with a coroutine `set`
+    """
+
+    async def set(self) -> None:  # type: ignore
+        super().set()
+
+
+async def timeout(seconds: float, function: Callable, *args: Any) -> Any:
+    """
+    Await `function(*args)`, raising :exc:`TimeoutError` after `seconds`
+    """
+    try:
+        return await asyncio.wait_for(function(*args), seconds)
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"Timed out after {seconds}s") from None
@@ -1,12 +1,173 @@
-import json
 import time
+import inspect
 import logging
-from typing import Tuple, Union, Optional, AsyncIterator, MutableMapping
+import functools
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+    Union,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    AsyncIterable,
+    AsyncIterator,
+    MutableMapping,
+    AsyncContextManager,
+)
+from collections import namedtuple
 
-from .. import events, sansio, methods, exceptions
+from .. import (
+    cache,
+    codec,
+    retry,
+    events,
+    sansio,
+    stream,
+    methods,
+    ratelimit,
+    checkpoint,
+    exceptions,
+)
+from ..codec import DEFAULT as DEFAULT_CODEC
+from ..harvest import Scheduler, HarvestItem, ChannelProgress
+from ..handover import Handover
+from ..directory import Directory
 
 LOG = logging.getLogger(__name__)
 
+_EXHAUSTED = object()
+
+_Page = Tuple[List[dict], Optional[Union[str, int]]]
+
+QueryResult = namedtuple("QueryResult", ("index", "url", "data", "response", "error"))
+"""
+Result of a query made by :meth:`SlackAPI.query_many() <slack.io.abc.SlackAPI.query_many>`.
+
+`index` is the position of the query in the submitted iterable. Only one of `response` (the slack API response data)
+or `error` (the exception raised by the query) is set.
+"""
+
+
+HandlerError = namedtuple("HandlerError", ("item", "handler", "error"))
+"""
+Error of a handler run by :meth:`SlackAPI.dispatch() <slack.io.abc.SlackAPI.dispatch>`.
+
+`error` is the exception raised by the handler or a :py:exc:`TimeoutError` if it did not complete in time. When the
+router failed to dispatch the item `handler` is `None`.
+"""
+
+
+async def _call(handler: Callable, item: Any) -> Any:
+    """
+    Call a handler, awaiting its result for coroutine functions
+    """
+    result = handler(item)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def _query_worker(
+    query: Callable, pending: Iterator, slots: Any, results: Any
+) -> None:
+    """
+    Run the pending queries, each once a slot is released by the consumer
+
+    An error raised by the `pending` iterator is handed to the consumer.
+    """
+    while True:
+        await slots.get()
+        try:
+            index, (url, data) = next(pending)
+        except StopIteration:
+            break
+        except Exception as exc:
+            await results.put(exc)
+            break
+
+        try:
+            response = await query(url, data)
+        except Exception as exc:
+            await results.put(QueryResult(index, url, data, None, exc))
+        else:
+            await results.put(QueryResult(index, url, data, response, None))
+    await results.put(_EXHAUSTED)
+
+
+async def _drain(queue: Any) -> AsyncIterator[Any]:
+    """
+    Yield the items put in a queue by a producer until its end marker, re-raising its exception
+    """
+    while True:
+        item = await queue.get()
+        if item is _EXHAUSTED:
+            break
+        elif isinstance(item, Exception):
+            raise item
+        yield item
+
+
+async def _harvest_worker(fetch: Callable, jobs: Any, results: Any) -> None:
+    """
+    Request the pages of the queued channels until cancelled
+    """
+    while True:
+        progress = await jobs.get()
+        try:
+            result = await fetch(progress)
+        except Exception as exc:
+            result = exc
+        await results.put((progress, result))
+
+
+def _harvested(
+    scheduler: Scheduler, progress: ChannelProgress, result: Any
+) -> List[HarvestItem]:
+    """
+    Record the result of a page request and tag its items with their channel
+    """
+    if isinstance(result, Exception):
+        LOG.warning("Harvest of %s failed: %s", progress.channel, result)
+        scheduler.fail(progress, result)
+        return []
+
+    items, itervalue = result
+    scheduler.record(progress, len(items), itervalue)
+    return [HarvestItem(progress.channel, item) for item in items]
+
+
+def _checkpoint(
+    state: checkpoint.IterState,
+    store: Optional[checkpoint.AbstractCheckpointStore],
+    itervalue: Optional[Union[str, int]],
+) -> None:
+    """
+    Record a consumed page in the iteration state and save it, a finished iteration is deleted from the store
+    """
+    state.advance(itervalue)
+    if not store:
+        return
+    elif state.done:
+        store.delete(state.key)
+    else:
+        store.save(state)
+
+
+class _Flight:
+    """
+    Request shared by concurrent identical queries
+    """
+
+    __slots__ = ("event", "response", "error")
+
+    def __init__(self, event: Any) -> None:
+        self.event = event
+        self.response: dict = {}
+        self.error: Optional[BaseException] = None
+
 
 class SlackAPI:
     """
@@ -17,11 +178,43 @@ class SlackAPI:
         session: HTTP session
         token: Slack API token
         headers: Default headers for all request
+        rate_limiter: :class:`slack.ratelimit.RateLimiter` pacing the requests to the Slack API
+        retry_policy: :class:`slack.retry.RetryPolicy` retrying rate limited and failed requests
+        codec: :class:`slack.codec.JSONCodec` encoding requests and decoding responses (default to
+         :data:`slack.codec.DEFAULT`)
+        lazy_events: Defer the decoding of RTM events until they are accessed, see
+         :meth:`slack.events.Event.from_rtm`
+        cache: :class:`slack.cache.AbstractResponseCache` answering the queries of `cacheable`
+         :class:`slack.methods` (default to no cache)
+        coalesce: Share a single request between the concurrent identical queries of `cacheable`
+         :class:`slack.methods` (default to disabled)
+        bootstrap_cache: :class:`slack.cache.AbstractResponseCache` keeping the bot id found when connecting to the
+         RTM API, e.g. a :class:`slack.cache.FileResponseCache` shared by the workers of a host
     """
 
-    def __init__(self, *, token: str, headers: Optional[MutableMapping] = None) -> None:
+    def __init__(
+        self,
+        *,
+        token: str,
+        headers: Optional[MutableMapping] = None,
+        rate_limiter: Optional[ratelimit.RateLimiter] = None,
+        retry_policy: Optional[retry.RetryPolicy] = None,
+        codec: Optional[codec.JSONCodec] = None,
+        lazy_events: bool = False,
+        cache: Optional[cache.AbstractResponseCache] = None,
+        coalesce: bool = False,
+        bootstrap_cache: Optional[cache.AbstractResponseCache] = None,
+    ) -> None:
         self._token = token
         self._headers = headers or {}
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._codec = codec or DEFAULT_CODEC
+        self._lazy_events = lazy_events
+        self._cache = cache
+        self._coalesce = coalesce
+        self._in_flight: Dict[str, _Flight] = {}
+        self._bootstrap_cache = bootstrap_cache
 
     async def _request(
         self,
@@ -36,23 +229,134 @@ class SlackAPI:
         yield ""
         raise NotImplementedError()
 
+    async def _request_chunks(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[MutableMapping],
+        body: Optional[Union[str, MutableMapping]],
+    ) -> AsyncIterator[Any]:
+        """
+        Make a request and stream its response.
+
+        Yields the response status and headers then the chunks of the response body as they are received.
+        """
+        yield ""
+        raise NotImplementedError()
+
     async def sleep(self, seconds: Union[int, float]):
         raise NotImplementedError()
 
+    def _task_group(self) -> AsyncContextManager[Any]:
+        """
+        Create a task group of the underlying async library.
+
+        The group provides ``await group.spawn(function, *args)`` to start a task and ``await group.cancel()``
+        to cancel the remaining tasks. Exiting the group waits for all its tasks.
+        """
+        raise NotImplementedError()
+
+    def _queue(self, maxsize: int = 0) -> Any:
+        """
+        Create a queue of the underlying async library.
+
+        The queue provides ``await queue.put(item)`` and ``await queue.get()``. A `maxsize` of 0 means unbounded.
+        """
+        raise NotImplementedError()
+
+    def _event(self) -> Any:
+        """
+        Create an event of the underlying async library.
+
+        The event provides ``await event.set()`` and ``await event.wait()``. Setting the event must not block.
+        """
+        raise NotImplementedError()
+
+    async def _timeout(self, seconds: float, function: Callable, *args: Any) -> Any:
+        """
+        Await ``function(*args)`` with the timeout of the underlying async library.
+
+        Raises:
+            :py:exc:`TimeoutError`: when the call did not complete in `seconds`
+        """
+        raise NotImplementedError()
+
     async def _make_query(
         self,
         url: str,
         body: Optional[Union[str, MutableMapping]],
         headers: Optional[MutableMapping],
+        single_query: Optional[Callable] = None,
+    ) -> Any:
+
+        single_query = single_query or self._make_single_query
+        attempt = 1
+        while True:
+            try:
+                return await single_query(url, body, headers)
+            except exceptions.HTTPException as exc:
+                if not self._retry_policy:
+                    raise
+                delay = self._retry_policy.delay(attempt, exc)
+                if delay is None:
+                    raise
+                LOG.warning("Attempt %s to %s failed (%s)", attempt, url, exc)
+                await self.sleep(delay)
+                attempt += 1
+
+    async def _make_single_query(
+        self,
+        url: str,
+        body: Optional[Union[str, MutableMapping]],
+        headers: Optional[MutableMapping],
     ) -> dict:
 
+        await self._rate_limit(url)
+
         LOG.debug("Querying %s with %s, %s", url, headers, body)
         status, rep_body, rep_headers = await self._request("POST", url, headers, body)
         LOG.debug("Response from %s: %s, %s, %s", url, status, rep_body, rep_headers)
 
-        response_data = sansio.decode_response(status, rep_headers, rep_body)
+        response_data = sansio.decode_response(
+            status, rep_headers, rep_body, self._codec
+        )
         return response_data
 
+    async def _open_stream(
+        self,
+        url: str,
+        body: Optional[Union[str, MutableMapping]],
+        headers: Optional[MutableMapping],
+    ) -> Tuple[AsyncIterator[Any], MutableMapping]:
+        """
+        Make a request and return its body chunks and headers.
+
+        Responses that can't be streamed (errors or non JSON bodies) are read and decoded at once to raise the
+        corresponding exception.
+        """
+        await self._rate_limit(url)
+
+        LOG.debug("Streaming %s with %s, %s", url, headers, body)
+        response = self._request_chunks("POST", url, headers, body)
+        status, rep_headers = await response.__anext__()
+        content_type, encoding = sansio.parse_content_type(rep_headers)
+        if (
+            status == 200
+            and content_type == "application/json"
+            and encoding.lower() in ("utf-8", "utf8")
+        ):
+            return response, rep_headers
+
+        rep_body = b"".join([chunk async for chunk in response])
+        sansio.decode_response(status, rep_headers, rep_body, self._codec)
+        raise ValueError(f"Can not stream response from {url}: {content_type}")
+
+    async def _rate_limit(self, url: str) -> None:
+        if self._rate_limiter:
+            delay = self._rate_limiter.reserve(url, self._token)
+            if delay:
+                await self.sleep(delay)
+
     async def query(
         self,
         url: Union[str, methods],
@@ -63,7 +367,10 @@ class SlackAPI:
         """
         Query the slack API
 
-        When using :class:`slack.methods` the request is made `as_json` if available
+        When using :class:`slack.methods` the request is made `as_json` if available. When the client has a cache
+        the responses of `cacheable` methods are served from it. When the client coalesces queries, concurrent
+        identical queries of `cacheable` methods without custom headers share the same request, each caller receiving
+        its own copy of the response.
 
         Args:
             url: :class:`slack.methods` or url string
@@ -74,16 +381,162 @@ class SlackAPI:
             dictionary of slack API response data
 
         """
+        key = self._cache_key(url, data)
+        if key:
+            response = self._cache.get(key)  # type: ignore
+            if response is not None:
+                return response
 
-        url, body, headers = sansio.prepare_request(
+        if not self._coalesce or headers or not cache.is_cacheable(url):
+            return await self._query(url, data, headers, as_json, key)
+
+        flight_key = cache.cache_key(url, data, self._token)
+        flight = self._in_flight.get(flight_key)
+        if flight is None:
+            return await self._lead(flight_key, url, data, as_json, key)
+
+        await flight.event.wait()
+        if flight.error is None:
+            return events._copy(flight.response)
+        elif isinstance(flight.error, Exception):
+            raise flight.error
+        return await self.query(url, data, headers, as_json)
+
+    async def _lead(
+        self,
+        flight_key: str,
+        url: Union[str, methods],
+        data: Optional[MutableMapping],
+        as_json: Optional[bool],
+        key: Optional[str],
+    ) -> dict:
+        """
+        Make the request of a query shared with the identical queries made until it completes
+        """
+        flight = self._in_flight[flight_key] = _Flight(self._event())
+        try:
+            response = await self._query(url, data, None, as_json, key)
+            flight.response = events._copy(response)
+            return response
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            del self._in_flight[flight_key]
+            await flight.event.set()
+
+    async def _query(
+        self,
+        url: Union[str, methods],
+        data: Optional[MutableMapping],
+        headers: Optional[MutableMapping],
+        as_json: Optional[bool],
+        key: Optional[str],
+    ) -> dict:
+        real_url, body, headers = sansio.prepare_request(
             url=url,
             data=data,
             headers=headers,
             as_json=as_json,
             global_headers=self._headers,
             token=self._token,
+            codec=self._codec,
         )
-        return await self._make_query(url, body, headers)
+        response = await self._make_query(real_url, body, headers)
+        if key:
+            self._cache.set(key, response)  # type: ignore
+        return response
+
+    def _cache_key(
+        self, url: Union[str, methods], data: Optional[MutableMapping]
+    ) -> Optional[str]:
+        """
+        Cache key of a query, `None` when it is not cached
+        """
+        if self._cache is None or not cache.is_cacheable(url):
+            return None
+        return cache.cache_key(url, data, self._token)
+
+    def invalidate(
+        self,
+        url: Optional[Union[str, methods]] = None,
+        data: Optional[MutableMapping] = None,
+    ) -> None:
+        """
+        Remove responses from the cache of the client
+
+        Args:
+            url: :class:`slack.methods` or url string. Without `data` all the cached responses of the method are
+             removed, without `url` the whole cache is cleared.
+            data: Data of the query to invalidate
+        """
+        if self._cache is None:
+            return
+        elif url is None:
+            self._cache.invalidate()
+        elif data is None:
+            self._cache.invalidate(cache.method_prefix(url))
+        else:
+            self._cache.invalidate(cache.cache_key(url, data, self._token))
+
+    async def query_many(
+        self,
+        queries: Iterable[Tuple[Union[str, methods], Optional[MutableMapping]]],
+        headers: Optional[MutableMapping] = None,
+        *,
+        concurrency: int = 10,
+        ordered: bool = True,
+        as_json: Optional[bool] = None,
+    ) -> AsyncIterator[QueryResult]:
+        """
+        Query the slack API for each (url, data) pair with at most `concurrency` requests in flight
+
+        A query is only started once fewer than `concurrency` results are in flight or waiting for their turn to be
+        yielded, like a sliding window over `queries`.
+
+        Errors do not interrupt the other queries, they are returned in the `error` attribute of the
+        :data:`QueryResult <slack.io.abc.QueryResult>`. An error raised while iterating over `queries` is raised.
+
+        Args:
+            queries: Iterable of (:class:`slack.methods` or url string, JSON encodable MutableMapping)
+            headers: Custom headers for all the queries
+            concurrency: Maximum number of concurrent requests
+            ordered: Yield the results in submission order instead of completion order
+            as_json: Post JSON to the slack API
+        Returns:
+            Async iterator over :data:`QueryResult <slack.io.abc.QueryResult>`
+        """
+        query = functools.partial(self.query, headers=headers, as_json=as_json)
+        results = self._queue(concurrency)
+        slots = self._queue(concurrency)
+        for _ in range(concurrency):
+            await slots.put(None)
+
+        pending = enumerate(queries)
+        buffer: Dict[int, QueryResult] = {}
+        next_index = 0
+        running = concurrency
+        async with self._task_group() as group:
+            for _ in range(concurrency):
+                await group.spawn(_query_worker, query, pending, slots, results)
+            try:
+                while running:
+                    result = await results.get()
+                    if result is _EXHAUSTED:
+                        running -= 1
+                    elif isinstance(result, Exception):
+                        raise result
+                    elif not ordered:
+                        yield result
+                        await slots.put(None)
+                    else:
+                        buffer[result.index] = result
+                        while next_index in buffer:
+                            yield buffer.pop(next_index)
+                            next_index += 1
+                            await slots.put(None)
+            finally:
+                await group.cancel()
 
     async def iter(
         self,
@@ -95,12 +548,18 @@ class SlackAPI:
         iterkey: Optional[str] = None,
         itermode: Optional[str] = None,
         minimum_time: Optional[int] = None,
-        as_json: Optional[bool] = None
+        as_json: Optional[bool] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        state: Optional[checkpoint.IterState] = None,
+        store: Optional[checkpoint.AbstractCheckpointStore] = None,
     ) -> AsyncIterator[dict]:
         """
         Iterate over a slack API method supporting pagination
 
-        When using :class:`slack.methods` the request is made `as_json` if available
+        When using :class:`slack.methods` the request is made `as_json` if available. When the client has a
+        :class:`slack.retry.RetryPolicy` a failed page is retried with the same `itervalue` and the iteration
+        resumes where it stopped.
 
         Args:
             url: :class:`slack.methods` or url string
@@ -112,24 +571,254 @@ class SlackAPI:
             minimum_time: Minimum elapsed time (in seconds) between two calls to the Slack API (default to 0).
              If not reached the client will sleep for the remaining time.
             as_json: Post JSON to the slack API
+            prefetch: Number of pages requested ahead of the consumer (default to 0).
+             When set the next pages are requested in a background task while the current one is consumed.
+            stream: Decode the items of each page as the response body is received (see :mod:`slack.stream`),
+             instead of loading the whole page in memory. Can not be combined with `prefetch`.
+            state: :class:`slack.checkpoint.IterState` of the iteration to resume. When set `url`, `data`,
+             `iterkey` and `itermode` are ignored. The state is updated after each consumed page.
+            store: :class:`slack.checkpoint.AbstractCheckpointStore` where the state is saved after each consumed
+             page. Without `state` the iteration resumes from the state previously saved in the store. The state
+             is deleted from the store once the last page is consumed, so the next identical iteration starts over.
+        Returns:
+            Async iterator over `response_data[key]`
+
+        """
+        if state is None:
+            state = checkpoint.IterState(url, data, iterkey=iterkey, itermode=itermode)
+            if store:
+                state = store.load(state.key) or state
+
+        if state.done:
+            return
+
+        if stream:
+            if prefetch:
+                raise ValueError("prefetch is not supported when streaming")
+
+            items = self._iter_stream(
+                state,
+                headers,
+                store=store,
+                limit=limit,
+                minimum_time=minimum_time,
+                as_json=as_json,
+            )
+            async for item in items:
+                yield item
+            return
+
+        pages = self._iter_pages(
+            state.url,
+            dict(state.data),
+            headers,
+            limit=limit,
+            iterkey=state.iterkey,
+            itermode=state.itermode,
+            minimum_time=minimum_time,
+            as_json=as_json,
+            itervalue=state.itervalue,
+        )
+
+        if prefetch:
+            pages = self._prefetch([pages], prefetch)
+
+        async for page, itervalue in pages:
+            for item in page:
+                yield item
+            _checkpoint(state, store, itervalue)
+
+    async def iter_timeline(
+        self,
+        url: Union[str, methods],
+        data: Optional[MutableMapping] = None,
+        headers: Optional[MutableMapping] = None,
+        *,
+        oldest: Union[str, float],
+        latest: Optional[Union[str, float]] = None,
+        slices: int = 4,
+        prefetch: int = 1,
+        limit: int = 200,
+        iterkey: Optional[str] = None,
+        itermode: Optional[str] = None,
+        minimum_time: Optional[int] = None,
+        as_json: Optional[bool] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Iterate over the history of a conversation, requesting disjoint time windows concurrently
+
+        The time range is split in `slices` windows (see :func:`slack.sansio.split_timeline`), each iterated in a
+        background task with the `oldest` and `latest` parameters of the history methods. Messages are yielded newest
+        first, in the same order as :meth:`iter() <slack.io.abc.SlackAPI.iter>`.
+
+        Args:
+            url: :class:`slack.methods` or url string of a history method
+            data: JSON encodable MutableMapping
+            headers:
+            oldest: Start of the time range (exclusive)
+            latest: End of the time range (exclusive) (default to now)
+            slices: Number of windows requested concurrently
+            prefetch: Number of pages buffered per window ahead of the consumer
+            limit: Maximum number of results to return per call.
+            iterkey: Key in response data to iterate over (required for url string).
+            itermode: Iteration mode (required for url string) (one of `cursor`, `page` or `timeline`)
+            minimum_time: Minimum elapsed time (in seconds) between two calls to the Slack API for a window.
+            as_json: Post JSON to the slack API
+
         Returns:
             Async iterator over `response_data[key]`
+        """
+        windows = sansio.split_timeline(oldest, latest or time.time(), slices)
+        iterations = [
+            self._iter_pages(
+                url,
+                {**(data or {}), "oldest": window_oldest, "latest": window_latest},
+                headers,
+                limit=limit,
+                iterkey=iterkey,
+                itermode=itermode,
+                minimum_time=minimum_time,
+                as_json=as_json,
+            )
+            for window_oldest, window_latest in windows
+        ]
+
+        async for page, _ in self._prefetch(iterations, prefetch):
+            for item in page:
+                yield item
+
+    async def harvest(
+        self,
+        url: Union[str, methods],
+        channels: Iterable[str],
+        data: Optional[MutableMapping] = None,
+        headers: Optional[MutableMapping] = None,
+        *,
+        concurrency: int = 10,
+        max_active: int = 100,
+        on_progress: Optional[Callable] = None,
+        limit: int = 200,
+        iterkey: Optional[str] = None,
+        itermode: Optional[str] = None,
+        as_json: Optional[bool] = None,
+    ) -> AsyncIterator[HarvestItem]:
+        """
+        Iterate over a slack API method supporting pagination for many channels
 
+        Pages are scheduled round robin between the channels in progress (see :mod:`slack.harvest`) and requested by
+        `concurrency` worker tasks, sharing the rate limiter of the client. The items of a channel are yielded in
+        order, items of different channels are interleaved.
+
+        A failed channel does not stop the harvest: its error is recorded in its
+        :class:`slack.harvest.ChannelProgress` and the other channels continue.
+
+        Args:
+            url: :class:`slack.methods` or url string
+            channels: Channel ids, each one is added to `data` as the `channel` parameter
+            data: JSON encodable MutableMapping
+            headers:
+            concurrency: Maximum number of requests in flight
+            max_active: Maximum number of channels in progress at the same time
+            on_progress: Called with the :class:`slack.harvest.ChannelProgress` of a channel after each page.
+             Coroutine functions are awaited.
+            limit: Maximum number of results to return per call.
+            iterkey: Key in response data to iterate over (required for url string).
+            itermode: Iteration mode (required for url string) (one of `cursor`, `page` or `timeline`)
+            as_json: Post JSON to the slack API
+
+        Returns:
+            Async iterator over :data:`HarvestItem <slack.harvest.HarvestItem>`
         """
-        itervalue = None
+        scheduler = Scheduler(channels, max_active)
+        fetch = functools.partial(
+            self._harvest_page,
+            url,
+            data,
+            headers,
+            limit=limit,
+            iterkey=iterkey,
+            itermode=itermode,
+            as_json=as_json,
+        )
+        jobs = self._queue(concurrency)
+        results = self._queue(concurrency)
+
+        async with self._task_group() as group:
+            for _ in range(concurrency):
+                await group.spawn(_harvest_worker, fetch, jobs, results)
+            try:
+                in_flight = 0
+                while True:
+                    while in_flight < concurrency:
+                        job = scheduler.next()
+                        if job is None:
+                            break
+                        await jobs.put(job)
+                        in_flight += 1
+
+                    if not in_flight:
+                        break
 
+                    progress, result = await results.get()
+                    in_flight -= 1
+                    for item in _harvested(scheduler, progress, result):
+                        yield item
+                    if on_progress:
+                        await _call(on_progress, progress)
+            finally:
+                await group.cancel()
+
+    async def _harvest_page(
+        self,
+        url: Union[str, methods],
+        data: Optional[MutableMapping],
+        headers: Optional[MutableMapping],
+        progress: ChannelProgress,
+        *,
+        limit: int,
+        iterkey: Optional[str],
+        itermode: Optional[str],
+        as_json: Optional[bool],
+    ) -> _Page:
+        """
+        Request the next page of a harvested channel
+        """
+        data, iterkey, _ = sansio.prepare_iter_request(
+            url,
+            {**(data or {}), "channel": progress.channel},
+            iterkey=iterkey,
+            itermode=itermode,
+            limit=limit,
+            itervalue=progress.itervalue,
+        )
+        response_data = await self.query(url, data, headers, as_json)
+        return response_data[iterkey], sansio.decode_iter_request(response_data)
+
+    async def _iter_pages(
+        self,
+        url: Union[str, methods],
+        data: Optional[MutableMapping],
+        headers: Optional[MutableMapping],
+        *,
+        limit: int,
+        iterkey: Optional[str],
+        itermode: Optional[str],
+        minimum_time: Optional[int],
+        as_json: Optional[bool],
+        itervalue: Optional[Union[str, int]] = None,
+    ) -> AsyncIterator[_Page]:
+        """
+        Iterate over the pages of a slack API method supporting pagination
+
+        Returns:
+            Async iterator over (`response_data[key]`, next itervalue) of each page
+        """
         if not data:
             data = {}
 
         last_request_time = None
         while True:
-            current_time = time.time()
-            if (
-                minimum_time
-                and last_request_time
-                and last_request_time + minimum_time > current_time
-            ):
-                await self.sleep(last_request_time + minimum_time - current_time)
+            await self._wait_minimum_time(last_request_time, minimum_time)
 
             data, iterkey, itermode = sansio.prepare_iter_request(
                 url,
@@ -142,26 +831,261 @@ class SlackAPI:
             last_request_time = time.time()
             response_data = await self.query(url, data, headers, as_json)
             itervalue = sansio.decode_iter_request(response_data)
-            for item in response_data[iterkey]:
-                yield item
+            yield response_data[iterkey], itervalue
 
             if not itervalue:
                 break
 
+    async def _iter_stream(
+        self,
+        state: checkpoint.IterState,
+        headers: Optional[MutableMapping],
+        *,
+        store: Optional[checkpoint.AbstractCheckpointStore],
+        limit: int,
+        minimum_time: Optional[int],
+        as_json: Optional[bool],
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over the items of a slack API method supporting pagination, streaming each page
+
+        Returns:
+            Async iterator over the items of `response_data[key]`
+        """
+        data: MutableMapping = dict(state.data)
+        last_request_time = None
+        while True:
+            await self._wait_minimum_time(last_request_time, minimum_time)
+
+            data, iterkey, _ = sansio.prepare_iter_request(
+                state.url,
+                data,
+                iterkey=state.iterkey,
+                itermode=state.itermode,
+                limit=limit,
+                itervalue=state.itervalue,
+            )
+            last_request_time = time.time()
+            decoder = stream.ItemDecoder(iterkey, self._codec)
+            items = self._stream_page(state.url, data, headers, as_json, decoder)
+            async for item in items:
+                yield item
+
+            itervalue = sansio.decode_iter_request(decoder.document)  # type: ignore
+            _checkpoint(state, store, itervalue)
+            if state.done:
+                break
+
+    async def _stream_page(
+        self,
+        url: Union[str, methods],
+        data: Optional[MutableMapping],
+        headers: Optional[MutableMapping],
+        as_json: Optional[bool],
+        decoder: stream.ItemDecoder,
+    ) -> AsyncIterator[Any]:
+        """
+        Query a page and yield its items as they are decoded from the response body
+        """
+        real_url, body, headers = sansio.prepare_request(
+            url=url,
+            data=data,
+            headers=headers,
+            global_headers=self._headers,
+            token=self._token,
+            as_json=as_json,
+            codec=self._codec,
+        )
+        chunks, rep_headers = await self._make_query(
+            real_url, body, headers, self._open_stream
+        )
+        try:
+            async for chunk in chunks:
+                for item in decoder.feed(chunk):
+                    yield item
+        finally:
+            await chunks.aclose()  # type: ignore
+
+        sansio.raise_for_api_error(rep_headers, decoder.close())
+
+    async def _wait_minimum_time(
+        self, last_request_time: Optional[float], minimum_time: Optional[int]
+    ) -> None:
+        """
+        Sleep until `minimum_time` seconds elapsed since the last request
+        """
+        current_time = time.time()
+        if (
+            minimum_time
+            and last_request_time
+            and last_request_time + minimum_time > current_time
+        ):
+            await self.sleep(last_request_time + minimum_time - current_time)
+
+    async def _prefetch(
+        self, iterations: List[AsyncIterator[_Page]], depth: int
+    ) -> AsyncIterator[_Page]:
+        """
+        Consume each page iterator in a background task, buffering up to `depth` pages per iterator ahead of the
+        caller.
+
+        The pages of all the iterators are yielded one iterator after the other. Exceptions raised while requesting a
+        page are re-raised to the caller in order.
+        """
+        queues = [self._queue(depth) for _ in iterations]
+
+        async def producer(pages: AsyncIterator[_Page], queue: Any) -> None:
+            try:
+                async for page in pages:
+                    await queue.put(page)
+            except Exception as exc:
+                await queue.put(exc)
+            else:
+                await queue.put(_EXHAUSTED)
+
+        async with self._task_group() as group:
+            for pages, queue in zip(iterations, queues):
+                await group.spawn(producer, pages, queue)
+            try:
+                for queue in queues:
+                    async for page in _drain(queue):
+                        yield page
+            finally:
+                await group.cancel()
+
+    async def dispatch(
+        self,
+        incoming: AsyncIterable[Any],
+        router: Any,
+        *,
+        concurrency: int = 10,
+        timeout: Optional[float] = None,
+        backlog: int = 100,
+    ) -> AsyncIterator[HandlerError]:
+        """
+        Run the handlers matching each incoming item concurrently
+
+        Each item of `incoming` (e.g. :meth:`SlackAPI.rtm() <slack.io.abc.SlackAPI.rtm>`) is routed with
+        ``router.dispatch(item)`` and its handlers are called with the item by `concurrency` worker tasks. Coroutine
+        handlers are awaited. When `backlog` handlers are waiting for a worker `incoming` is not consumed anymore,
+        applying backpressure to the RTM connection.
+
+        Errors do not interrupt the dispatch, they are yielded to the caller. An error raised while iterating over
+        `incoming` stops the dispatch and is raised.
+
+        Args:
+            incoming: Async iterable of items (:class:`slack.events.Event`, :class:`slack.actions.Action`, ...)
+            router: Router of the items (:class:`slack.events.EventRouter`, :class:`slack.actions.Router`, ...)
+            concurrency: Maximum number of handlers running concurrently
+            timeout: Maximum duration (in seconds) of a handler (default to no timeout)
+            backlog: Maximum number of handlers waiting for a worker
+        Returns:
+            Async iterator over :data:`HandlerError <slack.io.abc.HandlerError>`
+        """
+        jobs = self._queue(backlog)
+        results = self._queue(concurrency)
+
+        running = concurrency
+        async with self._task_group() as group:
+            await group.spawn(self._route, incoming, router, jobs, results, concurrency)
+            for _ in range(concurrency):
+                await group.spawn(self._handle, jobs, results, timeout)
+            try:
+                while running:
+                    result = await results.get()
+                    if result is _EXHAUSTED:
+                        running -= 1
+                    elif isinstance(result, HandlerError):
+                        yield result
+                    else:
+                        raise result
+            finally:
+                await group.cancel()
+
+    async def _route(
+        self,
+        incoming: AsyncIterable[Any],
+        router: Any,
+        jobs: Any,
+        results: Any,
+        concurrency: int,
+    ) -> None:
+        """
+        Route the incoming items and queue a job for each handler.
+        """
+        try:
+            async for item in incoming:
+                try:
+                    handlers = list(router.dispatch(item))
+                except Exception as exc:
+                    await results.put(HandlerError(item, None, exc))
+                    continue
+
+                for handler in handlers:
+                    await jobs.put((item, handler))
+        except Exception as exc:
+            await results.put(exc)
+        else:
+            for _ in range(concurrency):
+                await jobs.put(_EXHAUSTED)
+
+    async def _handle(self, jobs: Any, results: Any, timeout: Optional[float]) -> None:
+        """
+        Run the queued handlers until the jobs are exhausted.
+        """
+        while True:
+            job = await jobs.get()
+            if job is _EXHAUSTED:
+                await results.put(_EXHAUSTED)
+                break
+
+            item, handler = job
+            try:
+                if timeout is None:
+                    await _call(handler, item)
+                else:
+                    await self._timeout(timeout, _call, handler, item)
+            except Exception as exc:
+                await results.put(HandlerError(item, handler, exc))
+
     async def rtm(
-        self, url: Optional[str] = None, bot_id: Optional[str] = None
+        self,
+        url: Optional[str] = None,
+        bot_id: Optional[str] = None,
+        *,
+        standby: bool = False,
+        refresh_interval: Optional[float] = None,
     ) -> AsyncIterator[events.Event]:
         """
         Iterate over event from the RTM API
 
+        The bot id is looked up once (or loaded from the `bootstrap_cache` of the client), reconnections only call
+        `rtm.connect` as its websocket url can't be reused.
+
+        In warm-standby mode the next connection is opened as soon as a `goodbye` or `team_migration_started` event
+        is received, and the previous one is closed once the new one said `hello`. Events received on both
+        connections are yielded once (see :class:`slack.handover.Handover`).
+
         Args:
             url: Websocket connection url
             bot_id: Connecting bot ID
+            standby: Open the next connection before the current one is closed
+            refresh_interval: Also replace the connection every `refresh_interval` seconds (implies `standby`)
 
         Returns:
             :class:`slack.events.Event` or :class:`slack.events.Message`
 
         """
+        if standby or refresh_interval:
+            bot_id = bot_id or await self._find_bot_id()
+            incoming = self._rtm_standby(url, bot_id, refresh_interval)
+            try:
+                async for event in incoming:
+                    yield event
+            finally:
+                await incoming.aclose()  # type: ignore
+            return
+
         while True:
             bot_id = bot_id or await self._find_bot_id()
             url = url or await self._find_rtm_url()
@@ -169,6 +1093,111 @@ class SlackAPI:
                 yield event
             url = None
 
+    async def _rtm_standby(
+        self, url: Optional[str], bot_id: str, refresh_interval: Optional[float]
+    ) -> AsyncIterator[events.Event]:
+        """
+        Read the RTM connections in tasks, opening the next one before the previous one is closed
+
+        Each connection is read in its own task group, cancelled as soon as a newer connection said `hello`. An error
+        reading a connection is raised, like without standby.
+        """
+        handover = Handover(bot_id)
+        queue = self._queue()
+        readers: Dict[int, Any] = {}
+        async with self._task_group() as group:
+            if refresh_interval:
+                await group.spawn(self._refresh_timer, refresh_interval, queue)
+
+            try:
+                while True:
+                    if handover.wants_connection():
+                        connection = handover.connect()
+                        url = url or await self._find_rtm_url()
+                        readers[connection] = self._task_group()
+                        await readers[connection].__aenter__()
+                        await readers[connection].spawn(
+                            self._rtm_connection, url, connection, queue
+                        )
+                        url = None
+
+                    connection, event = await queue.get()
+                    if connection is None:
+                        handover.refresh()
+                    elif isinstance(event, Exception):
+                        raise event
+                    elif event is None:
+                        handover.closed(connection)
+                        if connection in readers:
+                            await readers.pop(connection).__aexit__(None, None, None)
+                    elif handover.receive(connection, event):
+                        await self._stop_replaced(handover, readers)
+                        yield event
+            finally:
+                for reader in readers.values():
+                    await reader.cancel()
+                    await reader.__aexit__(None, None, None)
+
+    async def _rtm_connection(self, url: str, connection: int, queue: Any) -> None:
+        """
+        Read a RTM connection until it is closed by slack or cancelled
+
+        The end of the connection is signaled with a `None` event, or with the exception that ended it.
+        """
+        try:
+            async for data in self._rtm(url):
+                event = events.Event.from_rtm(data, self._codec, self._lazy_events)
+                await queue.put((connection, event))
+        except Exception as exc:
+            await queue.put((connection, exc))
+        else:
+            await queue.put((connection, None))
+
+    async def _stop_replaced(self, handover: Handover, readers: Dict[int, Any]) -> None:
+        """
+        Cancel the readers of the connections replaced by a newer one
+        """
+        for connection in [c for c in readers if handover.stopped(c)]:
+            reader = readers.pop(connection)
+            await reader.cancel()
+            await reader.__aexit__(None, None, None)
+            handover.closed(connection)
+
+    async def _refresh_timer(self, interval: float, queue: Any) -> None:
+        while True:
+            await self.sleep(interval)
+            await queue.put((None, None))
+
+    async def warm_directory(
+        self,
+        directory: Optional[Directory] = None,
+        *,
+        channel_types: str = "public_channel,private_channel",
+        limit: int = 200,
+    ) -> Directory:
+        """
+        Load the users and channels of the workspace in a :class:`slack.directory.Directory`
+
+        Args:
+            directory: Directory to update (default to a new one)
+            channel_types: `types` of conversations loaded from `conversations.list`
+            limit: Maximum number of results to return per call.
+
+        Returns:
+            The updated directory
+        """
+        if directory is None:
+            directory = Directory()
+
+        async for user in self.iter(methods.USERS_LIST, limit=limit):
+            directory.add_users((user,))
+
+        data = {"types": channel_types}
+        async for channel in self.iter(methods.CONVERSATIONS_LIST, data, limit=limit):
+            directory.add_channels((channel,))
+
+        return directory
+
     async def _find_bot_id(self) -> str:
         """
         Find the bot ID to discard incoming message from the bot itself.
@@ -176,12 +1205,36 @@ class SlackAPI:
         Returns:
             The bot ID
         """
+        cached = self._cached_bot_id()
+        if cached:
+            return cached
+
         auth = await self.query(methods.AUTH_TEST)
         user_info = await self.query(methods.USERS_INFO, {"user": auth["user_id"]})
         bot_id = user_info["user"]["profile"]["bot_id"]
         LOG.info("BOT_ID is %s", bot_id)
+        self._cache_bot_id(auth["user_id"], bot_id)
         return bot_id
 
+    def _cached_bot_id(self) -> Optional[str]:
+        """
+        Bot ID of the bootstrap cache, `None` when it is not cached
+        """
+        if self._bootstrap_cache is None:
+            return None
+
+        bootstrap = self._bootstrap_cache.get(cache.bootstrap_key(self._token))
+        if bootstrap is None:
+            return None
+        LOG.debug("BOT_ID %s loaded from the bootstrap cache", bootstrap["bot_id"])
+        return bootstrap["bot_id"]
+
+    def _cache_bot_id(self, user_id: str, bot_id: str) -> None:
+        if self._bootstrap_cache is not None:
+            self._bootstrap_cache.set(
+                cache.bootstrap_key(self._token), {"user_id": user_id, "bot_id": bot_id}
+            )
+
     async def _find_rtm_url(self) -> str:
         """
         Call `rtm.connect` to find the websocket url.
@@ -203,7 +1256,7 @@ class SlackAPI:
         :return: Incoming events
         """
         async for data in self._rtm(url):
-            event = events.Event.from_rtm(json.loads(data))
+            event = events.Event.from_rtm(data, self._codec, self._lazy_events)
             if sansio.need_reconnect(event):
                 break
             elif sansio.discard_event(event, bot_id):
@@ -1,9 +1,9 @@
 import asyncio
-from typing import Tuple, Union, Optional, AsyncIterator, MutableMapping
+from typing import Any, Tuple, Union, Callable, Optional, AsyncIterator, MutableMapping
 
 import aiohttp
 
-from . import abc
+from . import abc, _asyncio
 
 
 class SlackAPI(abc.SlackAPI):
@@ -30,6 +30,20 @@ class SlackAPI(abc.SlackAPI):
         ) as response:
             return response.status, await response.read(), response.headers
 
+    async def _request_chunks(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[MutableMapping],
+        body: Optional[Union[str, MutableMapping]],
+    ) -> AsyncIterator[Any]:
+        async with self._session.request(
+            method, url, headers=headers, data=body
+        ) as response:
+            yield response.status, response.headers
+            async for chunk in response.content.iter_any():
+                yield chunk
+
     async def _rtm(self, url: str) -> AsyncIterator[str]:
 
         async with self._session.ws_connect(url) as ws:
@@ -43,3 +57,15 @@ class SlackAPI(abc.SlackAPI):
 
     async def sleep(self, seconds: Union[int, float]) -> None:
         await asyncio.sleep(seconds)
+
+    async def _timeout(self, seconds: float, function: Callable, *args: Any) -> Any:
+        return await _asyncio.timeout(seconds, function, *args)
+
+    def _task_group(self) -> _asyncio.TaskGroup:
+        return _asyncio.TaskGroup()
+
+    def _queue(self, maxsize: int = 0) -> asyncio.Queue:
+        return asyncio.Queue(maxsize)
+
+    def _event(self) -> _asyncio.Event:
+        return _asyncio.Event()
@@ -1,4 +1,4 @@
-from typing import Tuple, Union, Optional, AsyncIterator, MutableMapping
+from typing import Any, Tuple, Union, Callable, Optional, AsyncIterator, MutableMapping
 
 import asks
 import curio
@@ -6,6 +6,11 @@ import curio
 from . import abc
 
 
+class _TaskGroup(curio.TaskGroup):
+    async def cancel(self) -> None:
+        await self.cancel_remaining()
+
+
 class SlackAPI(abc.SlackAPI):
     """
     `asks curio` implementation of :class:`slack.io.abc.SlackAPI`
@@ -29,6 +34,21 @@ class SlackAPI(abc.SlackAPI):
         response = await self._session.request(method, url, headers=headers, data=body)
         return response.status_code, response.content, response.headers
 
+    async def _request_chunks(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[MutableMapping],
+        body: Optional[Union[str, MutableMapping]],
+    ) -> AsyncIterator[Any]:
+        response = await self._session.request(
+            method, url, headers=headers, data=body, stream=True
+        )
+        yield response.status_code, response.headers
+        async with response.body:
+            async for chunk in response.body:
+                yield chunk
+
     async def rtm(self, url=None, bot_id=None):
         raise NotImplementedError
 
@@ -38,3 +58,18 @@ class SlackAPI(abc.SlackAPI):
 
     async def sleep(self, seconds: float) -> None:
         await curio.sleep(seconds)
+
+    async def _timeout(self, seconds: float, function: Callable, *args: Any) -> Any:
+        try:
+            return await curio.timeout_after(seconds, function, *args)
+        except curio.TaskTimeout:
+            raise TimeoutError(f"Timed out after {seconds}s") from None
+
+    def _task_group(self) -> _TaskGroup:
+        return _TaskGroup()
+
+    def _queue(self, maxsize: int = 0) -> curio.Queue:
+        return curio.Queue(maxsize)
+
+    def _event(self) -> curio.Event:
+        return curio.Event()
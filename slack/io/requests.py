@@ -1,29 +1,561 @@
-import json
 import time
+import queue
+import socket
 import logging
-from typing import Tuple, Union, Iterator, Optional, MutableMapping
+import functools
+import selectors
+import threading
+import collections
+from typing import (
+    Any,
+    Dict,
+    List,
+    Deque,
+    Tuple,
+    Union,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    MutableMapping,
+)
+from concurrent import futures
 
+import urllib3
 import requests
 import websocket
+import requests.adapters
 
 from . import abc
-from .. import events, sansio, methods, exceptions
+from .. import events, sansio, stream, methods, checkpoint, exceptions
+from ..codec import DEFAULT as DEFAULT_CODEC
+from ..codec import JSONCodec
+from ..harvest import Scheduler, HarvestItem, ChannelProgress
+from ..handover import Handover
+from ..directory import Directory
 
 LOG = logging.getLogger(__name__)
 
+_EXHAUSTED = object()
+_POLL_INTERVAL = 0.1
+_READ_TIMEOUT = 0.001
+_CHUNK_SIZE = 64 * 1024
+
+PoolStats = collections.namedtuple(
+    "PoolStats",
+    ("scheme", "host", "port", "maxsize", "in_use", "num_connections", "num_requests"),
+)
+"""
+Usage statistics of a connection pool returned by :meth:`SlackAPI.pool_stats() <slack.io.requests.SlackAPI.pool_stats>`.
+
+`in_use` is the number of connections currently checked out of the pool, `num_connections` and `num_requests` the
+total number of connections opened and requests made by the pool.
+"""
+
+
+class _PagePipe:
+    """
+    Bounded hand-off of pages from worker threads to a consumer
+    """
+
+    def __init__(self, buffer: int) -> None:
+        self._queue: queue.Queue = queue.Queue(buffer)
+        self._stopped = threading.Event()
+
+    def put(self, item: Any) -> bool:
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=_POLL_INTERVAL)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def get(self) -> Any:
+        return self._queue.get()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def feed(self, index: int, iteration: Iterator[abc._Page]) -> None:
+        """
+        Put the pages of `iteration` in the pipe followed by an end (or exception) marker
+        """
+        try:
+            for page in iteration:
+                if not self.put((index, page)):
+                    return
+        except Exception as exc:
+            self.put((index, exc))
+        else:
+            self.put((index, _EXHAUSTED))
+
+
+class _HTTPAdapter(requests.adapters.HTTPAdapter):
+    """
+    :class:`requests.adapters.HTTPAdapter` passing custom socket options to its connection pools
+    """
+
+    def __init__(self, *, socket_options: Optional[List[Any]] = None, **kwargs):
+        self._socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self._socket_options is not None:
+            kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+def create_session(
+    *,
+    pool_maxsize: int = 10,
+    pool_block: bool = False,
+    max_retries: Union[int, urllib3.Retry] = 0,
+    tcp_keepalive: Optional[int] = None,
+) -> requests.Session:
+    """
+    Create a :class:`requests.Session` with a tuned connection pool for the slack API
+
+    When sharing a client between threads `pool_maxsize` should be at least the number of threads and `pool_block`
+    enabled so that threads wait for a free connection instead of opening (and discarding) extra ones.
+
+    Args:
+        pool_maxsize: Maximum number of connections kept open per host
+        pool_block: Block when no connection is available instead of opening a new one
+        max_retries: Number of retries or :class:`urllib3.Retry` configuration for failed connections
+        tcp_keepalive: Enable TCP keep-alive probes after this many seconds of inactivity (default to disabled)
+
+    Returns:
+        :class:`requests.Session`
+    """
+    socket_options: Optional[List[Any]] = None
+    if tcp_keepalive:
+        socket_options = [
+            *urllib3.connection.HTTPConnection.default_socket_options,
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            socket_options.append(
+                (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, tcp_keepalive)
+            )
+
+    session = requests.Session()
+    for prefix in ("https://", "http://"):
+        session.mount(
+            prefix,
+            _HTTPAdapter(
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                max_retries=max_retries,
+                socket_options=socket_options,
+            ),
+        )
+    return session
+
+
+def _timeout_until(deadline: Optional[float]) -> Optional[float]:
+    if deadline is None:
+        return None
+    return max(0, deadline - time.monotonic())
+
+
+class RTMConnection:
+    """
+    Websocket connection served by a :class:`slack.io.requests.RTMEngine`
+
+    Attributes:
+        url: Websocket url
+        frames: Queue receiving ``(connection, frame)`` tuples, the frame is `None` once the connection is closed
+        codec: :class:`slack.codec.JSONCodec` of the RTM `ping` and `pong`
+    """
+
+    def __init__(
+        self, ws: Any, url: str, frames: queue.Queue, codec: JSONCodec = DEFAULT_CODEC
+    ) -> None:
+        self.ws = ws
+        self.url = url
+        self.frames = frames
+        self.codec = codec
+        self.last_received = time.monotonic()
+        self.ping_sent: Optional[float] = None
+        self.ping_id = 0
+        self.closing = False
+        self.released = False
+        self.disconnected = False
+        self.backlog: Deque[Optional[str]] = collections.deque()
+
+    def __repr__(self) -> str:
+        return f"<RTMConnection {self.url}{' closing' if self.closing else ''}>"
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Frames of the connection until it is closed, when its queue is not shared
+        """
+        while True:
+            _, frame = self.frames.get()
+            if frame is None:
+                return
+            yield frame
+
+
+class RTMEngine:
+    """
+    Synchronous RTM engine reading websocket connections from a single background thread
+
+    The sockets of all the connections are watched with :mod:`selectors`, frames are put in bounded queues as soon as
+    they are received. Sockets are read with a very short timeout: a partially received frame stays buffered by its
+    websocket until the rest of it arrives, without blocking the other connections. When the queue of a connection is full its frames are parked and its socket is no longer read
+    until the consumer catches up, without delaying the other connections. Idle connections are sent a RTM `ping` and
+    closed when they don't answer. The thread is started with the first connection and stops once all the connections
+    are closed.
+
+    An engine can be shared by multiple clients (e.g. one per workspace) to serve all their connections from one
+    thread.
+
+    Args:
+        buffer: Maximum number of frames waiting in the queue of a connection
+        ping_interval: Time (in seconds) without frame after which a `ping` is sent
+        ping_timeout: Time (in seconds) to wait for an answer to a `ping` before closing the connection
+        poll_interval: Maximum time (in seconds) between two keepalive checks
+    """
+
+    def __init__(
+        self,
+        *,
+        buffer: int = 1000,
+        ping_interval: float = 30,
+        ping_timeout: float = 10,
+        poll_interval: float = 1,
+    ) -> None:
+        self.buffer = buffer
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.poll_interval = poll_interval
+        self._connections: List[RTMConnection] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._wakeup_receive: Optional[socket.socket] = None
+        self._wakeup_send: Optional[socket.socket] = None
+
+    def __len__(self) -> int:
+        return len(self._connections)
+
+    def connect(
+        self,
+        url: str,
+        frames: Optional[queue.Queue] = None,
+        codec: JSONCodec = DEFAULT_CODEC,
+    ) -> RTMConnection:
+        """
+        Open a websocket connection
+
+        Args:
+            url: Websocket url
+            frames: Queue shared with other connections (default to a new bounded queue)
+            codec: :class:`slack.codec.JSONCodec` of the RTM `ping` and `pong`
+
+        Returns:
+            The connection
+        """
+        ws = websocket.create_connection(url, timeout=self.ping_timeout)
+        return self.add(ws, url, frames, codec)
+
+    def add(
+        self,
+        ws: Any,
+        url: str = "",
+        frames: Optional[queue.Queue] = None,
+        codec: JSONCodec = DEFAULT_CODEC,
+    ) -> RTMConnection:
+        """
+        Serve an open :class:`websocket.WebSocket`
+
+        Args:
+            ws: Websocket
+            url: Websocket url
+            frames: Queue shared with other connections (default to a new bounded queue)
+            codec: :class:`slack.codec.JSONCodec` of the RTM `ping` and `pong`
+
+        Returns:
+            The connection
+        """
+        ws.settimeout(_READ_TIMEOUT)
+        connection = RTMConnection(ws, url, frames or queue.Queue(self.buffer), codec)
+        with self._lock:
+            self._connections.append(connection)
+            if self._wakeup_send is None:
+                self._wakeup_receive, self._wakeup_send = socket.socketpair()
+                self._wakeup_send.setblocking(False)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="slack-rtm", daemon=True
+                )
+                self._thread.start()
+        self._wakeup()
+        return connection
+
+    def close(self, connection: RTMConnection) -> None:
+        """
+        Close a connection no longer consumed
+
+        Frames not yet queued are dropped and the closing marker is only queued if there is room for it.
+        """
+        connection.closing = True
+        connection.released = True
+        self._wakeup()
+
+    def stop(self) -> None:
+        """
+        Close all the connections
+        """
+        for connection in list(self._connections):
+            self.close(connection)
+
+    def _wakeup(self) -> None:
+        try:
+            self._wakeup_send.send(b"\0")  # type: ignore
+        except BlockingIOError:
+            pass
+
+    def _run(self) -> None:
+        """
+        Reader thread
+        """
+        selector = selectors.DefaultSelector()
+        selector.register(self._wakeup_receive, selectors.EVENT_READ)  # type: ignore
+        registered: List[RTMConnection] = []
+        try:
+            timeout = self._serve(selector, registered)
+            while timeout is not None:
+                for key, _ in selector.select(timeout):
+                    if key.data is None:
+                        self._wakeup_receive.recv(4096)  # type: ignore
+                    else:
+                        self._read(key.data)
+                self._keepalive(time.monotonic())
+                timeout = self._serve(selector, registered)
+        except Exception:
+            LOG.exception("RTM engine failed, closing its connections")
+            for connection in list(self._connections):
+                connection.released = True
+                self._disconnect(connection)
+            with self._lock:
+                self._thread = None
+        finally:
+            selector.close()
+
+    def _serve(
+        self, selector: selectors.BaseSelector, registered: List
+    ) -> Optional[float]:
+        """
+        Flush the parked frames and synchronize the selector with the connections
+
+        Only the open connections without parked frames are watched.
+
+        Returns:
+            The select timeout, `None` once all the connections are closed
+        """
+        with self._lock:
+            connections = list(self._connections)
+
+        timeout = self.poll_interval
+        for connection in connections:
+            self._flush(connection)
+            watch = not connection.closing and not connection.backlog
+            if watch and connection not in registered:
+                selector.register(connection.ws.sock, selectors.EVENT_READ, connection)
+                registered.append(connection)
+            elif not watch and connection in registered:
+                selector.unregister(connection.ws.sock)
+                registered.remove(connection)
+
+            if connection.closing:
+                self._disconnect(connection)
+            if connection.backlog:
+                timeout = min(timeout, _POLL_INTERVAL)
+
+        with self._lock:
+            if not self._connections:
+                self._thread = None
+                return None
+        return timeout
+
+    def _read(self, connection: RTMConnection) -> None:
+        """
+        Read the frames of a readable connection, including the ones already buffered by the websocket
+
+        Control frames are returned by the websocket as soon as they are received (pings are answered by it), so a
+        lone control frame doesn't block the thread waiting for a data frame. A read timing out leaves the partially
+        received frame in the websocket buffer, it is completed once the socket is readable again.
+        """
+        while not connection.closing:
+            try:
+                opcode, frame = connection.ws.recv_data_frame(control_frame=True)
+            except websocket.WebSocketTimeoutException:
+                return
+            except (websocket.WebSocketException, OSError) as exc:
+                LOG.debug("RTM connection %s closed: %s", connection.url, exc)
+                connection.closing = True
+                return
+
+            connection.last_received = time.monotonic()
+            connection.ping_sent = None
+            if opcode == websocket.ABNF.OPCODE_CLOSE:
+                connection.closing = True
+                return
+            elif opcode == websocket.ABNF.OPCODE_TEXT:
+                data = frame.data.decode("utf-8")
+                if not self._is_pong(connection, data):
+                    self._put(connection, data)
+
+            if not _buffered(connection.ws):
+                return
+
+    def _put(self, connection: RTMConnection, frame: Optional[str]) -> None:
+        """
+        Queue a frame without blocking, parking it when the queue is full
+        """
+        if not connection.backlog:
+            try:
+                connection.frames.put_nowait((connection, frame))
+                return
+            except queue.Full:
+                pass
+
+        if not connection.released:
+            connection.backlog.append(frame)
+
+    def _flush(self, connection: RTMConnection) -> None:
+        """
+        Queue the parked frames of a connection while there is room for them
+        """
+        if connection.released:
+            connection.backlog.clear()
+        elif not connection.backlog:
+            return
+
+        while connection.backlog:
+            try:
+                connection.frames.put_nowait((connection, connection.backlog[0]))
+            except queue.Full:
+                return
+            connection.backlog.popleft()
+
+        # the socket was not read while parked
+        connection.last_received = time.monotonic()
+        connection.ping_sent = None
+
+    @staticmethod
+    def _is_pong(connection: RTMConnection, frame: str) -> bool:
+        if connection.ping_id == 0 or '"pong"' not in frame:
+            return False
+        event = connection.codec.loads(frame)
+        return (
+            event.get("type") == "pong" and event.get("reply_to") == connection.ping_id
+        )
+
+    def _keepalive(self, now: float) -> None:
+        for connection in list(self._connections):
+            if connection.closing or connection.backlog:
+                continue
+            elif connection.ping_sent is not None:
+                if now - connection.ping_sent > self.ping_timeout:
+                    LOG.info("RTM connection %s timed out", connection.url)
+                    connection.closing = True
+            elif now - connection.last_received > self.ping_interval:
+                self._ping(connection, now)
+
+    def _ping(self, connection: RTMConnection, now: float) -> None:
+        connection.ping_id += 1
+        connection.ping_sent = now
+        try:
+            connection.ws.send(
+                connection.codec.dumps({"id": connection.ping_id, "type": "ping"})
+            )
+        except (websocket.WebSocketException, OSError):
+            connection.closing = True
+
+    def _disconnect(self, connection: RTMConnection) -> None:
+        """
+        Close the websocket and queue the closing marker, the connection is forgotten once its frames are queued
+        """
+        if not connection.disconnected:
+            connection.disconnected = True
+            try:
+                connection.ws.close(timeout=0)
+            except (websocket.WebSocketException, OSError):
+                pass
+            self._put(connection, None)
+
+        if connection.released or not connection.backlog:
+            with self._lock:
+                if connection in self._connections:
+                    self._connections.remove(connection)
+
+
+def _buffered(ws: Any) -> bool:
+    """
+    Check if frames were already read from the socket (by the websocket or the SSL layer)
+    """
+    pending = getattr(ws.sock, "pending", None)
+    if pending is not None and pending():
+        return True
+    return any(getattr(ws.frame_buffer, "recv_buffer", ()))
+
 
 class SlackAPI(abc.SlackAPI):
     """
     `requests` implementation of :class:`slack.io.abc.SlackAPI`
 
+    The client can be shared between threads. See :func:`slack.io.requests.create_session` to size the connection pool
+    accordingly.
+
     Args:
-        session: HTTP session
+        session: HTTP session (default to :func:`slack.io.requests.create_session`)
+        rtm_engine: :class:`slack.io.requests.RTMEngine` serving the RTM connections, can be shared between clients
+         (default to an engine of the client)
     """
 
-    def __init__(self, *, session: Optional[requests.Session] = None, **kwargs) -> None:
-        self._session = session or requests.session()
+    def __init__(
+        self,
+        *,
+        session: Optional[requests.Session] = None,
+        rtm_engine: Optional[RTMEngine] = None,
+        **kwargs,
+    ) -> None:
+        self._session = session or create_session()
+        self._rtm_engine = RTMEngine() if rtm_engine is None else rtm_engine
         super().__init__(**kwargs)
 
+    def pool_stats(self) -> List[PoolStats]:
+        """
+        Usage statistics of the session connection pools
+
+        Returns:
+            List of :data:`PoolStats <slack.io.requests.PoolStats>`, one per host
+        """
+        stats = []
+        for adapter in self._session.adapters.values():
+            manager = getattr(adapter, "poolmanager", None)
+            if manager is None:
+                continue
+            for key in manager.pools.keys():
+                pool = manager.pools.get(key)
+                if pool is None:
+                    continue
+                stats.append(
+                    PoolStats(
+                        pool.scheme,
+                        pool.host,
+                        pool.port,
+                        pool.pool.maxsize,
+                        pool.pool.maxsize - pool.pool.qsize(),
+                        pool.num_connections,
+                        pool.num_requests,
+                    )
+                )
+        return stats
+
     def _request(  # type: ignore
         self,
         method: str,
@@ -37,15 +569,26 @@ class SlackAPI(abc.SlackAPI):
         )
         return response.status_code, response.content, response.headers
 
-    def _rtm(self, url: str) -> Iterator[str]:  # type: ignore
+    def _request_chunks(  # type: ignore
+        self,
+        method: str,
+        url: str,
+        headers: Optional[MutableMapping],
+        body: Optional[Union[str, MutableMapping]],
+    ) -> Iterator[Any]:
 
-        ws = websocket.create_connection(url)
-        while True:
-            event = ws.recv()
-            if event:
-                yield event
-            else:
-                self.sleep(0.5)
+        with self._session.request(  # type: ignore
+            method, url, headers=headers, data=body, stream=True
+        ) as response:
+            yield response.status_code, response.headers
+            yield from response.iter_content(_CHUNK_SIZE)
+
+    def _rtm(self, url: str) -> Iterator[str]:  # type: ignore
+        connection = self._rtm_engine.connect(url, codec=self._codec)
+        try:
+            yield from connection
+        finally:
+            self._rtm_engine.close(connection)
 
     def sleep(self, seconds: Union[int, float]) -> None:  # type: ignore
         time.sleep(seconds)
@@ -55,13 +598,69 @@ class SlackAPI(abc.SlackAPI):
         url: str,
         body: Optional[Union[str, MutableMapping]],
         headers: Optional[MutableMapping],
+        single_query: Optional[Callable] = None,
+    ) -> Any:
+
+        single_query = single_query or self._make_single_query
+        attempt = 1
+        while True:
+            try:
+                return single_query(url, body, headers)
+            except exceptions.HTTPException as exc:
+                if not self._retry_policy:
+                    raise
+                delay = self._retry_policy.delay(attempt, exc)
+                if delay is None:
+                    raise
+                LOG.warning("Attempt %s to %s failed (%s)", attempt, url, exc)
+                self.sleep(delay)
+                attempt += 1
+
+    def _make_single_query(  # type: ignore
+        self,
+        url: str,
+        body: Optional[Union[str, MutableMapping]],
+        headers: Optional[MutableMapping],
     ) -> dict:
 
+        self._rate_limit(url)
+
         status, rep_body, rep_headers = self._request("POST", url, headers, body)
 
-        response_data = sansio.decode_response(status, rep_headers, rep_body)
+        response_data = sansio.decode_response(
+            status, rep_headers, rep_body, self._codec
+        )
         return response_data
 
+    def _open_stream(  # type: ignore
+        self,
+        url: str,
+        body: Optional[Union[str, MutableMapping]],
+        headers: Optional[MutableMapping],
+    ) -> Tuple[Iterator[Any], MutableMapping]:
+
+        self._rate_limit(url)
+
+        response = self._request_chunks("POST", url, headers, body)
+        status, rep_headers = next(response)
+        content_type, encoding = sansio.parse_content_type(rep_headers)
+        if (
+            status == 200
+            and content_type == "application/json"
+            and encoding.lower() in ("utf-8", "utf8")
+        ):
+            return response, rep_headers
+
+        rep_body = b"".join(response)
+        sansio.decode_response(status, rep_headers, rep_body, self._codec)
+        raise ValueError(f"Can not stream response from {url}: {content_type}")
+
+    def _rate_limit(self, url: str) -> None:  # type: ignore
+        if self._rate_limiter:
+            delay = self._rate_limiter.reserve(url, self._token)
+            if delay:
+                self.sleep(delay)
+
     def query(  # type: ignore
         self,
         url: Union[str, methods],
@@ -72,7 +671,8 @@ class SlackAPI(abc.SlackAPI):
         """
         Query the slack API
 
-        When using :class:`slack.methods` the request is made `as_json` if available
+        When using :class:`slack.methods` the request is made `as_json` if available. When the client has a cache
+        the responses of `cacheable` methods are served from it.
 
         Args:
             url: :class:`slack.methods` or url string
@@ -83,14 +683,89 @@ class SlackAPI(abc.SlackAPI):
             dictionary of slack API response data
 
         """
-        url, body, headers = sansio.prepare_request(
+        key = self._cache_key(url, data)
+        if key:
+            response = self._cache.get(key)  # type: ignore
+            if response is not None:
+                return response
+
+        real_url, body, headers = sansio.prepare_request(
             url=url,
             data=data,
             headers=headers,
+            as_json=as_json,
             global_headers=self._headers,
             token=self._token,
+            codec=self._codec,
         )
-        return self._make_query(url, body, headers)
+        response = self._make_query(real_url, body, headers)
+        if key:
+            self._cache.set(key, response)  # type: ignore
+        return response
+
+    def query_many(  # type: ignore
+        self,
+        queries: Iterable[Tuple[Union[str, methods], Optional[MutableMapping]]],
+        headers: Optional[MutableMapping] = None,
+        *,
+        concurrency: int = 10,
+        ordered: bool = True,
+        as_json: Optional[bool] = None,
+    ) -> Iterator[abc.QueryResult]:
+        """
+        Query the slack API for each (url, data) pair with at most `concurrency` requests in flight
+
+        The queries are made in a pool of `concurrency` threads. Errors do not interrupt the other queries, they are
+        returned in the `error` attribute of the :data:`QueryResult <slack.io.abc.QueryResult>`.
+
+        Args:
+            queries: Iterable of (:class:`slack.methods` or url string, JSON encodable MutableMapping)
+            headers: Custom headers for all the queries
+            concurrency: Maximum number of concurrent requests
+            ordered: Yield the results in submission order instead of completion order
+            as_json: Post JSON to the slack API
+        Returns:
+            Iterator over :data:`QueryResult <slack.io.abc.QueryResult>`
+        """
+
+        def query(index, url, data):
+            try:
+                response = self.query(url, data, headers, as_json)
+            except Exception as exc:
+                return abc.QueryResult(index, url, data, None, exc)
+            else:
+                return abc.QueryResult(index, url, data, response, None)
+
+        pending = enumerate(queries)
+        in_flight: Deque[futures.Future] = collections.deque()
+        with futures.ThreadPoolExecutor(concurrency) as executor:
+            try:
+                for index, (url, data) in pending:
+                    in_flight.append(executor.submit(query, index, url, data))
+                    if len(in_flight) < concurrency:
+                        continue
+                    yield from self._pop_completed(in_flight, ordered)
+
+                while in_flight:
+                    yield from self._pop_completed(in_flight, ordered)
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+    @staticmethod
+    def _pop_completed(
+        in_flight: Deque[futures.Future], ordered: bool
+    ) -> Iterator[abc.QueryResult]:
+        """
+        Wait for the oldest (`ordered`) or the first completed future and pop it from `in_flight`.
+        """
+        if ordered:
+            yield in_flight.popleft().result()
+        else:
+            done, _ = futures.wait(in_flight, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                in_flight.remove(future)
+                yield future.result()
 
     def iter(  # type: ignore
         self,
@@ -102,12 +777,18 @@ class SlackAPI(abc.SlackAPI):
         iterkey: Optional[str] = None,
         itermode: Optional[str] = None,
         minimum_time: Optional[int] = None,
-        as_json: Optional[bool] = None
+        as_json: Optional[bool] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        state: Optional[checkpoint.IterState] = None,
+        store: Optional[checkpoint.AbstractCheckpointStore] = None,
     ) -> Iterator[dict]:
         """
         Iterate over a slack API method supporting pagination
 
-        When using :class:`slack.methods` the request is made `as_json` if available
+        When using :class:`slack.methods` the request is made `as_json` if available. When the client has a
+        :class:`slack.retry.RetryPolicy` a failed page is retried with the same `itervalue` and the iteration
+        resumes where it stopped.
 
         Args:
             url: :class:`slack.methods` or url string
@@ -119,25 +800,293 @@ class SlackAPI(abc.SlackAPI):
             minimum_time: Minimum elapsed time (in seconds) between two calls to the Slack API (default to 0).
              If not reached the client will sleep for the remaining time.
             as_json: Post JSON to the slack API
+            prefetch: Number of pages requested ahead of the consumer (default to 0).
+             When set the next pages are requested in a background thread while the current one is consumed.
+            stream: Decode the items of each page as the response body is received (see :mod:`slack.stream`),
+             instead of loading the whole page in memory. Can not be combined with `prefetch`.
+            state: :class:`slack.checkpoint.IterState` of the iteration to resume. When set `url`, `data`,
+             `iterkey` and `itermode` are ignored. The state is updated after each consumed page.
+            store: :class:`slack.checkpoint.AbstractCheckpointStore` where the state is saved after each consumed
+             page. Without `state` the iteration resumes from the state previously saved in the store. The state
+             is deleted from the store once the last page is consumed, so the next identical iteration starts over.
 
         Returns:
             Async iterator over `response_data[key]`
 
         """
-        itervalue = None
+        if state is None:
+            state = checkpoint.IterState(url, data, iterkey=iterkey, itermode=itermode)
+            if store:
+                state = store.load(state.key) or state
+
+        if state.done:
+            return
+
+        if stream:
+            if prefetch:
+                raise ValueError("prefetch is not supported when streaming")
+
+            yield from self._iter_stream(
+                state,
+                headers,
+                store=store,
+                limit=limit,
+                minimum_time=minimum_time,
+                as_json=as_json,
+            )
+            return
+
+        pages: Iterator[abc._Page] = self._iter_pages(
+            state.url,
+            dict(state.data),
+            headers,
+            limit=limit,
+            iterkey=state.iterkey,
+            itermode=state.itermode,
+            minimum_time=minimum_time,
+            as_json=as_json,
+            itervalue=state.itervalue,
+        )
+
+        if prefetch:
+            pages = (page for _, page in self._threaded_pages([pages], 1, prefetch))
+
+        for page, itervalue in pages:
+            yield from page
+            abc._checkpoint(state, store, itervalue)
+
+    def iter_timeline(  # type: ignore
+        self,
+        url: Union[str, methods],
+        data: Optional[MutableMapping] = None,
+        headers: Optional[MutableMapping] = None,
+        *,
+        oldest: Union[str, float],
+        latest: Optional[Union[str, float]] = None,
+        slices: int = 4,
+        prefetch: int = 1,
+        limit: int = 200,
+        iterkey: Optional[str] = None,
+        itermode: Optional[str] = None,
+        minimum_time: Optional[int] = None,
+        as_json: Optional[bool] = None,
+    ) -> Iterator[dict]:
+        """
+        Iterate over the history of a conversation, requesting disjoint time windows in a pool of threads
+
+        The time range is split in `slices` windows (see :func:`slack.sansio.split_timeline`), each iterated in its
+        own thread with the `oldest` and `latest` parameters of the history methods. Messages are yielded newest
+        first, in the same order as :meth:`iter() <slack.io.requests.SlackAPI.iter>`.
+
+        Args:
+            url: :class:`slack.methods` or url string of a history method
+            data: JSON encodable MutableMapping
+            headers:
+            oldest: Start of the time range (exclusive)
+            latest: End of the time range (exclusive) (default to now)
+            slices: Number of windows requested concurrently
+            prefetch: Number of pages buffered per window ahead of the consumer
+            limit: Maximum number of results to return per call.
+            iterkey: Key in response data to iterate over (required for url string).
+            itermode: Iteration mode (required for url string) (one of `cursor`, `page` or `timeline`)
+            minimum_time: Minimum elapsed time (in seconds) between two calls to the Slack API for a window.
+            as_json: Post JSON to the slack API
+
+        Returns:
+            Iterator over `response_data[key]`
+        """
+        windows = sansio.split_timeline(oldest, latest or time.time(), slices)
+        iterations = [
+            self._iter_pages(
+                url,
+                {**(data or {}), "oldest": window_oldest, "latest": window_latest},
+                headers,
+                limit=limit,
+                iterkey=iterkey,
+                itermode=itermode,
+                minimum_time=minimum_time,
+                as_json=as_json,
+            )
+            for window_oldest, window_latest in windows
+        ]
+
+        for page, _ in self._ordered_pages(iterations, prefetch):
+            yield from page
+
+    def iter_many(
+        self,
+        iterations: Iterable[Tuple[Union[str, methods], Optional[MutableMapping]]],
+        headers: Optional[MutableMapping] = None,
+        *,
+        concurrency: int = 4,
+        prefetch: int = 1,
+        limit: int = 200,
+        iterkey: Optional[str] = None,
+        itermode: Optional[str] = None,
+        minimum_time: Optional[int] = None,
+        as_json: Optional[bool] = None,
+    ) -> Iterator[Tuple[int, dict]]:
+        """
+        Iterate over multiple paginated slack API queries in a pool of threads
+
+        Items of one iteration are yielded in order but items of different iterations are interleaved as their pages
+        arrive. The first error raised by an iteration stops all of them.
+
+        Args:
+            iterations: Iterable of (:class:`slack.methods` or url string, JSON encodable MutableMapping)
+            headers: Custom headers for all the queries
+            concurrency: Maximum number of iterations running at the same time
+            prefetch: Number of pages buffered per running iteration
+            limit: Maximum number of results to return per call.
+            iterkey: Key in response data to iterate over (required for url string).
+            itermode: Iteration mode (required for url string) (one of `cursor`, `page` or `timeline`)
+            minimum_time: Minimum elapsed time (in seconds) between two calls to the Slack API for an iteration.
+            as_json: Post JSON to the slack API
+
+        Returns:
+            Iterator over (iteration index, item) tuples
+        """
+        pages = [
+            self._iter_pages(
+                url,
+                data,
+                headers,
+                limit=limit,
+                iterkey=iterkey,
+                itermode=itermode,
+                minimum_time=minimum_time,
+                as_json=as_json,
+            )
+            for url, data in iterations
+        ]
+
+        for index, (page, _) in self._threaded_pages(
+            pages, concurrency, concurrency * prefetch
+        ):
+            for item in page:
+                yield index, item
+
+    def harvest(  # type: ignore
+        self,
+        url: Union[str, methods],
+        channels: Iterable[str],
+        data: Optional[MutableMapping] = None,
+        headers: Optional[MutableMapping] = None,
+        *,
+        concurrency: int = 4,
+        max_active: int = 100,
+        on_progress: Optional[Callable] = None,
+        limit: int = 200,
+        iterkey: Optional[str] = None,
+        itermode: Optional[str] = None,
+        as_json: Optional[bool] = None,
+    ) -> Iterator[HarvestItem]:
+        """
+        Iterate over a slack API method supporting pagination for many channels in a pool of threads
+
+        Pages are scheduled round robin between the channels in progress (see :mod:`slack.harvest`) and requested by
+        `concurrency` threads, sharing the rate limiter of the client. The items of a channel are yielded in order,
+        items of different channels are interleaved.
+
+        A failed channel does not stop the harvest: its error is recorded in its
+        :class:`slack.harvest.ChannelProgress` and the other channels continue.
+
+        Args:
+            url: :class:`slack.methods` or url string
+            channels: Channel ids, each one is added to `data` as the `channel` parameter
+            data: JSON encodable MutableMapping
+            headers:
+            concurrency: Maximum number of requests in flight
+            max_active: Maximum number of channels in progress at the same time
+            on_progress: Called with the :class:`slack.harvest.ChannelProgress` of a channel after each page
+            limit: Maximum number of results to return per call.
+            iterkey: Key in response data to iterate over (required for url string).
+            itermode: Iteration mode (required for url string) (one of `cursor`, `page` or `timeline`)
+            as_json: Post JSON to the slack API
+
+        Returns:
+            Iterator over :data:`HarvestItem <slack.harvest.HarvestItem>`
+        """
+        scheduler = Scheduler(channels, max_active)
+        fetch = functools.partial(
+            self._harvest_page,
+            url,
+            data,
+            headers,
+            limit=limit,
+            iterkey=iterkey,
+            itermode=itermode,
+            as_json=as_json,
+        )
 
+        in_flight: Dict[futures.Future, ChannelProgress] = {}
+        with futures.ThreadPoolExecutor(concurrency) as executor:
+            try:
+                while True:
+                    while len(in_flight) < concurrency:
+                        job = scheduler.next()
+                        if job is None:
+                            break
+                        in_flight[executor.submit(fetch, job)] = job
+
+                    if not in_flight:
+                        break
+
+                    done, _ = futures.wait(
+                        in_flight, return_when=futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        progress = in_flight.pop(future)
+                        result = future.exception() or future.result()
+                        yield from abc._harvested(scheduler, progress, result)
+                        if on_progress:
+                            on_progress(progress)
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+    def _harvest_page(  # type: ignore
+        self,
+        url: Union[str, methods],
+        data: Optional[MutableMapping],
+        headers: Optional[MutableMapping],
+        progress: ChannelProgress,
+        *,
+        limit: int,
+        iterkey: Optional[str],
+        itermode: Optional[str],
+        as_json: Optional[bool],
+    ) -> abc._Page:
+        data, iterkey, _ = sansio.prepare_iter_request(
+            url,
+            {**(data or {}), "channel": progress.channel},
+            iterkey=iterkey,
+            itermode=itermode,
+            limit=limit,
+            itervalue=progress.itervalue,
+        )
+        response_data = self.query(url, data, headers, as_json)
+        return response_data[iterkey], sansio.decode_iter_request(response_data)
+
+    def _iter_pages(  # type: ignore
+        self,
+        url: Union[str, methods],
+        data: Optional[MutableMapping],
+        headers: Optional[MutableMapping],
+        *,
+        limit: int,
+        iterkey: Optional[str],
+        itermode: Optional[str],
+        minimum_time: Optional[int],
+        as_json: Optional[bool],
+        itervalue: Optional[Union[str, int]] = None,
+    ) -> Iterator[abc._Page]:
         if not data:
             data = {}
 
         last_request_time = None
         while True:
-            current_time = time.time()
-            if (
-                minimum_time
-                and last_request_time
-                and last_request_time + minimum_time > current_time
-            ):
-                self.sleep(last_request_time + minimum_time - current_time)
+            self._wait_minimum_time(last_request_time, minimum_time)
 
             data, iterkey, itermode = sansio.prepare_iter_request(
                 url,
@@ -150,26 +1099,173 @@ class SlackAPI(abc.SlackAPI):
             last_request_time = time.time()
             response_data = self.query(url, data, headers, as_json)
             itervalue = sansio.decode_iter_request(response_data)
-            for item in response_data[iterkey]:
-                yield item
+            yield response_data[iterkey], itervalue
 
             if not itervalue:
                 break
 
+    def _iter_stream(  # type: ignore
+        self,
+        state: checkpoint.IterState,
+        headers: Optional[MutableMapping],
+        *,
+        store: Optional[checkpoint.AbstractCheckpointStore],
+        limit: int,
+        minimum_time: Optional[int],
+        as_json: Optional[bool],
+    ) -> Iterator[Any]:
+        data: MutableMapping = dict(state.data)
+        last_request_time = None
+        while True:
+            self._wait_minimum_time(last_request_time, minimum_time)
+
+            data, iterkey, _ = sansio.prepare_iter_request(
+                state.url,
+                data,
+                iterkey=state.iterkey,
+                itermode=state.itermode,
+                limit=limit,
+                itervalue=state.itervalue,
+            )
+            last_request_time = time.time()
+            decoder = stream.ItemDecoder(iterkey, self._codec)
+            yield from self._stream_page(state.url, data, headers, as_json, decoder)
+
+            itervalue = sansio.decode_iter_request(decoder.document)  # type: ignore
+            abc._checkpoint(state, store, itervalue)
+            if state.done:
+                break
+
+    def _stream_page(  # type: ignore
+        self,
+        url: Union[str, methods],
+        data: Optional[MutableMapping],
+        headers: Optional[MutableMapping],
+        as_json: Optional[bool],
+        decoder: stream.ItemDecoder,
+    ) -> Iterator[Any]:
+        real_url, body, headers = sansio.prepare_request(
+            url=url,
+            data=data,
+            headers=headers,
+            global_headers=self._headers,
+            token=self._token,
+            as_json=as_json,
+            codec=self._codec,
+        )
+        chunks, rep_headers = self._make_query(
+            real_url, body, headers, self._open_stream
+        )
+        try:
+            for chunk in chunks:
+                yield from decoder.feed(chunk)
+        finally:
+            chunks.close()
+
+        sansio.raise_for_api_error(rep_headers, decoder.close())
+
+    def _wait_minimum_time(  # type: ignore
+        self, last_request_time: Optional[float], minimum_time: Optional[int]
+    ) -> None:
+        current_time = time.time()
+        if (
+            minimum_time
+            and last_request_time
+            and last_request_time + minimum_time > current_time
+        ):
+            self.sleep(last_request_time + minimum_time - current_time)
+
+    @staticmethod
+    def _threaded_pages(
+        iterations: List[Iterator[abc._Page]], concurrency: int, buffer: int
+    ) -> Iterator[Tuple[int, abc._Page]]:
+        """
+        Consume the page iterators in a pool of `concurrency` threads.
+
+        Pages are handed to the caller through a queue of `buffer` pages. Worker threads block when it is full and
+        stop as soon as the caller stops iterating.
+        """
+        pipe = _PagePipe(buffer)
+        with futures.ThreadPoolExecutor(concurrency) as executor:
+            jobs = [
+                executor.submit(pipe.feed, index, iteration)
+                for index, iteration in enumerate(iterations)
+            ]
+            try:
+                running = len(jobs)
+                while running:
+                    index, page = pipe.get()
+                    if page is _EXHAUSTED:
+                        running -= 1
+                    elif isinstance(page, Exception):
+                        raise page
+                    else:
+                        yield index, page
+            finally:
+                pipe.stop()
+                for job in jobs:
+                    job.cancel()
+
+    @staticmethod
+    def _ordered_pages(
+        iterations: List[Iterator[abc._Page]], buffer: int
+    ) -> Iterator[abc._Page]:
+        """
+        Consume each page iterator in its own thread, buffering up to `buffer` pages per iterator.
+
+        The pages of all the iterators are yielded one iterator after the other.
+        """
+        pipes = [_PagePipe(buffer) for _ in iterations]
+        with futures.ThreadPoolExecutor(len(iterations)) as executor:
+            for index, iteration in enumerate(iterations):
+                executor.submit(pipes[index].feed, index, iteration)
+            try:
+                for pipe in pipes:
+                    while True:
+                        _, page = pipe.get()
+                        if page is _EXHAUSTED:
+                            break
+                        elif isinstance(page, Exception):
+                            raise page
+                        yield page
+            finally:
+                for pipe in pipes:
+                    pipe.stop()
+
     def rtm(  # type: ignore
-        self, url: Optional[str] = None, bot_id: Optional[str] = None
+        self,
+        url: Optional[str] = None,
+        bot_id: Optional[str] = None,
+        *,
+        standby: bool = False,
+        refresh_interval: Optional[float] = None,
     ) -> Iterator[events.Event]:
         """
         Iterate over event from the RTM API
 
+        The bot id is looked up once (or loaded from the `bootstrap_cache` of the client), reconnections only call
+        `rtm.connect` as its websocket url can't be reused. The connections are read by the
+        :class:`slack.io.requests.RTMEngine` of the client.
+
+        In warm-standby mode the next connection is opened as soon as a `goodbye` or `team_migration_started` event
+        is received, and the previous one is closed once the new one said `hello`. Events received on both
+        connections are yielded once (see :class:`slack.handover.Handover`).
+
         Args:
             url: Websocket connection url
             bot_id: Connecting bot ID
+            standby: Open the next connection before the current one is closed
+            refresh_interval: Also replace the connection every `refresh_interval` seconds (implies `standby`)
 
         Returns:
             :class:`slack.events.Event` or :class:`slack.events.Message`
 
         """
+        if standby or refresh_interval:
+            bot_id = bot_id or self._find_bot_id()
+            yield from self._rtm_standby(url, bot_id, refresh_interval)
+            return
+
         while True:
             bot_id = bot_id or self._find_bot_id()
             url = url or self._find_rtm_url()
@@ -177,11 +1273,99 @@ class SlackAPI(abc.SlackAPI):
                 yield event
             url = None
 
+    def _rtm_standby(  # type: ignore
+        self, url: Optional[str], bot_id: str, refresh_interval: Optional[float]
+    ) -> Iterator[events.Event]:
+        handover = Handover(bot_id)
+        frames: queue.Queue = queue.Queue(self._rtm_engine.buffer)
+        connections: Dict[RTMConnection, int] = {}
+        refresh_at = time.monotonic() + refresh_interval if refresh_interval else None
+        try:
+            while True:
+                if handover.wants_connection():
+                    connection = self._rtm_engine.connect(
+                        url or self._find_rtm_url(), frames, self._codec
+                    )
+                    connections[connection] = handover.connect()
+                    url = None
+
+                try:
+                    connection, frame = frames.get(timeout=_timeout_until(refresh_at))
+                except queue.Empty:
+                    handover.refresh()
+                    refresh_at += refresh_interval  # type: ignore
+                    continue
+
+                event = self._standby_event(handover, connections, connection, frame)
+                if event is not None:
+                    yield event
+        finally:
+            for connection in connections:
+                self._rtm_engine.close(connection)
+
+    def _standby_event(
+        self,
+        handover: Handover,
+        connections: Dict[RTMConnection, int],
+        connection: RTMConnection,
+        frame: Optional[str],
+    ) -> Optional[events.Event]:
+        """
+        Record a frame of a standby connection, closing the replaced connections
+
+        Returns:
+            The event to yield
+        """
+        if connection not in connections:
+            return None
+        elif frame is None:
+            handover.closed(connections.pop(connection))
+            return None
+
+        event = events.Event.from_rtm(frame, self._codec, self._lazy_events)
+        deliver = handover.receive(connections[connection], event)
+        for replaced, index in list(connections.items()):
+            if handover.stopped(index):
+                self._rtm_engine.close(replaced)
+                handover.closed(connections.pop(replaced))
+        return event if deliver else None
+
+    def warm_directory(  # type: ignore
+        self,
+        directory: Optional[Directory] = None,
+        *,
+        channel_types: str = "public_channel,private_channel",
+        limit: int = 200,
+    ) -> Directory:
+        """
+        Load the users and channels of the workspace in a :class:`slack.directory.Directory`
+
+        Args:
+            directory: Directory to update (default to a new one)
+            channel_types: `types` of conversations loaded from `conversations.list`
+            limit: Maximum number of results to return per call.
+
+        Returns:
+            The updated directory
+        """
+        if directory is None:
+            directory = Directory()
+
+        directory.add_users(self.iter(methods.USERS_LIST, limit=limit))
+        data = {"types": channel_types}
+        directory.add_channels(self.iter(methods.CONVERSATIONS_LIST, data, limit=limit))
+        return directory
+
     def _find_bot_id(self) -> str:  # type: ignore
+        cached = self._cached_bot_id()
+        if cached:
+            return cached
+
         auth = self.query(methods.AUTH_TEST)
         user_info = self.query(methods.USERS_INFO, {"user": auth["user_id"]})
         bot_id = user_info["user"]["profile"]["bot_id"]
         LOG.info("BOT_ID is %s", bot_id)
+        self._cache_bot_id(auth["user_id"], bot_id)
         return bot_id
 
     def _find_rtm_url(self) -> str:  # type: ignore
@@ -192,7 +1376,7 @@ class SlackAPI(abc.SlackAPI):
         self, url: str, bot_id: str
     ) -> Iterator[events.Event]:
         for data in self._rtm(url):
-            event = events.Event.from_rtm(json.loads(data))
+            event = events.Event.from_rtm(data, self._codec, self._lazy_events)
             if sansio.need_reconnect(event):
                 break
             elif sansio.discard_event(event, bot_id):
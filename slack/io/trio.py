@@ -1,10 +1,121 @@
-from typing import Tuple, Union, Optional, AsyncIterator, MutableMapping
+import math
+from typing import (
+    Any,
+    Set,
+    List,
+    Tuple,
+    Union,
+    Callable,
+    Optional,
+    AsyncIterator,
+    MutableMapping,
+)
 
 import asks
 import trio
 
 from . import abc
 
+try:
+    from trio import lowlevel as _lowlevel
+except ImportError:  # trio < 0.15
+    from trio import hazmat as _lowlevel
+
+
+class _TaskGroup:
+    """
+    Task group running its tasks as trio system tasks
+
+    The async generators of :class:`slack.io.abc.SlackAPI` yield while their task group is open, and are finalized
+    in another task when the caller stops iterating early. A nursery is bound to the task that opened it, so the
+    tasks of the group are spawned as system tasks, each in its own cancel scope, and
+    the group can be exited from any task.
+
+    The first exception raised by a task cancels the others and is raised when exiting the group.
+    """
+
+    def __init__(self) -> None:
+        self._scopes: Set[trio.CancelScope] = set()
+        self._running = 0
+        self._done = trio.Event()
+        self._errors: List[Exception] = []
+
+    async def __aenter__(self) -> "_TaskGroup":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is not None:
+            await self.cancel()
+            return False
+
+        await self._wait()
+        if self._errors:
+            raise self._errors[0]
+        return False
+
+    async def spawn(self, function: Callable, *args: Any) -> None:
+        if not self._running:
+            self._done = trio.Event()
+        self._running += 1
+        scope = trio.CancelScope()
+        self._scopes.add(scope)
+        _lowlevel.spawn_system_task(self._run, scope, function, args)
+
+    async def cancel(self) -> None:
+        for scope in list(self._scopes):
+            scope.cancel()
+        await self._wait()
+
+    async def _wait(self) -> None:
+        while self._running:
+            await self._done.wait()
+
+    async def _run(
+        self, scope: trio.CancelScope, function: Callable, args: Tuple
+    ) -> None:
+        with scope:
+            try:
+                await function(*args)
+            except Exception as exc:
+                self._errors.append(exc)
+                for other in list(self._scopes):
+                    other.cancel()
+            finally:
+                self._scopes.discard(scope)
+                self._running -= 1
+                if not self._running:
+                    self._done.set()
+
+
+class _Queue:
+    """
+    Queue on top of a :func:`trio.open_memory_channel`
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self._send, self._receive = trio.open_memory_channel(maxsize or math.inf)
+
+    async def put(self, item: Any) -> None:
+        await self._send.send(item)
+
+    async def get(self) -> Any:
+        return await self._receive.receive()
+
+
+class _Event:
+    """
+    Event on top of a :class:`trio.Event`
+    """
+
+    def __init__(self) -> None:
+        self._event = trio.Event()
+
+    async def set(self) -> None:
+        self._event.set()
+
+    async def wait(self) -> None:
+        await self._event.wait()
+
 
 class SlackAPI(abc.SlackAPI):
     """
@@ -29,6 +140,21 @@ class SlackAPI(abc.SlackAPI):
         response = await self._session.request(method, url, headers=headers, data=body)
         return response.status_code, response.content, response.headers
 
+    async def _request_chunks(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[MutableMapping],
+        body: Optional[Union[str, MutableMapping]],
+    ) -> AsyncIterator[Any]:
+        response = await self._session.request(
+            method, url, headers=headers, data=body, stream=True
+        )
+        yield response.status_code, response.headers
+        async with response.body:
+            async for chunk in response.body:
+                yield chunk
+
     async def rtm(self, url=None, bot_id=None):
         raise NotImplementedError
 
@@ -38,3 +164,19 @@ class SlackAPI(abc.SlackAPI):
 
     async def sleep(self, seconds: float) -> None:
         await trio.sleep(seconds)
+
+    async def _timeout(self, seconds: float, function: Callable, *args: Any) -> Any:
+        try:
+            with trio.fail_after(seconds):
+                return await function(*args)
+        except trio.TooSlowError:
+            raise TimeoutError(f"Timed out after {seconds}s") from None
+
+    def _task_group(self) -> _TaskGroup:
+        return _TaskGroup()
+
+    def _queue(self, maxsize: int = 0) -> _Queue:
+        return _Queue(maxsize)
+
+    def _event(self) -> _Event:
+        return _Event()
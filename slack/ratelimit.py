@@ -0,0 +1,146 @@
+"""
+Client side rate limiting of the slack API based on the `method tiers <https://api.slack.com/docs/rate-limits>`_.
+"""
+
+import time
+import logging
+import threading
+from typing import Dict, Tuple, Union, Optional
+
+from .methods import Methods
+
+LOG = logging.getLogger(__name__)
+
+TIERS: Dict[Union[int, str], int] = {1: 1, 2: 20, 3: 50, 4: 100, "special": 60}
+"""Number of requests per minute allowed for each slack rate limit tier"""
+
+_TIERS_BY_URL: Dict[str, Union[int, str]] = {
+    item.value.url: item.value.tier for item in Methods
+}
+
+
+def find_tier(url: Union[str, Methods]) -> Optional[Union[int, str]]:
+    """
+    Find the rate limit tier of a slack API method
+
+    Args:
+        url: :class:`slack.methods` or full url string
+
+    Returns:
+        The method tier or `None` for unknown urls
+    """
+    if isinstance(url, Methods):
+        return url.value.tier
+    return _TIERS_BY_URL.get(url)
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at a constant rate
+
+    Tokens are reserved, not awaited: when the bucket is empty the reservation still succeeds and the number of
+    seconds to wait before the request can be made is returned. Concurrent callers are thus spaced out without
+    needing a lock around the request itself.
+
+    Args:
+        rate: Number of tokens added per second
+        capacity: Maximum number of tokens in the bucket (number of requests allowed in a burst)
+        now: Creation time of the bucket (default to :func:`time.monotonic`)
+    """
+
+    def __init__(self, rate: float, capacity: float = 1, now: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.timestamp = time.monotonic() if now is None else now
+
+    def reserve(self, now: Optional[float] = None) -> float:
+        """
+        Reserve one token
+
+        Args:
+            now: Current time (default to :func:`time.monotonic`)
+
+        Returns:
+            Number of seconds to wait before using the token
+        """
+        if now is None:
+            now = time.monotonic()
+
+        if now > self.timestamp:
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.timestamp) * self.rate
+            )
+            self.timestamp = now
+
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Client side rate limiter for the slack API
+
+    Each (token, method) pair get its own :class:`slack.ratelimit.TokenBucket` refilled at the rate of the method
+    tier. Optionally all the requests made with a token can be limited to a global rate. Urls not found in
+    :class:`slack.methods` (e.g. incoming webhooks) are only limited by the token rate.
+
+    The limiter is thread safe and can be shared by multiple clients.
+
+    Args:
+        tiers: Number of requests per minute allowed for each tier (default to :data:`slack.ratelimit.TIERS`)
+        burst: Number of requests allowed in a burst for each method
+        token_rate: Maximum number of requests per minute for a token across all methods (default to no limit)
+    """
+
+    def __init__(
+        self,
+        tiers: Optional[Dict[Union[int, str], int]] = None,
+        burst: int = 1,
+        token_rate: Optional[int] = None,
+    ) -> None:
+        self.tiers = {**TIERS, **(tiers or {})}
+        self.burst = burst
+        self.token_rate = token_rate
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._token_buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, url: str, token: str, now: Optional[float] = None) -> float:
+        """
+        Reserve a request to a slack API method
+
+        Args:
+            url: Full url of the request
+            token: Slack API token used for the request
+            now: Current time (default to :func:`time.monotonic`)
+
+        Returns:
+            Number of seconds to wait before making the request
+        """
+        if now is None:
+            now = time.monotonic()
+
+        tier = find_tier(url)
+        delay = 0.0
+        with self._lock:
+            if tier is not None:
+                key = (token, url)
+                if key not in self._buckets:
+                    self._buckets[key] = TokenBucket(
+                        self.tiers[tier] / 60, self.burst, now
+                    )
+                delay = self._buckets[key].reserve(now)
+
+            if self.token_rate:
+                if token not in self._token_buckets:
+                    self._token_buckets[token] = TokenBucket(
+                        self.token_rate / 60, self.burst, now
+                    )
+                delay = max(delay, self._token_buckets[token].reserve(now))
+
+        if delay:
+            LOG.debug("Rate limiting %s for %ss", url, delay)
+        return delay
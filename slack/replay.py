@@ -0,0 +1,88 @@
+"""
+Replay protection for incoming signed requests.
+
+Slack signed requests are valid for 5 minutes, a replay cache remembers the signatures seen during that window so
+duplicated requests (e.g. slack retries or replay attacks) can be rejected before being processed.
+"""
+
+import time
+import threading
+from typing import Optional
+from collections import OrderedDict
+
+
+class AbstractReplayCache:
+    """
+    Base class for replay cache backends
+
+    To share a cache between multiple workers implement :meth:`slack.replay.AbstractReplayCache.add` on top of a
+    shared store (e.g. a redis ``SET key 1 NX EXAT expires_at``).
+    """
+
+    def add(self, key: str, expires_at: float) -> bool:
+        """
+        Atomically record a key if it is not already present
+
+        Args:
+            key: Request key
+            expires_at: Unix timestamp after which the key can be forgotten
+
+        Returns:
+            `True` if the key was added, `False` if it was already present
+        """
+        raise NotImplementedError
+
+
+class ReplayCache(AbstractReplayCache):
+    """
+    Bounded in-process replay cache
+
+    Keys are kept in insertion order, expired keys are evicted from the oldest ones on each addition. When the cache
+    is full the oldest key is evicted even if it has not expired yet.
+
+    The cache is thread safe.
+
+    Args:
+        maxsize: Maximum number of keys kept in the cache
+    """
+
+    def __init__(self, maxsize: int = 10000) -> None:
+        self.maxsize = maxsize
+        self._keys: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: str, expires_at: float, now: Optional[float] = None) -> bool:
+        """
+        Atomically record a key if it is not already present
+
+        Args:
+            key: Request key
+            expires_at: Unix timestamp after which the key can be forgotten
+            now: Current time (default to :func:`time.time`)
+
+        Returns:
+            `True` if the key was added, `False` if it was already present
+        """
+        if now is None:
+            now = time.time()
+
+        with self._lock:
+            self._expire(now)
+            if self._keys.get(key, now) > now:
+                return False
+
+            self._keys[key] = expires_at
+            self._keys.move_to_end(key)
+            if len(self._keys) > self.maxsize:
+                self._keys.popitem(last=False)
+            return True
+
+    def _expire(self, now: float) -> None:
+        while self._keys:
+            key, expires_at = next(iter(self._keys.items()))
+            if expires_at > now:
+                break
+            del self._keys[key]
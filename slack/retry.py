@@ -0,0 +1,65 @@
+"""
+Retry policy for failed requests to the slack API.
+"""
+
+import random
+from typing import Tuple, Optional
+
+from . import exceptions
+
+RETRY_STATUSES = (500, 502, 503, 504)
+"""HTTP status retried with an exponential backoff"""
+
+
+class RetryPolicy:
+    """
+    Decide if and when a failed request to the slack API is retried.
+
+    Rate limited requests (:class:`slack.exceptions.RateLimited`) are retried after the exact `Retry-After` delay
+    sent by slack. Server errors are retried with a jittered exponential backoff. Any other error is raised
+    immediately.
+
+    Args:
+        max_attempts: Maximum number of attempts for a request, including the first one
+        backoff: Base delay (in seconds) of the exponential backoff
+        max_backoff: Maximum delay (in seconds) between two attempts for server errors
+        jitter: Randomize the backoff delay between 0 and its computed value
+        statuses: HTTP status retried with a backoff
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        backoff: float = 0.5,
+        max_backoff: float = 30,
+        jitter: bool = True,
+        statuses: Tuple[int, ...] = RETRY_STATUSES,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = statuses
+
+    def delay(self, attempt: int, exc: Exception) -> Optional[float]:
+        """
+        Compute the delay before the next attempt
+
+        Args:
+            attempt: Number of the failed attempt (starting at 1)
+            exc: Exception raised by the failed attempt
+
+        Returns:
+            Number of seconds to wait before retrying or `None` if the request should not be retried
+        """
+        if attempt >= self.max_attempts:
+            return None
+        elif isinstance(exc, exceptions.RateLimited):
+            return exc.retry_after
+        elif isinstance(exc, exceptions.HTTPException) and exc.status in self.statuses:
+            backoff = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+            if self.jitter:
+                return random.uniform(0, backoff)
+            return backoff
+        else:
+            return None
@@ -2,15 +2,16 @@
 Collection of functions for sending and decoding request to or from the slack API
 """
 
-import cgi
 import hmac
-import json
 import time
 import hashlib
 import logging
-from typing import Tuple, Union, Optional, MutableMapping
+import functools
+from typing import List, Tuple, Union, Iterable, Optional, MutableMapping
 
-from . import HOOK_URL, ROOT_URL, events, exceptions
+from . import HOOK_URL, ROOT_URL, events, replay, exceptions
+from .codec import DEFAULT as DEFAULT_CODEC
+from .codec import JSONCodec
 from .methods import Methods, method
 
 LOG = logging.getLogger(__name__)
@@ -24,6 +25,8 @@ SKIP_EVENTS = ("reconnect_url",)
 ITERMODE = ("cursor", "page", "timeline")
 """Supported pagination mode"""
 
+_Body = Union[str, bytes, bytearray, memoryview, Iterable[bytes]]
+
 
 def raise_for_status(
     status: int, headers: MutableMapping, data: MutableMapping
@@ -76,27 +79,34 @@ def raise_for_api_error(headers: MutableMapping, data: MutableMapping) -> None:
         LOG.warning("Slack API WARNING: %s", data["warning"])
 
 
-def decode_body(headers: MutableMapping, body: bytes) -> dict:
+def decode_body(
+    headers: MutableMapping, body: bytes, codec: Optional[JSONCodec] = None
+) -> dict:
     """
     Decode the response body
 
-    For 'application/json' content-type load the body as a dictionary
+    For 'application/json' content-type load the body as a dictionary. UTF-8 encoded bodies are handed to the codec
+    as bytes, without an intermediate decoded string.
 
     Args:
         headers: Response headers
         body: Response body
+        codec: :class:`slack.codec.JSONCodec` used to decode the body (default to :data:`slack.codec.DEFAULT`)
 
     Returns:
         decoded body
     """
-
+    codec = codec or DEFAULT_CODEC
     type_, encoding = parse_content_type(headers)
-    decoded_body = body.decode(encoding)
 
     # There is one api that just returns `ok` instead of json. In order to have a consistent API we decided to modify the returned payload into a dict.
     if type_ == "application/json":
-        payload = json.loads(decoded_body)
+        if encoding.lower() in ("utf-8", "utf8"):
+            payload = codec.loads(body)
+        else:
+            payload = codec.loads(body.decode(encoding))
     else:
+        decoded_body = body.decode(encoding)
         if decoded_body == "ok":
             payload = {"ok": True}
         else:
@@ -119,9 +129,23 @@ def parse_content_type(headers: MutableMapping) -> Tuple[Optional[str], str]:
     if not content_type:
         return None, "utf-8"
     else:
-        type_, parameters = cgi.parse_header(content_type)
-        encoding = parameters.get("charset", "utf-8")
-        return type_, encoding
+        return _parse_content_type_header(content_type)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_content_type_header(content_type: str) -> Tuple[str, str]:
+    """
+    Parse a content-type header value into its (lower cased) media type and charset.
+
+    Responses only carry a handful of distinct content-type values so the result is memoized.
+    """
+    type_, _, parameters = content_type.partition(";")
+    encoding = "utf-8"
+    for parameter in parameters.split(";"):
+        name, _, value = parameter.partition("=")
+        if name.strip().lower() == "charset":
+            encoding = value.strip().strip('"') or encoding
+    return type_.strip().lower(), encoding
 
 
 def prepare_request(
@@ -131,6 +155,7 @@ def prepare_request(
     global_headers: MutableMapping,
     token: str,
     as_json: Optional[bool] = None,
+    codec: Optional[JSONCodec] = None,
 ) -> Tuple[str, Union[str, MutableMapping], MutableMapping]:
     """
     Prepare outgoing request
@@ -144,6 +169,7 @@ def prepare_request(
         global_headers: Global headers
         token: Slack API token
         as_json: Post JSON to the slack API
+        codec: :class:`slack.codec.JSONCodec` used to encode the body (default to :data:`slack.codec.DEFAULT`)
     Returns:
         :py:class:`tuple` (url, body, headers)
     """
@@ -160,37 +186,41 @@ def prepare_request(
     else:
         headers = {**global_headers, **headers}
 
+    codec = codec or DEFAULT_CODEC
     payload: Optional[Union[str, MutableMapping]] = None
     if real_url.startswith(HOOK_URL) or (real_url.startswith(ROOT_URL) and as_json):
-        payload, headers = _prepare_json_request(data, token, headers)
+        payload, headers = _prepare_json_request(data, token, headers, codec)
     elif real_url.startswith(ROOT_URL) and not as_json:
-        payload = _prepare_form_encoded_request(data, token)
+        payload = _prepare_form_encoded_request(data, token, codec)
     else:
         real_url = ROOT_URL + real_url
-        payload = _prepare_form_encoded_request(data, token)
+        payload = _prepare_form_encoded_request(data, token, codec)
 
     return real_url, payload, headers
 
 
 def _prepare_json_request(
-    data: Optional[MutableMapping], token: str, headers: MutableMapping
+    data: Optional[MutableMapping],
+    token: str,
+    headers: MutableMapping,
+    codec: JSONCodec,
 ) -> Tuple[str, MutableMapping]:
     headers["Authorization"] = f"Bearer {token}"
     headers["Content-type"] = "application/json; charset=utf-8"
 
     if isinstance(data, events.Message):
-        payload = data.to_json()
+        payload = data.to_json(codec)
     else:
-        payload = json.dumps(data or {})
+        payload = codec.dumps(data or {})
 
     return payload, headers
 
 
 def _prepare_form_encoded_request(
-    data: Optional[MutableMapping], token: str
+    data: Optional[MutableMapping], token: str, codec: JSONCodec
 ) -> MutableMapping:
     if isinstance(data, events.Message):
-        data = data.serialize()
+        data = data.serialize(codec)
 
     if not data:
         data = {"token": token}
@@ -200,7 +230,12 @@ def _prepare_form_encoded_request(
     return data
 
 
-def decode_response(status: int, headers: MutableMapping, body: bytes) -> dict:
+def decode_response(
+    status: int,
+    headers: MutableMapping,
+    body: bytes,
+    codec: Optional[JSONCodec] = None,
+) -> dict:
     """
     Decode incoming response
 
@@ -208,11 +243,12 @@ def decode_response(status: int, headers: MutableMapping, body: bytes) -> dict:
         status: Response status
         headers: Response headers
         body: Response body
+        codec: :class:`slack.codec.JSONCodec` used to decode the body (default to :data:`slack.codec.DEFAULT`)
 
     Returns:
         Response data
     """
-    data = decode_body(headers, body)
+    data = decode_body(headers, body, codec)
     raise_for_status(status, headers, data)
     raise_for_api_error(headers, data)
 
@@ -307,12 +343,56 @@ def decode_iter_request(data: dict) -> Optional[Union[str, int]]:
 
         if current_page < max_page:
             return current_page + 1
-    elif "has_more" in data and data["has_more"] and "latest" in data:
+    elif data.get("has_more") and data.get("messages"):
         return data["messages"][-1]["ts"]
 
     return None
 
 
+def split_timeline(
+    oldest: Union[str, float], latest: Union[str, float], slices: int
+) -> List[Tuple[str, str]]:
+    """
+    Split a time range in disjoint windows to iterate over concurrently
+
+    The windows are given as (`oldest`, `latest`) exclusive bounds like the slack history methods expect them. Each
+    message timestamp of the range falls in exactly one window.
+
+    Args:
+        oldest: Start of the time range (exclusive)
+        latest: End of the time range (exclusive)
+        slices: Number of windows
+
+    Returns:
+        List of (`oldest`, `latest`) timestamps of each window, newest window first
+    """
+    start, end = _microseconds(oldest), _microseconds(latest)
+    if slices < 1 or end <= start:
+        raise ValueError("Invalid time range or number of slices")
+
+    bounds = sorted(
+        {start + (end - start) * index // slices for index in range(slices + 1)}
+    )
+    windows = []
+    for index in range(len(bounds) - 1):
+        # message timestamps have a microsecond precision so the window starts one microsecond before its bound
+        lower = bounds[index] - 1 if index else bounds[index]
+        if bounds[index + 1] - lower > 1:
+            windows.append((_timestamp(lower), _timestamp(bounds[index + 1])))
+
+    windows.reverse()
+    return windows
+
+
+def _microseconds(timestamp: Union[str, float]) -> int:
+    seconds, _, fraction = str(timestamp).partition(".")
+    return int(seconds) * 1000000 + int(fraction[:6].ljust(6, "0"))
+
+
+def _timestamp(microseconds: int) -> str:
+    return "%d.%06d" % divmod(microseconds, 1000000)
+
+
 def discard_event(event: events.Event, bot_id: str = None) -> bool:
     """
     Check if the incoming event needs to be discarded
@@ -327,7 +407,9 @@ def discard_event(event: events.Event, bot_id: str = None) -> bool:
     if event["type"] in SKIP_EVENTS:
         return True
     elif bot_id and isinstance(event, events.Message):
-        if event.get("bot_id") == bot_id:
+        if not _may_contain(event, bot_id):
+            return False
+        elif event.get("bot_id") == bot_id:
             LOG.debug("Ignoring event: %s", event)
             return True
         elif "message" in event and event["message"].get("bot_id") == bot_id:
@@ -336,6 +418,18 @@ def discard_event(event: events.Event, bot_id: str = None) -> bool:
     return False
 
 
+def _may_contain(event: events.Event, value: str) -> bool:
+    """
+    Check if the raw frame of a lazy event could contain a value, without decoding it
+    """
+    raw = getattr(event, "raw", None)
+    if raw is None:
+        return True
+    elif isinstance(raw, bytes):
+        return value.encode("utf-8") in raw
+    return value in raw
+
+
 def need_reconnect(event: events.Event) -> bool:
     """
     Check if RTM needs reconnecting
@@ -352,38 +446,123 @@ def need_reconnect(event: events.Event) -> bool:
         return False
 
 
+class SignatureValidator:
+    """
+    Validate incoming request signatures for an application signing secret.
+
+    The HMAC is keyed once with the signing secret and the ``v0:`` prefix, each validation works on a copy of it.
+    The body is fed as is to the HMAC, without being decoded or concatenated to the timestamp, so raw bytes
+    from the web framework (or an iterable of body chunks) can be validated without extra copies.
+
+    When a replay cache is provided requests already validated in the `max_age` window are rejected.
+
+    Args:
+        signing_secret: Application signing_secret
+        max_age: Maximum age (in seconds) of an incoming request
+        replay_cache: Cache of the already validated requests
+    """
+
+    def __init__(
+        self,
+        signing_secret: Union[str, bytes],
+        max_age: int = 60 * 5,
+        replay_cache: Optional[replay.AbstractReplayCache] = None,
+    ) -> None:
+        if isinstance(signing_secret, str):
+            signing_secret = signing_secret.encode("utf-8")
+        self.max_age = max_age
+        self.replay_cache = replay_cache
+        self._hmac = hmac.new(signing_secret, b"v0:", digestmod=hashlib.sha256)
+
+    def signature(self, timestamp: Union[str, bytes], body: _Body) -> str:
+        """
+        Calculate the signature of a request
+
+        Args:
+            timestamp: Value of the ``X-Slack-Request-Timestamp`` header
+            body: Raw request body, as text, bytes-like object or iterable of bytes chunks
+
+        Returns:
+            The request signature (``v0=...``)
+        """
+        digest = self._hmac.copy()
+        digest.update(
+            timestamp.encode("ascii") if isinstance(timestamp, str) else timestamp
+        )
+        digest.update(b":")
+        if isinstance(body, str):
+            digest.update(body.encode("utf-8"))
+        elif isinstance(body, (bytes, bytearray, memoryview)):
+            digest.update(body)
+        else:
+            for chunk in body:
+                digest.update(chunk)
+        return "v0=" + digest.hexdigest()
+
+    def validate(self, body: _Body, headers: MutableMapping) -> None:
+        """
+        Validate an incoming request
+
+        Args:
+            body: Raw request body, as text, bytes-like object or iterable of bytes chunks
+            headers: Request headers
+
+        Raise:
+            :class:`slack.exceptions.InvalidSlackSignature`: when provided and calculated signature do not match
+            :class:`slack.exceptions.InvalidTimestamp`: when incoming request timestamp is older than `max_age`
+            :class:`slack.exceptions.ReplayedRequest`: when the request was already validated
+        """
+        timestamp = headers["X-Slack-Request-Timestamp"]
+        request_timestamp = int(timestamp)
+
+        if (int(time.time()) - request_timestamp) > self.max_age:
+            raise exceptions.InvalidTimestamp(timestamp=request_timestamp)
+
+        slack_signature = headers["X-Slack-Signature"]
+        calculated_signature = self.signature(timestamp, body)
+
+        if not hmac.compare_digest(slack_signature, calculated_signature):
+            raise exceptions.InvalidSlackSignature(
+                slack_signature, calculated_signature
+            )
+
+        if self.replay_cache is not None and not self.replay_cache.add(
+            f"{request_timestamp}:{slack_signature}", request_timestamp + self.max_age
+        ):
+            raise exceptions.ReplayedRequest(request_timestamp, slack_signature)
+
+
+@functools.lru_cache(maxsize=8)
+def _signature_validator(
+    signing_secret: Union[str, bytes],
+    replay_cache: Optional[replay.AbstractReplayCache] = None,
+) -> SignatureValidator:
+    return SignatureValidator(signing_secret, replay_cache=replay_cache)
+
+
 def validate_request_signature(
-    body: str, headers: MutableMapping, signing_secret: str
+    body: _Body,
+    headers: MutableMapping,
+    signing_secret: Union[str, bytes],
+    replay_cache: Optional[replay.AbstractReplayCache] = None,
 ) -> None:
     """
     Validate incoming request signature using the application signing secret.
 
-    Contrary to the ``team_id`` and ``verification_token`` verification this method is not called by ``slack-sansio`` when creating object from incoming HTTP request. Because the body of the request needs to be provided as text and not decoded as json beforehand.
+    Contrary to the ``team_id`` and ``verification_token`` verification this method is not called by ``slack-sansio`` when creating object from incoming HTTP request. Because the body of the request needs to be provided raw and not decoded as json beforehand.
+
+    The body can be provided as text or, to avoid decoding it, directly as the bytes received. Validators are
+    cached per signing secret, see :class:`slack.sansio.SignatureValidator` to manage one explicitly.
 
     Args:
-        body: Raw request body
+        body: Raw request body, as text, bytes-like object or iterable of bytes chunks
         headers: Request headers
         signing_secret: Application signing_secret
+        replay_cache: Cache of the already validated requests, see :mod:`slack.replay`
 
     Raise:
         :class:`slack.exceptions.InvalidSlackSignature`: when provided and calculated signature do not match
         :class:`slack.exceptions.InvalidTimestamp`: when incoming request timestamp is more than 5 minutes old
+        :class:`slack.exceptions.ReplayedRequest`: when the request was already validated
     """
-
-    request_timestamp = int(headers["X-Slack-Request-Timestamp"])
-
-    if (int(time.time()) - request_timestamp) > (60 * 5):
-        raise exceptions.InvalidTimestamp(timestamp=request_timestamp)
-
-    slack_signature = headers["X-Slack-Signature"]
-    calculated_signature = (
-        "v0="
-        + hmac.new(
-            signing_secret.encode("utf-8"),
-            f"""v0:{headers["X-Slack-Request-Timestamp"]}:{body}""".encode("utf-8"),
-            digestmod=hashlib.sha256,
-        ).hexdigest()
-    )
-
-    if not hmac.compare_digest(slack_signature, calculated_signature):
-        raise exceptions.InvalidSlackSignature(slack_signature, calculated_signature)
+    _signature_validator(signing_secret, replay_cache).validate(body, headers)
@@ -0,0 +1,211 @@
+"""
+Incremental decoding of paginated slack API responses.
+
+A page of a paginated method is a JSON object holding a (potentially large) array of items, e.g. the `members` of
+`users.list`. :class:`slack.stream.ItemDecoder` is fed the response body chunk by chunk and returns the items of the
+array as soon as they are complete, so only the item being received is buffered instead of the whole page.
+"""
+
+import re
+from typing import Any, List, Tuple, Optional
+
+from .codec import DEFAULT as DEFAULT_CODEC
+from .codec import JSONCodec
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_STRUCTURE = re.compile(rb'[\[\]{}"]')
+_SCALAR = re.compile(rb"[^,\]}\s]+")
+
+_HEAD, _ITEMS, _TAIL = range(3)
+
+
+def _skip_whitespace(buffer: bytearray, pos: int) -> int:
+    return _WHITESPACE.match(buffer, pos).end()  # type: ignore
+
+
+def _container_end(buffer: bytearray, pos: int) -> Optional[int]:
+    """
+    Find the end of the object or array starting at `pos`, `None` if it is not complete
+    """
+    depth = 0
+    while True:
+        match = _STRUCTURE.search(buffer, pos)
+        if match is None:
+            return None
+
+        token = match.group()
+        if token == b'"':
+            string = _STRING.match(buffer, match.start())
+            if string is None:
+                return None
+            pos = string.end()
+            continue
+
+        depth += 1 if token in (b"{", b"[") else -1
+        pos = match.end()
+        if depth == 0:
+            return pos
+
+
+def _value_end(buffer: bytearray, pos: int) -> Optional[int]:
+    """
+    Find the end of the JSON value starting at `pos`, `None` if it is not complete
+    """
+    char = buffer[pos : pos + 1]
+    if char == b'"':
+        match = _STRING.match(buffer, pos)
+        return match.end() if match else None
+    elif char in (b"{", b"["):
+        return _container_end(buffer, pos)
+
+    match = _SCALAR.match(buffer, pos)
+    if match is None or match.end() == len(buffer):
+        return None
+    return match.end()
+
+
+class ItemDecoder:
+    """
+    Incremental decoder of the items of an array in a JSON object.
+
+    Each item is decoded with the codec once complete. The other members of the object are kept and decoded by
+    :meth:`close <slack.stream.ItemDecoder.close>`. The body must be UTF-8 encoded.
+
+    Args:
+        key: Key of the array in the JSON object
+        codec: :class:`slack.codec.JSONCodec` used to decode the items (default to :data:`slack.codec.DEFAULT`)
+
+    Attributes:
+        document: The decoded object once closed, holding only the last item of the array
+    """
+
+    def __init__(self, key: str, codec: Optional[JSONCodec] = None) -> None:
+        self.key = key
+        self.document: Optional[dict] = None
+        self._codec = codec or DEFAULT_CODEC
+        self._token = DEFAULT_CODEC.dumps(key).encode("utf-8")
+        self._state = _HEAD
+        self._buffer = bytearray()
+        self._pos = 0
+        self._head = bytearray()
+        self._last: List[Any] = []
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Feed a chunk of the body
+
+        Args:
+            chunk: Chunk of the body
+
+        Returns:
+            The items completed by the chunk
+        """
+        self._buffer += chunk
+        if self._state == _HEAD:
+            self._parse_head()
+
+        items: List[Any] = []
+        if self._state == _ITEMS:
+            items = self._parse_items()
+        return items
+
+    def close(self) -> dict:
+        """
+        Decode the object once the whole body was fed
+
+        Returns:
+            The decoded object with the array only holding its last item
+
+        Raises:
+            :py:exc:`ValueError`: when the body is incomplete or invalid
+        """
+        if self._state == _ITEMS:
+            raise ValueError("Incomplete JSON document")
+
+        self.document = self._codec.loads(bytes(self._head + self._buffer))
+        if self._state == _TAIL:
+            self.document[self.key] = self._last  # type: ignore
+        return self.document  # type: ignore
+
+    def _parse_head(self) -> None:
+        """
+        Parse the members of the object until the array is found
+        """
+        if self._pos == 0:
+            pos = _skip_whitespace(self._buffer, 0)
+            if pos == len(self._buffer):
+                return
+            elif self._buffer[pos : pos + 1] != b"{":
+                raise ValueError("Expected a JSON object")
+            self._pos = pos + 1
+
+        while True:
+            member = self._parse_member(self._pos)
+            if member is None:
+                return
+
+            key, pos = member
+            if key == self._token and self._buffer[pos : pos + 1] == b"[":
+                self._head = self._buffer[: pos + 1]
+                del self._buffer[: pos + 1]
+                self._state = _ITEMS
+                return
+
+            end = _value_end(self._buffer, pos)
+            if end is None:
+                return
+            self._pos = end
+
+    def _parse_member(self, pos: int) -> Optional[Tuple[bytes, int]]:
+        """
+        Parse the key of the next member of the object
+
+        Returns:
+            The raw key and the position of the value, `None` if not complete or at the end of the object
+        """
+        buffer = self._buffer
+        pos = _skip_whitespace(buffer, pos)
+        if buffer[pos : pos + 1] == b",":
+            pos = _skip_whitespace(buffer, pos + 1)
+
+        key = _STRING.match(buffer, pos)
+        if key is None:
+            return None
+
+        pos = _skip_whitespace(buffer, key.end())
+        if buffer[pos : pos + 1] != b":":
+            return None
+
+        pos = _skip_whitespace(buffer, pos + 1)
+        if pos == len(buffer):
+            return None
+        return key.group(), pos
+
+    def _parse_items(self) -> List[Any]:
+        """
+        Decode the complete items of the array and drop them from the buffer
+        """
+        items = []
+        buffer = self._buffer
+        pos = 0
+        while True:
+            pos = _skip_whitespace(buffer, pos)
+            char = buffer[pos : pos + 1]
+            if char == b",":
+                pos += 1
+                continue
+            elif char == b"]":
+                self._state = _TAIL
+                break
+
+            end = _value_end(buffer, pos) if char else None
+            if end is None:
+                break
+            items.append(self._codec.loads(bytes(buffer[pos:end])))
+            pos = end
+
+        if items:
+            self._last = items[-1:]
+        del buffer[:pos]
+        return items
@@ -1,10 +1,16 @@
 import copy
 import json
 import time
+import types
+import socket
+import asyncio
+import functools
 from unittest.mock import Mock
 
 import pytest
 import asynctest
+from slack.io import _asyncio
+from slack.codec import JSONCodec
 from slack.events import EventRouter, MessageRouter
 from slack.io.abc import SlackAPI
 from slack.actions import Router as ActionRouter
@@ -17,9 +23,28 @@ try:
 except ImportError:
     SlackAPIRequest = int  # type: ignore
 
+try:
+    import websocket
+except ImportError:
+    websocket = None
+
 TOKEN = "abcdefg"
 
 
+class RecordingCodec(JSONCodec):
+    def __init__(self):
+        self.loaded = []
+        self.dumped = []
+
+    def loads(self, data):
+        self.loaded.append(data)
+        return super().loads(data)
+
+    def dumps(self, obj):
+        self.dumped.append(obj)
+        return super().dumps(obj)
+
+
 class FakeIO(SlackAPI):
     async def _request(self, method, url, headers, body):
         pass
@@ -30,6 +55,299 @@ class FakeIO(SlackAPI):
     async def _rtm(self, url):
         pass
 
+    def _task_group(self):
+        return _asyncio.TaskGroup()
+
+    def _queue(self, maxsize=0):
+        return asyncio.Queue(maxsize)
+
+    def _event(self):
+        return _asyncio.Event()
+
+    async def _timeout(self, seconds, function, *args):
+        return await _asyncio.timeout(seconds, function, *args)
+
+
+class FakeResponses(list):
+    """
+    Responses returned in order by the fake requests of a client, recording the requests in `calls`
+
+    Args:
+        responses: List of (status, data) tuples
+        sleep: Sleep function awaited by :meth:`request`
+    """
+
+    def __init__(self, responses, sleep=asyncio.sleep):
+        super().__init__(responses)
+        self.calls = []
+        self.sleep = sleep
+
+    @classmethod
+    def pages(cls, count, sleep=asyncio.sleep):
+        """
+        Paginated `channels.list` responses, the page `index` holds the channel `{"id": index}`
+        """
+        pages = []
+        for index in range(count):
+            cursor = str(index + 1) if index + 1 < count else ""
+            data = {
+                "ok": True,
+                "channels": [{"id": index}],
+                "response_metadata": {"next_cursor": cursor},
+            }
+            pages.append((200, data))
+        return cls(pages, sleep)
+
+    def next(self, method, url, headers, body):
+        self.calls.append((method, url, headers, copy.copy(body)))
+        status, data = self.pop(0)
+        headers = {"content-type": "application/json; charset=utf-8"}
+        return status, json.dumps(data).encode(), headers
+
+    async def request(self, *request):
+        await self.sleep(0.01)
+        return self.next(*request)
+
+    async def request_chunks(self, *request):
+        status, body, headers = self.next(*request)
+        yield status, headers
+        for index in range(0, len(body), 7):
+            yield body[index : index + 7]
+
+    def request_chunks_sync(self, *request):
+        status, body, headers = self.next(*request)
+        yield status, headers
+        for index in range(0, len(body), 7):
+            yield body[index : index + 7]
+
+    def session(self):
+        """
+        HTTP session of the aiohttp client answering with the responses
+        """
+        return FakeSession(self)
+
+
+class FakeSession:
+    """
+    :class:`aiohttp.ClientSession` answering with :class:`FakeResponses`
+    """
+
+    def __init__(self, responses):
+        self.responses = responses
+
+    def request(self, method, url, headers=None, data=None):
+        return FakeHTTPResponse(self.responses, (method, url, headers, data))
+
+
+class FakeHTTPResponse:
+    """
+    :class:`aiohttp.ClientResponse` of a :class:`FakeSession`, its body is received in chunks of 7 bytes
+    """
+
+    def __init__(self, responses, request):
+        self.responses = responses
+        self.request = request
+        self.content = types.SimpleNamespace(iter_any=self._iter_any)
+
+    async def __aenter__(self):
+        await self.responses.sleep(0.01)
+        self.status, self.body, self.headers = self.responses.next(*self.request)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+    async def read(self):
+        return self.body
+
+    async def _iter_any(self):
+        for index in range(0, len(self.body), 7):
+            yield self.body[index : index + 7]
+
+
+class FakeTimeline:
+    """
+    Paginated history of messages honouring the `oldest`, `latest` and `cursor` parameters
+
+    Args:
+        count: Number of messages
+        sync: Answer the requests synchronously
+        fail_after: Timestamp of a message whose requests fail
+    """
+
+    def __init__(self, count, sync=False, fail_after=None):
+        self.timestamps = ["%d.000000" % (1000 + index) for index in range(count)]
+        self.requests = []
+        self.sync = sync
+        self.fail_after = fail_after
+
+    def respond(self, body):
+        self.requests.append(dict(body))
+        oldest = float(body.get("oldest", 0))
+        latest = float(body.get("latest", "inf"))
+        messages = [
+            {"ts": ts}
+            for ts in reversed(self.timestamps)
+            if oldest < float(ts) < latest
+        ]
+        start = int(body.get("cursor", 0))
+        limit = body.get("count", body.get("limit"))
+        page = messages[start : start + limit]
+        more = start + limit < len(messages)
+        data = {"ok": True, "messages": page, "has_more": more}
+        if "limit" in body:
+            data["response_metadata"] = {
+                "next_cursor": str(start + limit) if more else ""
+            }
+        if self.fail_after and oldest < float(self.fail_after) < latest:
+            data = {"ok": False, "error": "internal_error"}
+
+        headers = {"content-type": "application/json; charset=utf-8"}
+        return 200, json.dumps(data).encode(), headers
+
+    def request(self, method, url, headers, body):
+        if self.sync:
+            return self.respond(body)
+        return self._async_respond(body)
+
+    async def _async_respond(self, body):
+        return self.respond(body)
+
+
+class FakeConnections:
+    """
+    Fake RTM connections, the nth url opened replays the nth frames (`ts` of a message or event type)
+    """
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.urls = []
+        self.closed = {}
+
+    async def find_url(self):
+        self.urls.append(f"wss://{len(self.urls)}")
+        return self.urls[-1]
+
+    async def rtm(self, url):
+        index = int(url[len("wss://") :])
+        sent = 0
+        try:
+            for frame in self.frames[index]:
+                await asyncio.sleep(0.01)
+                sent += 1
+                if isinstance(frame, str):
+                    yield json.dumps({"type": frame})
+                else:
+                    yield json.dumps(
+                        {"type": "message", "channel": "C0", "ts": str(frame)}
+                    )
+            await asyncio.sleep(10)
+        finally:
+            self.closed[index] = sent
+
+
+class FakeStream(FakeConnections):
+    """
+    Fake RTM connections all receiving a message on each tick of a shared clock, a new connection also receives
+    the last tick before its `hello`
+    """
+
+    def __init__(self):
+        super().__init__([])
+        self.tick = 0
+
+    async def clock(self):
+        while True:
+            await asyncio.sleep(0.01)
+            self.tick += 1
+
+    async def rtm(self, url):
+        index = int(url[len("wss://") :])
+        sent = max(self.tick - 1, 0)
+        try:
+            yield json.dumps({"type": "hello"})
+            while True:
+                await asyncio.sleep(0.002)
+                while sent < self.tick:
+                    sent += 1
+                    yield json.dumps(
+                        {"type": "message", "channel": "C0", "ts": str(sent)}
+                    )
+        finally:
+            self.closed[index] = sent
+
+
+class FakeWebSocket:
+    """
+    Websocket over a socket pair, the remote end sends newline separated text frames (`PING` and `CLOSE` are sent as
+    control frames)
+    """
+
+    def __init__(self):
+        self.sock, self.remote = socket.socketpair()
+        self.frame_buffer = types.SimpleNamespace(recv_buffer=[])
+        self.sent = []
+        self.closed = False
+        self.timeout = None
+        self.opcodes = {
+            "PING": websocket.ABNF.OPCODE_PING,
+            "CLOSE": websocket.ABNF.OPCODE_CLOSE,
+        }
+
+    def push(self, *frames):
+        self.remote.sendall("".join(frame + "\n" for frame in frames).encode())
+
+    def recv_data_frame(self, control_frame=False):
+        assert control_frame
+        if not self.frame_buffer.recv_buffer:
+            data = self.sock.recv(65536)
+            if not data:
+                raise websocket.WebSocketConnectionClosedException("closed")
+            self.frame_buffer.recv_buffer = data.decode().splitlines()
+
+        line = self.frame_buffer.recv_buffer.pop(0)
+        opcode = self.opcodes.get(line, websocket.ABNF.OPCODE_TEXT)
+        data = b"" if line in self.opcodes else line.encode()
+        return opcode, websocket.ABNF(opcode=opcode, data=data)
+
+    def settimeout(self, timeout):
+        self.timeout = timeout
+
+    def send(self, data):
+        self.sent.append(data)
+
+    def close(self, timeout=3):
+        self.closed = True
+        self.sock.close()
+
+
+def _history_request(pages, method, url, headers, body):
+    page = int(body.get("cursor", 0))
+    response = {
+        "ok": True,
+        "messages": [{"channel": body["channel"], "page": page}],
+        "response_metadata": {"next_cursor": str(page + 1) if page + 1 < pages else ""},
+    }
+    time.sleep(0.001)
+    headers = {"content-type": "application/json; charset=utf-8"}
+    return 200, json.dumps(response).encode(), headers
+
+
+def _users_info_request(sleep, status):
+    async def request(method, url, headers, body):
+        user = json.loads(body)["user"] if isinstance(body, str) else body["user"]
+        request.calls.append(user)
+        await sleep(0.01)
+        response = {"ok": status == 200, "user": {"id": user}}
+        return (
+            status,
+            json.dumps(response).encode(),
+            {"content-type": "application/json"},
+        )
+
+    request.calls = []
+    return request
+
 
 @pytest.fixture(params=(data.RTMEvents.__members__,))
 def rtm_iterator(request):
@@ -203,6 +521,11 @@ def slack_message(request):
     return payload
 
 
+@pytest.fixture()
+def recording_codec():
+    return RecordingCodec()
+
+
 @pytest.fixture()
 def token():
     return copy.copy(TOKEN)
@@ -218,9 +541,9 @@ def event_router():
     return EventRouter()
 
 
-@pytest.fixture()
-def message_router():
-    return MessageRouter()
+@pytest.fixture(params=(False, True), ids=("plain", "compiled"))
+def message_router(request):
+    return MessageRouter(compiled=request.param)
 
 
 @pytest.fixture(
@@ -283,3 +606,68 @@ def slack_command(request):
 @pytest.fixture()
 def command_router():
     return CommandRouter()
+
+
+@pytest.fixture()
+def fake_responses():
+    """
+    :class:`FakeResponses`, e.g. ``fake_responses.pages(3)`` or ``fake_responses([(500, {"ok": False})])``
+    """
+    return FakeResponses
+
+
+@pytest.fixture()
+def fake_timeline():
+    return FakeTimeline
+
+
+@pytest.fixture()
+def fake_history():
+    """
+    Factory of synchronous `conversations.history` requests, each channel has `pages` pages of one message
+    """
+
+    def factory(pages):
+        return functools.partial(_history_request, pages)
+
+    return factory
+
+
+@pytest.fixture()
+def fake_users_info():
+    """
+    Factory of `users.info` requests taking some time, recording the requested users in `calls`
+    """
+
+    def factory(sleep=asyncio.sleep, status=200):
+        return _users_info_request(sleep, status)
+
+    return factory
+
+
+@pytest.fixture()
+def fake_connections():
+    return FakeConnections
+
+
+@pytest.fixture()
+def fake_stream():
+    return FakeStream()
+
+
+@pytest.fixture()
+def fake_websocket():
+    """
+    Factory of :class:`FakeWebSocket`, their sockets are closed after the test
+    """
+    pytest.importorskip("websocket")
+    websockets = []
+
+    def factory():
+        websockets.append(FakeWebSocket())
+        return websockets[-1]
+
+    yield factory
+    for ws in websockets:
+        ws.sock.close()
+        ws.remote.close()
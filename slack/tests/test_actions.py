@@ -43,6 +43,9 @@ class TestActions:
         act["callback_id"] = "foo"
         assert act["callback_id"] == "foo"
 
+    def test_slots(self, slack_action):
+        assert not hasattr(Action.from_http(slack_action), "__dict__")
+
 
 class TestActionRouter:
     def test_register(self, action_router):
@@ -0,0 +1,130 @@
+import pytest
+from slack import cache, methods
+
+
+@pytest.fixture()
+def response_cache():
+    return cache.ResponseCache(maxsize=3, ttl=10)
+
+
+@pytest.fixture()
+def file_cache(tmpdir):
+    return cache.FileResponseCache(str(tmpdir.join("cache")), ttl=10)
+
+
+class TestCacheKey:
+    @pytest.mark.parametrize(
+        "url", (methods.USERS_INFO, "users.info", "https://slack.com/api/users.info",),
+    )
+    def test_url(self, url):
+        assert cache.is_cacheable(url)
+        assert cache.cache_key(url, {"user": "U0"}, "token").startswith(
+            "https://slack.com/api/users.info#"
+        )
+        assert cache.method_prefix(url) == "https://slack.com/api/users.info#"
+
+    @pytest.mark.parametrize(
+        "url", (methods.CHAT_POST_MESSAGE, "users.list", "https://hooks.slack.com/abc")
+    )
+    def test_not_cacheable(self, url):
+        assert not cache.is_cacheable(url)
+
+    def test_normalized(self):
+        key = cache.cache_key(methods.USERS_INFO, {"user": "U0", "a": 1}, "token")
+        assert key == cache.cache_key("users.info", {"a": 1, "user": "U0"}, "token")
+        assert key != cache.cache_key(
+            methods.USERS_INFO, {"user": "U1", "a": 1}, "token"
+        )
+        assert key != cache.cache_key(
+            methods.USERS_INFO, {"user": "U0", "a": 1}, "other"
+        )
+        assert "token" not in key
+
+    def test_bootstrap_key(self):
+        key = cache.bootstrap_key("token")
+        assert key.startswith("bootstrap#")
+        assert key != cache.bootstrap_key("other")
+        assert "token" not in key
+
+
+class TestResponseCache:
+    def test_get_set(self, response_cache):
+        response_cache.set("a", {"ok": True, "user": {"id": "U0"}}, now=0)
+
+        response = response_cache.get("a", now=5)
+        assert response == {"ok": True, "user": {"id": "U0"}}
+        assert response_cache.hits == 1
+
+        response["user"]["id"] = "U1"
+        assert response_cache.get("a", now=5)["user"]["id"] == "U0"
+
+    def test_miss(self, response_cache):
+        assert response_cache.get("a", now=0) is None
+        assert response_cache.misses == 1
+
+    def test_expired(self, response_cache):
+        response_cache.set("a", {"ok": True}, now=0)
+
+        assert response_cache.get("a", now=10) is None
+        assert len(response_cache) == 0
+
+    def test_lru(self, response_cache):
+        for key in "abc":
+            response_cache.set(key, {"ok": True}, now=0)
+        response_cache.get("a", now=1)
+        response_cache.set("d", {"ok": True}, now=1)
+
+        assert response_cache.get("b", now=1) is None
+        assert response_cache.get("a", now=1) is not None
+        assert len(response_cache) == 3
+
+    def test_invalidate(self, response_cache):
+        response_cache.set("users#a", {"ok": True}, now=0)
+        response_cache.set("users#b", {"ok": True}, now=0)
+        response_cache.set("team#a", {"ok": True}, now=0)
+
+        response_cache.invalidate("users#a")
+        assert response_cache.get("users#a", now=0) is None
+        assert response_cache.get("users#b", now=0) is not None
+
+        response_cache.invalidate("users#")
+        assert len(response_cache) == 1
+
+        response_cache.invalidate()
+        assert len(response_cache) == 0
+
+
+class TestFileResponseCache:
+    def test_get_set(self, file_cache):
+        file_cache.set("a", {"ok": True, "user": {"id": "U0"}}, now=0)
+
+        assert file_cache.get("a", now=5) == {"ok": True, "user": {"id": "U0"}}
+        assert file_cache.get("b", now=5) is None
+
+    def test_shared(self, file_cache):
+        file_cache.set("a", {"ok": True}, now=0)
+
+        other = cache.FileResponseCache(file_cache.directory)
+        assert other.get("a", now=5) == {"ok": True}
+
+    def test_expired(self, file_cache, tmpdir):
+        file_cache.set("a", {"ok": True}, now=0)
+
+        assert file_cache.get("a", now=10) is None
+        assert tmpdir.join("cache").listdir() == []
+
+    def test_invalidate(self, file_cache):
+        file_cache.set("users#a", {"ok": True}, now=0)
+        file_cache.set("users#b", {"ok": True}, now=0)
+        file_cache.set("team#a", {"ok": True}, now=0)
+
+        file_cache.invalidate("users#a")
+        assert file_cache.get("users#a", now=0) is None
+        assert file_cache.get("users#b", now=0) is not None
+
+        file_cache.invalidate("users#")
+        assert file_cache.get("users#b", now=0) is None
+        assert file_cache.get("team#a", now=0) is not None
+
+        file_cache.invalidate()
+        assert file_cache.get("team#a", now=0) is None
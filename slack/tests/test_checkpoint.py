@@ -0,0 +1,85 @@
+import os
+
+import pytest
+from slack import methods, checkpoint
+
+
+@pytest.fixture()
+def store(tmpdir):
+    return checkpoint.FileCheckpointStore(str(tmpdir.join("checkpoints")))
+
+
+class TestIterState:
+    @pytest.mark.parametrize(
+        "url", (methods.CONVERSATIONS_HISTORY, "https://slack.com/api/custom")
+    )
+    def test_serialization(self, url):
+        state = checkpoint.IterState(
+            url, {"channel": "C0000"}, iterkey="messages", itervalue="abc"
+        )
+        loaded = checkpoint.IterState.from_dict(state.to_dict())
+
+        assert loaded.url == url
+        assert loaded.data == {"channel": "C0000"}
+        assert loaded.iterkey == "messages"
+        assert loaded.itermode is None
+        assert loaded.itervalue == "abc"
+        assert loaded.done is False
+        assert loaded.key == state.key
+
+    def test_data_copied(self):
+        data = {"channel": "C0000"}
+        state = checkpoint.IterState(methods.CONVERSATIONS_HISTORY, data)
+        data["cursor"] = "abc"
+
+        assert state.data == {"channel": "C0000"}
+
+    def test_key(self):
+        state = checkpoint.IterState(methods.CONVERSATIONS_HISTORY, {"channel": "C0"})
+        same = checkpoint.IterState(
+            methods.CONVERSATIONS_HISTORY, {"channel": "C0"}, itervalue="abc"
+        )
+        other = checkpoint.IterState(methods.CONVERSATIONS_HISTORY, {"channel": "C1"})
+
+        assert state.key == same.key
+        assert state.key != other.key
+
+    def test_advance(self):
+        state = checkpoint.IterState(methods.CONVERSATIONS_HISTORY)
+        state.advance("abc")
+        assert state.itervalue == "abc"
+        assert state.done is False
+
+        state.advance("")
+        assert state.itervalue is None
+        assert state.done is True
+
+
+class TestFileCheckpointStore:
+    def test_save_load(self, store):
+        state = checkpoint.IterState(methods.USERS_LIST, itervalue="abc")
+        store.save(state)
+
+        loaded = store.load(state.key)
+        assert loaded.to_dict() == state.to_dict()
+        assert os.listdir(store.directory) == [f"{state.key}.json"]
+
+    def test_replace(self, store):
+        state = checkpoint.IterState(methods.USERS_LIST, itervalue="abc")
+        store.save(state)
+        state.advance("def")
+        store.save(state)
+
+        assert store.load(state.key).itervalue == "def"
+        assert len(os.listdir(store.directory)) == 1
+
+    def test_missing(self, store):
+        assert store.load("missing") is None
+        store.delete("missing")
+
+    def test_delete(self, store):
+        state = checkpoint.IterState(methods.USERS_LIST)
+        store.save(state)
+        store.delete(state.key)
+
+        assert store.load(state.key) is None
@@ -0,0 +1,28 @@
+import pytest
+from slack import codec
+
+
+class TestCodec:
+    def test_default(self):
+        assert codec.DEFAULT.loads(b'{"ok": true}') == {"ok": True}
+        assert codec.DEFAULT.loads('{"ok": true}') == {"ok": True}
+        assert codec.DEFAULT.dumps({"ok": True}) == '{"ok": true}'
+
+    def test_find_codec(self):
+        found = codec.find_codec()
+        assert isinstance(found, codec.JSONCodec)
+        assert found.loads(b'{"text": "\xc3\xa9"}') == {"text": "\xe9"}
+
+    @pytest.mark.parametrize(
+        "codec_class,module",
+        ((codec.OrjsonCodec, "orjson"), (codec.UjsonCodec, "ujson")),
+    )
+    def test_optional_codec(self, codec_class, module):
+        pytest.importorskip(module)
+        instance = codec_class()
+        assert instance.loads(b'{"url": "https://slack.com"}') == {
+            "url": "https://slack.com"
+        }
+        assert codec.DEFAULT.loads(instance.dumps({"url": "https://slack.com"})) == {
+            "url": "https://slack.com"
+        }
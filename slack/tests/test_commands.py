@@ -39,6 +39,9 @@ class TestCommand:
         com["user_id"] = "foo"
         assert com["user_id"] == "foo"
 
+    def test_slots(self, slack_command):
+        assert not hasattr(Command(slack_command), "__dict__")
+
 
 class TestCommandRouter:
     def test_register(self, command_router):
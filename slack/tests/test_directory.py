@@ -0,0 +1,95 @@
+import pytest
+from slack.events import Event, EventRouter
+from slack.directory import Directory
+
+USERS = [
+    {"id": "U000AA000", "name": "spengler", "profile": {"real_name": "Egon"}},
+    {"id": "U000AA001", "name": "glinda", "profile": {"bot_id": "B000AA000"}},
+]
+CHANNELS = [
+    {"id": "C000AA000", "name": "general", "is_channel": True},
+    {"id": "C000AA001", "name": "random", "is_channel": True},
+]
+
+
+@pytest.fixture()
+def directory():
+    directory = Directory()
+    directory.add_users(USERS)
+    directory.add_channels(CHANNELS)
+    return directory
+
+
+@pytest.fixture()
+def router(directory):
+    router = EventRouter()
+    directory.register(router)
+    return router
+
+
+def _dispatch(router, event):
+    event = Event(event)
+    for handler in router.dispatch(event):
+        handler(event)
+
+
+class TestDirectory:
+    def test_lookup(self, directory):
+        assert len(directory) == 4
+        assert directory.user("U000AA000")["name"] == "spengler"
+        assert directory.user_by_name("glinda")["id"] == "U000AA001"
+        assert directory.bot("B000AA000")["id"] == "U000AA001"
+        assert directory.channel("C000AA001")["name"] == "random"
+        assert directory.channel_by_name("general")["id"] == "C000AA000"
+
+    def test_missing(self, directory):
+        assert directory.user("U999") is None
+        assert directory.user_by_name("nobody") is None
+        assert directory.bot("B999") is None
+        assert directory.channel("C999") is None
+        assert directory.channel_by_name("nowhere") is None
+
+    def test_user_change(self, directory, router):
+        user = {"id": "U000AA000", "name": "egon", "profile": {"real_name": "Egon S"}}
+        _dispatch(router, {"type": "user_change", "user": user})
+
+        assert directory.user("U000AA000")["profile"]["real_name"] == "Egon S"
+        assert directory.user_by_name("egon")["id"] == "U000AA000"
+        assert directory.user_by_name("spengler") is None
+
+    def test_team_join(self, directory, router):
+        user = {"id": "U000AA002", "name": "ray", "profile": {"bot_id": "B000AA001"}}
+        _dispatch(router, {"type": "team_join", "user": user})
+
+        assert directory.user_by_name("ray")["id"] == "U000AA002"
+        assert directory.bot("B000AA001")["name"] == "ray"
+
+    def test_channel_created(self, directory, router):
+        channel = {"id": "C000AA002", "name": "fun", "created": 1360782804}
+        _dispatch(router, {"type": "channel_created", "channel": channel})
+
+        assert directory.channel_by_name("fun")["id"] == "C000AA002"
+
+    def test_channel_rename(self, directory, router):
+        channel = {"id": "C000AA001", "name": "chaos", "created": 1360782804}
+        _dispatch(router, {"type": "channel_rename", "channel": channel})
+
+        renamed = directory.channel("C000AA001")
+        assert renamed["name"] == "chaos"
+        assert renamed["is_channel"] is True
+        assert directory.channel_by_name("chaos") is renamed
+        assert directory.channel_by_name("random") is None
+
+    def test_channel_deleted(self, directory, router):
+        _dispatch(router, {"type": "channel_deleted", "channel": "C000AA001"})
+
+        assert directory.channel("C000AA001") is None
+        assert directory.channel_by_name("random") is None
+        assert len(directory) == 3
+
+    def test_name_reused(self, directory):
+        directory.add_channels([{"id": "C000AA002", "name": "random"}])
+        directory.add_channels([{"id": "C000AA001", "name": "old-random"}])
+
+        assert directory.channel_by_name("random")["id"] == "C000AA002"
+        assert directory.channel_by_name("old-random")["id"] == "C000AA001"
@@ -1,4 +1,5 @@
 import re
+import json
 
 import pytest
 import slack
@@ -19,6 +20,28 @@ class TestEvents:
         clone["text"] = "aaaaa"
         assert clone != ev
 
+    def test_clone_nested(self, slack_message):
+        ev = Event.from_http(slack_message)
+        ev["attachments"] = [{"text": "hello", "fields": [1, 2]}]
+        clone = ev.clone()
+
+        assert clone == ev
+        assert type(clone) is type(ev)
+        assert clone.metadata == ev.metadata
+        assert clone.metadata is not ev.metadata
+        assert clone["attachments"][0]["text"] is ev["attachments"][0]["text"]
+
+        clone["attachments"][0]["fields"].append(3)
+        clone.metadata["team_id"] = "xxx"
+        assert ev["attachments"][0]["fields"] == [1, 2]
+        assert ev.metadata["team_id"] != "xxx"
+
+    def test_slots(self, slack_message):
+        ev = Event.from_http(slack_message)
+        lazy = Event.from_rtm(json.dumps({"type": "message"}), lazy=True)
+        for event in (ev, lazy, Event({})):
+            assert not hasattr(event, "__dict__")
+
     def test_parsing(self, slack_event):
         http_event = slack.events.Event.from_http(slack_event)
         rtm_event = slack.events.Event.from_rtm(slack_event["event"])
@@ -135,6 +158,75 @@ class TestMessage:
             "event_time": 123456789,
         }
 
+    def test_parsing_raw(self, slack_message, recording_codec):
+        raw = json.dumps(slack_message["event"])
+        rtm_event = slack.events.Event.from_rtm(raw, recording_codec)
+
+        assert isinstance(rtm_event, slack.events.Message)
+        assert rtm_event.event == slack_message["event"]
+        assert recording_codec.loaded == [raw]
+
+    @pytest.mark.parametrize("encode", (False, True), ids=("str", "bytes"))
+    def test_parsing_raw_lazy(self, slack_message, recording_codec, encode):
+        raw = json.dumps({"type": "message", **slack_message["event"]})
+        if encode:
+            raw = raw.encode()
+        rtm_event = slack.events.Event.from_rtm(raw, recording_codec, lazy=True)
+
+        assert isinstance(rtm_event, slack.events.Message)
+        assert rtm_event["type"] == "message"
+        assert rtm_event.get("type") == "message"
+        assert rtm_event.raw is raw
+        assert recording_codec.loaded == []
+
+        assert rtm_event["channel"] == slack_message["event"]["channel"]
+        assert rtm_event.event == json.loads(raw)
+        assert rtm_event.raw is None
+        assert recording_codec.loaded == [raw]
+
+    def test_parsing_raw_lazy_event(self, recording_codec):
+        raw = json.dumps({"type": "pin_added", "user": "U000AA000"})
+        rtm_event = slack.events.Event.from_rtm(raw, recording_codec, lazy=True)
+
+        assert isinstance(rtm_event, slack.events.Event)
+        assert not isinstance(rtm_event, slack.events.Message)
+        assert dict(rtm_event) == {"type": "pin_added", "user": "U000AA000"}
+
+        rtm_event["type"] = "pin_removed"
+        assert rtm_event["type"] == "pin_removed"
+        assert recording_codec.loaded == [raw]
+
+    def test_parsing_raw_lazy_type_not_first(self, recording_codec):
+        raw = json.dumps({"user": "U000AA000", "type": "pin_added"})
+        rtm_event = slack.events.Event.from_rtm(raw, recording_codec, lazy=True)
+
+        assert recording_codec.loaded == [raw]
+        assert rtm_event.event == json.loads(raw)
+
+    def test_clone_lazy(self):
+        raw = json.dumps(
+            {"type": "message", "channel": "C00000A00", "attachments": [{"id": 1}]}
+        )
+        rtm_event = slack.events.Event.from_rtm(raw, lazy=True)
+        clone = rtm_event.clone()
+
+        assert type(clone) is slack.events.Message
+        assert clone == rtm_event
+        assert clone.event is not rtm_event.event
+        assert clone["attachments"][0] is not rtm_event["attachments"][0]
+
+    def test_to_json_codec(self, recording_codec):
+        msg = slack.events.Message({"channel": "C00000A00", "text": "Hello world"})
+        assert json.loads(msg.to_json(recording_codec)) == msg.event
+        assert recording_codec.dumped == [msg.event]
+        assert recording_codec.dumped[0] is msg.event
+
+    def test_serialize_copy(self):
+        msg = slack.events.Message({"channel": "C00000A00", "text": "Hello world"})
+        data = msg.serialize()
+        data["token"] = "xoxb"
+        assert "token" not in msg
+
     def test_serialize(self):
         msg = slack.events.Message()
         msg["channel"] = "C00000A00"
@@ -288,6 +380,43 @@ class TestEventRouter:
         assert handlers[0] is handler
         assert handlers[1] is handler_bis
 
+    def test_dispatch_details_order(self, event_router):
+        event_router.register("message", "handler_subtype", subtype="bot_message")
+        event_router.register("message", "handler")
+        event_router.register("message", "handler_channel", channel="C00000A00")
+        event_router.register("message", "handler_subtype_bis", subtype="bot_message")
+
+        ev = Event(
+            {"type": "message", "subtype": "bot_message", "channel": "C00000A00"}
+        )
+        assert list(event_router.dispatch(ev)) == [
+            "handler_subtype",
+            "handler_subtype_bis",
+            "handler",
+            "handler_channel",
+        ]
+
+        ev = Event({"type": "message", "channel": "C00000A01"})
+        assert list(event_router.dispatch(ev)) == ["handler"]
+
+    def test_dispatch_plan_invalidated(self, event_router):
+        ev = Event({"type": "message", "channel": "C00000A00"})
+        event_router.register("message", "handler")
+        assert list(event_router.dispatch(ev)) == ["handler"]
+
+        plan = event_router._plans["message"]
+        event_router.register("reaction_added", "handler_reaction")
+        assert event_router._plans["message"] is plan
+
+        event_router.register("message", "handler_bis")
+        assert event_router._plans["message"] is not plan
+        assert list(event_router.dispatch(ev)) == ["handler", "handler_bis"]
+
+    def test_dispatch_unknown_type(self, event_router):
+        event_router.register("message", "handler")
+        assert list(event_router.dispatch(Event({"type": "hello"}))) == []
+        assert "hello" not in event_router._plans
+
 
 class TestMessageRouter:
     def test_register(self, message_router):
@@ -436,3 +565,78 @@ class TestMessageRouter:
 
         assert len(handlers) == 1
         assert handlers[0] is handler
+
+    def test_dispatch_order(self, message_router):
+        handlers = [f"handler_{i}" for i in range(8)]
+        message_router.register("^hello", handlers[0])
+        message_router.register("world", handlers[1], channel="C00000A00")
+        message_router.register("(?i)HELLO", handlers[2])
+        message_router.register(r"hel+o\s", handlers[3])
+        message_router.register(r"(\w+) \1", handlers[4])
+        message_router.register("bye", handlers[5])
+        message_router.register(".*", handlers[6], subtype="bot_message")
+        message_router.register("^hello", handlers[7])
+
+        msg = Event({"channel": "C00000A00", "text": "hello hello world"})
+        assert list(message_router.dispatch(msg)) == [
+            handlers[1],
+            handlers[0],
+            handlers[7],
+            handlers[2],
+            handlers[3],
+            handlers[4],
+        ]
+
+        msg = Event({"channel": "C00000A01", "text": "bye bye"})
+        assert list(message_router.dispatch(msg)) == [handlers[4], handlers[5]]
+
+        msg = Event({"channel": "C00000A01", "text": "nothing"})
+        assert list(message_router.dispatch(msg)) == []
+
+    def test_dispatch_register_after_dispatch(self, message_router):
+        message_router.register("hello", "handler")
+        msg = Event({"channel": "C00000A00", "text": "hello"})
+        assert list(message_router.dispatch(msg)) == ["handler"]
+
+        message_router.register("hel", "handler_bis")
+        assert list(message_router.dispatch(msg)) == ["handler", "handler_bis"]
+
+
+@pytest.mark.parametrize(
+    "pattern,flags,literal",
+    (
+        ("hello", 0, "hello"),
+        ("^hello (\\w+)", 0, "hello "),
+        ("hello?", 0, "hell"),
+        ("hello{2}", 0, "hell"),
+        ("hello+", 0, "hello"),
+        ("hello", re.IGNORECASE, None),
+        ("hello|world", 0, None),
+        (".*", 0, None),
+        ("\\d+ items", 0, None),
+    ),
+)
+def test_required_literal(pattern, flags, literal):
+    assert slack.events._required_literal(re.compile(pattern, flags)) == literal
+
+
+def test_combine_patterns():
+    combined = slack.events._combine_patterns(
+        [
+            re.compile("^hello"),
+            re.compile("WORLD", re.I),
+            re.compile("z # comment", re.X),
+        ]
+    )
+    assert combined.search("hello")
+    assert combined.search("the world")
+    assert combined.search("z")
+    assert not combined.search("say hello")
+
+
+@pytest.mark.parametrize("pattern", (r"(\w+) \1", "(?P<a>x)(?P=a)", "(?i)hello"))
+def test_combine_patterns_fallback(pattern):
+    assert (
+        slack.events._combine_patterns([re.compile("hello"), re.compile(pattern)])
+        is None
+    )
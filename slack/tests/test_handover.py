@@ -0,0 +1,96 @@
+import pytest
+from slack.events import Event
+from slack.handover import Handover, event_key
+
+
+def _message(ts, **kwargs):
+    return Event.from_rtm(
+        {"type": "message", "channel": "C0", "user": "U0", "ts": ts, **kwargs}
+    )
+
+
+@pytest.fixture()
+def handover():
+    return Handover(bot_id="B0")
+
+
+class TestEventKey:
+    def test_message(self):
+        assert event_key(_message("1.1")) == "message::C0:1.1"
+        assert event_key(_message("1.1", subtype="message_changed")) == (
+            "message:message_changed:C0:1.1"
+        )
+
+    def test_event_ts(self):
+        event = Event.from_rtm(
+            {"type": "channel_created", "channel": {"id": "C1"}, "event_ts": "2.2"}
+        )
+        assert event_key(event) == "channel_created:::2.2"
+
+    def test_no_timestamp(self):
+        assert event_key(Event.from_rtm({"type": "hello"})) is None
+
+
+class TestHandover:
+    def test_connect(self, handover):
+        assert handover.wants_connection()
+        assert handover.connect() == 1
+        assert not handover.wants_connection()
+
+    def test_reconnect_event(self, handover):
+        first = handover.connect()
+
+        assert not handover.receive(first, Event.from_rtm({"type": "goodbye"}))
+        assert handover.wants_connection()
+
+        second = handover.connect()
+        assert handover.receive(first, _message("1"))
+        assert not handover.stopped(first)
+
+        assert handover.receive(second, Event.from_rtm({"type": "hello"}))
+        assert handover.stopped(first)
+        assert not handover.stopped(second)
+
+        handover.closed(first)
+        assert not handover.stopped(first)
+        assert not handover.wants_connection()
+
+    def test_duplicates(self, handover):
+        first = handover.connect()
+        handover.refresh()
+        second = handover.connect()
+
+        assert handover.receive(first, _message("1"), now=0)
+        assert not handover.receive(second, _message("1"), now=1)
+        assert handover.receive(second, _message("2"), now=1)
+        assert handover.receive(first, _message("1"), now=100)
+
+    def test_hello_not_deduplicated(self, handover):
+        first = handover.connect()
+        handover.refresh()
+        second = handover.connect()
+
+        assert handover.receive(first, Event.from_rtm({"type": "hello"}))
+        assert handover.receive(second, Event.from_rtm({"type": "hello"}))
+        assert handover.stopped(first)
+
+    def test_refresh(self, handover):
+        first = handover.connect()
+        handover.refresh()
+
+        assert handover.wants_connection()
+        assert not handover.stopped(first)
+
+    def test_closed(self, handover):
+        first = handover.connect()
+        handover.closed(first)
+
+        assert handover.wants_connection()
+
+    def test_discard(self, handover):
+        connection = handover.connect()
+
+        assert not handover.receive(connection, _message("1", bot_id="B0"))
+        assert not handover.receive(
+            connection, Event.from_rtm({"type": "reconnect_url"})
+        )
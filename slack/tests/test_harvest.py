@@ -0,0 +1,72 @@
+import pytest
+from slack import harvest
+
+
+def _run(scheduler, pages):
+    """
+    Run the scheduler with one request in flight, each channel having `pages` pages
+    """
+    order = []
+    while True:
+        progress = scheduler.next()
+        if progress is None:
+            return order
+        order.append(progress.channel)
+        itervalue = progress.pages + 1 if progress.pages + 1 < pages else None
+        scheduler.record(progress, 2, itervalue)
+
+
+class TestScheduler:
+    def test_round_robin(self):
+        scheduler = harvest.Scheduler(["C1", "C2", "C3"])
+        assert _run(scheduler, 3) == ["C1", "C2", "C3"] * 3
+
+    def test_max_active(self):
+        scheduler = harvest.Scheduler(["C1", "C2", "C3", "C4"], max_active=2)
+        assert _run(scheduler, 2) == ["C1", "C2", "C1", "C3", "C2", "C4", "C3", "C4"]
+
+    def test_lazy_channels(self):
+        channels = iter(["C1", "C2", "C3"])
+        scheduler = harvest.Scheduler(channels, max_active=1)
+        scheduler.next()
+
+        assert list(channels) == ["C2", "C3"]
+
+    def test_progress(self):
+        scheduler = harvest.Scheduler(["C1", "C2"])
+        _run(scheduler, 3)
+
+        progress = scheduler.progress["C1"]
+        assert progress.pages == 3
+        assert progress.items == 6
+        assert progress.itervalue is None
+        assert progress.done is True
+        assert progress.error is None
+
+    def test_waiting(self):
+        scheduler = harvest.Scheduler(["C1"])
+        progress = scheduler.next()
+
+        assert scheduler.next() is None
+        scheduler.record(progress, 2, "abc")
+        assert scheduler.next() is progress
+        assert progress.itervalue == "abc"
+
+    def test_fail(self):
+        scheduler = harvest.Scheduler(["C1", "C2"], max_active=1)
+        progress = scheduler.next()
+        exc = ValueError()
+        scheduler.fail(progress, exc)
+
+        assert progress.done is True
+        assert progress.error is exc
+        assert scheduler.next().channel == "C2"
+
+    @pytest.mark.parametrize("max_active", (1, 3, 100))
+    def test_all_pages(self, max_active):
+        channels = [f"C{index}" for index in range(10)]
+        scheduler = harvest.Scheduler(channels, max_active)
+        order = _run(scheduler, 4)
+
+        assert sorted(order) == sorted(channels * 4)
+        assert all(progress.done for progress in scheduler.progress.values())
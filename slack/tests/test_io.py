@@ -1,7 +1,10 @@
 import json
 import time
+import queue
+import socket
 import asyncio
 import datetime
+import threading
 
 import asks
 import trio
@@ -10,12 +13,15 @@ import pytest
 import aiohttp
 import requests
 import asynctest
+import websocket
 import slack
-from slack import methods, exceptions
+from slack import cache, retry, methods, ratelimit, checkpoint, exceptions
 from slack.io.trio import SlackAPI as SlackAPITrio
 from slack.io.curio import SlackAPI as SlackAPICurio
+from slack.directory import Directory
 from slack.io.aiohttp import SlackAPI as SlackAPIAiohttp
 from slack.io.requests import SlackAPI as SlackAPIRequest
+from slack.io.requests import RTMEngine, create_session
 
 
 @pytest.mark.asyncio
@@ -80,6 +86,357 @@ class TestABC:
         )
         assert slack_client._request.call_args[0][2] == called_headers
 
+    @pytest.mark.parametrize(
+        "slack_client",
+        ({"client_parameters": {"rate_limiter": ratelimit.RateLimiter()}},),
+        indirect=True,
+    )
+    async def test_query_rate_limiter(self, slack_client):
+        slack_client.sleep = asynctest.CoroutineMock()
+
+        await slack_client.query(methods.RTM_CONNECT)
+        assert slack_client.sleep.call_count == 0
+
+        await slack_client.query(methods.RTM_CONNECT)
+        assert slack_client.sleep.call_count == 1
+        assert 60 >= slack_client.sleep.call_args[0][0] > 59
+
+        await slack_client.query(methods.USERS_INFO)
+        assert slack_client.sleep.call_count == 1
+        assert slack_client._request.call_count == 3
+
+    @pytest.mark.parametrize(
+        "slack_client",
+        (
+            {
+                "status": [429, 200],
+                "body": [{"ok": False}, {"ok": True}],
+                "headers": [
+                    {
+                        "content-type": "application/json; charset=utf-8",
+                        "Retry-After": "3",
+                    },
+                    {"content-type": "application/json; charset=utf-8"},
+                ],
+                "client_parameters": {"retry_policy": retry.RetryPolicy()},
+            },
+        ),
+        indirect=True,
+    )
+    async def test_query_retry_rate_limited(self, slack_client):
+        slack_client.sleep = asynctest.CoroutineMock()
+
+        rep = await slack_client.query(methods.AUTH_TEST)
+        assert rep == {"ok": True}
+        assert slack_client._request.call_count == 2
+        slack_client.sleep.assert_called_once_with(3)
+
+    @pytest.mark.parametrize(
+        "slack_client",
+        (
+            {
+                "status": [500, 503, 500],
+                "body": [{"ok": False}],
+                "client_parameters": {
+                    "retry_policy": retry.RetryPolicy(max_attempts=3, jitter=False)
+                },
+            },
+        ),
+        indirect=True,
+    )
+    async def test_query_retry_exhausted(self, slack_client):
+        slack_client.sleep = asynctest.CoroutineMock()
+
+        with pytest.raises(exceptions.HTTPException) as exc:
+            await slack_client.query(methods.AUTH_TEST)
+
+        assert exc.value.status == 500
+        assert slack_client._request.call_count == 3
+        assert [call[0][0] for call in slack_client.sleep.call_args_list] == [0.5, 1]
+
+    @pytest.mark.parametrize(
+        "slack_client",
+        (
+            {
+                "status": [400, 200],
+                "body": [{"ok": False}],
+                "client_parameters": {"retry_policy": retry.RetryPolicy()},
+            },
+        ),
+        indirect=True,
+    )
+    async def test_query_retry_client_error(self, slack_client):
+        with pytest.raises(exceptions.HTTPException):
+            await slack_client.query(methods.AUTH_TEST)
+
+        assert slack_client._request.call_count == 1
+
+    @pytest.mark.parametrize(
+        "slack_client",
+        (
+            {
+                "status": [200, 502, 200],
+                "body": ["channels_iter", {"ok": False}, "channels"],
+                "client_parameters": {"retry_policy": retry.RetryPolicy()},
+            },
+        ),
+        indirect=True,
+    )
+    async def test_iter_retry(self, slack_client, token, itercursor):
+        slack_client.sleep = asynctest.CoroutineMock()
+
+        channels = 0
+        async for _ in slack_client.iter(methods.CHANNELS_LIST):  # noQa: F841
+            channels += 1
+
+        assert channels == 4
+        assert slack_client._request.call_count == 3
+        assert slack_client.sleep.call_count == 1
+        for call in slack_client._request.call_args_list[1:]:
+            assert call[0][3] == {"limit": 200, "token": token, "cursor": itercursor}
+
+    @pytest.mark.parametrize(
+        "slack_client",
+        ({"client_parameters": {"cache": cache.ResponseCache()}},),
+        indirect=True,
+    )
+    async def test_query_cache(self, slack_client):
+        first = await slack_client.query(methods.USERS_INFO, {"user": "U0"})
+        second = await slack_client.query("users.info", {"user": "U0"})
+        await slack_client.query(methods.USERS_INFO, {"user": "U1"})
+        await slack_client.query(methods.AUTH_TEST)
+        await slack_client.query(methods.AUTH_TEST)
+
+        assert first == second == {"ok": True}
+        assert first is not second
+        assert slack_client._request.call_count == 4
+
+    @pytest.mark.parametrize(
+        "slack_client",
+        ({"client_parameters": {"cache": cache.ResponseCache()}},),
+        indirect=True,
+    )
+    async def test_query_cache_invalidate(self, slack_client):
+        await slack_client.query(methods.USERS_INFO, {"user": "U0"})
+        await slack_client.query(methods.USERS_INFO, {"user": "U1"})
+        await slack_client.query(methods.TEAM_INFO)
+
+        slack_client.invalidate(methods.USERS_INFO, {"user": "U0"})
+        await slack_client.query(methods.USERS_INFO, {"user": "U0"})
+        await slack_client.query(methods.USERS_INFO, {"user": "U1"})
+        assert slack_client._request.call_count == 4
+
+        slack_client.invalidate(methods.USERS_INFO)
+        await slack_client.query(methods.USERS_INFO, {"user": "U1"})
+        await slack_client.query(methods.TEAM_INFO)
+        assert slack_client._request.call_count == 5
+
+        slack_client.invalidate()
+        await slack_client.query(methods.TEAM_INFO)
+        assert slack_client._request.call_count == 6
+
+    @pytest.mark.parametrize(
+        "slack_client",
+        (
+            {
+                "client_parameters": {"cache": cache.ResponseCache()},
+                "body": [{"ok": False}, {"ok": True}],
+                "status": [500, 200],
+            },
+        ),
+        indirect=True,
+    )
+    async def test_query_cache_error(self, slack_client):
+        with pytest.raises(exceptions.HTTPException):
+            await slack_client.query(methods.USERS_INFO, {"user": "U0"})
+
+        await slack_client.query(methods.USERS_INFO, {"user": "U0"})
+        assert slack_client._request.call_count == 2
+
+    @pytest.mark.parametrize(
+        "slack_client", ({"client_parameters": {"coalesce": True}},), indirect=True
+    )
+    async def test_query_coalesce(self, slack_client, fake_users_info):
+        slack_client._request = fake_users_info(asyncio.sleep)
+        responses = await asyncio.gather(
+            *(slack_client.query(methods.USERS_INFO, {"user": "U0"}) for _ in range(5)),
+            slack_client.query(methods.USERS_INFO, {"user": "U1"}),
+        )
+
+        assert slack_client._request.calls == ["U0", "U1"]
+        assert responses[0] == responses[4] == {"ok": True, "user": {"id": "U0"}}
+        assert responses[0] is not responses[4]
+        assert responses[5]["user"]["id"] == "U1"
+        assert not slack_client._in_flight
+
+    @pytest.mark.parametrize(
+        "slack_client", ({"client_parameters": {"coalesce": True}},), indirect=True
+    )
+    async def test_query_coalesce_copies(self, slack_client, fake_users_info):
+        slack_client._request = fake_users_info(asyncio.sleep)
+
+        async def leader():
+            response = await slack_client.query(methods.USERS_INFO, {"user": "U0"})
+            response["user"]["id"] = "changed"
+            return response
+
+        responses = await asyncio.gather(
+            leader(),
+            slack_client.query(methods.USERS_INFO, {"user": "U0"}),
+            slack_client.query(methods.USERS_INFO, {"user": "U0"}),
+        )
+
+        assert slack_client._request.calls == ["U0"]
+        assert responses[0]["user"]["id"] == "changed"
+        assert responses[1]["user"]["id"] == responses[2]["user"]["id"] == "U0"
+        assert responses[1]["user"] is not responses[2]["user"]
+
+    async def test_query_coalesce_disabled(self, slack_client, fake_users_info):
+        slack_client._request = fake_users_info(asyncio.sleep)
+        await asyncio.gather(
+            *(slack_client.query(methods.USERS_INFO, {"user": "U0"}) for _ in range(3))
+        )
+
+        assert slack_client._request.calls == ["U0", "U0", "U0"]
+
+    @pytest.mark.parametrize(
+        "slack_client", ({"client_parameters": {"coalesce": True}},), indirect=True
+    )
+    async def test_query_coalesce_not_cacheable(self, slack_client, fake_users_info):
+        slack_client._request = fake_users_info(asyncio.sleep)
+        await asyncio.gather(
+            slack_client.query(methods.USERS_PROFILE_SET, {"user": "U0"}),
+            slack_client.query(methods.USERS_PROFILE_SET, {"user": "U0"}),
+            slack_client.query(methods.USERS_INFO, {"user": "U0"}, {"X-Id": "1"}),
+            slack_client.query(methods.USERS_INFO, {"user": "U0"}, {"X-Id": "2"}),
+        )
+
+        assert slack_client._request.calls == ["U0", "U0", "U0", "U0"]
+
+    @pytest.mark.parametrize(
+        "slack_client", ({"client_parameters": {"coalesce": True}},), indirect=True
+    )
+    async def test_query_coalesce_error(self, slack_client, fake_users_info):
+        slack_client._request = fake_users_info(asyncio.sleep, status=500)
+        results = await asyncio.gather(
+            *(slack_client.query(methods.USERS_INFO, {"user": "U0"}) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert slack_client._request.calls == ["U0"]
+        assert all(isinstance(result, exceptions.HTTPException) for result in results)
+        assert not slack_client._in_flight
+
+    @pytest.mark.parametrize(
+        "slack_client", ({"client_parameters": {"coalesce": True}},), indirect=True
+    )
+    async def test_query_coalesce_cancelled(self, slack_client, fake_users_info):
+        slack_client._request = fake_users_info(asyncio.sleep)
+        leader = asyncio.ensure_future(
+            slack_client.query(methods.USERS_INFO, {"user": "U0"})
+        )
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(
+            slack_client.query(methods.USERS_INFO, {"user": "U0"})
+        )
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert (await follower)["user"]["id"] == "U0"
+        assert slack_client._request.calls == ["U0", "U0"]
+        assert leader.cancelled()
+
+    async def test_query_many(self, slack_client):
+        queries = [(methods.USERS_INFO, {"user": user}) for user in range(5)]
+        results = [result async for result in slack_client.query_many(queries)]
+
+        assert slack_client._request.call_count == 5
+        assert [result.index for result in results] == list(range(5))
+        assert [result.data["user"] for result in results] == list(range(5))
+        assert all(result.response == {"ok": True} for result in results)
+        assert all(result.error is None for result in results)
+
+    @pytest.mark.parametrize(
+        "slack_client",
+        ({"status": [200, 500, 200], "body": [{"ok": True}]},),
+        indirect=True,
+    )
+    async def test_query_many_errors(self, slack_client):
+        queries = [(methods.USERS_INFO, {"user": user}) for user in range(3)]
+        results = [
+            result async for result in slack_client.query_many(queries, concurrency=1)
+        ]
+
+        assert results[0].response == {"ok": True}
+        assert results[1].response is None
+        assert isinstance(results[1].error, exceptions.HTTPException)
+        assert results[2].response == {"ok": True}
+
+    @pytest.mark.parametrize("ordered", (True, False))
+    async def test_query_many_concurrency(self, slack_client, ordered):
+        in_flight = []
+        max_in_flight = 0
+
+        async def _request(method, url, headers, body):
+            nonlocal max_in_flight
+            in_flight.append(body["user"])
+            max_in_flight = max(max_in_flight, len(in_flight))
+            await asyncio.sleep(0.05 if body["user"] == 0 else 0.01)
+            in_flight.remove(body["user"])
+            return 200, b'{"ok": true}', {"content-type": "application/json"}
+
+        slack_client._request = _request
+        queries = [(methods.USERS_INFO, {"user": user}) for user in range(4)]
+        results = [
+            result.index
+            async for result in slack_client.query_many(
+                queries, concurrency=2, ordered=ordered
+            )
+        ]
+
+        assert max_in_flight == 2
+        if ordered:
+            assert results == [0, 1, 2, 3]
+        else:
+            assert results == [1, 2, 3, 0]
+
+    @pytest.mark.parametrize("ordered", (True, False))
+    async def test_query_many_window(self, slack_client, ordered):
+        started = []
+
+        async def _request(method, url, headers, body):
+            started.append(body["user"])
+            await asyncio.sleep(0.05 if body["user"] == 0 else 0)
+            return 200, b'{"ok": true}', {"content-type": "application/json"}
+
+        slack_client._request = _request
+        queries = [(methods.USERS_INFO, {"user": user}) for user in range(50)]
+        windows = []
+        async for result in slack_client.query_many(
+            queries, concurrency=3, ordered=ordered
+        ):
+            windows.append(len(started) - len(windows))
+
+        assert len(windows) == 50
+        assert max(windows) <= 3
+
+    async def test_query_many_queries_error(self, slack_client):
+        def queries():
+            yield methods.USERS_INFO, {"user": 0}
+            raise ValueError("queries")
+
+        with pytest.raises(ValueError):
+            async for _ in slack_client.query_many(queries()):  # noQa: F841
+                pass
+
+    async def test_query_codec(self, slack_client, recording_codec):
+        slack_client._codec = recording_codec
+        rep = await slack_client.query(methods.AUTH_TEST, {"hello": "world"})
+
+        assert rep == {"ok": True}
+        assert recording_codec.dumped == [{"hello": "world"}]
+        assert recording_codec.loaded == [b'{"ok": true}']
+
     @pytest.mark.parametrize(
         "slack_client", ({"body": ["channels_iter", "channels"]},), indirect=True
     )
@@ -165,6 +522,332 @@ class TestABC:
         assert slack_client._request.call_count == 2
         assert slack_client.sleep.call_count == 0
 
+    @pytest.mark.parametrize(
+        "slack_client",
+        ({"body": ["channels_iter", "channels_iter", "channels"]},),
+        indirect=True,
+    )
+    async def test_iter_prefetch(self, slack_client, token, itercursor):
+        channels = 0
+        async for _ in slack_client.iter(
+            methods.CHANNELS_LIST, prefetch=2
+        ):  # noQa: F841
+            channels += 1
+
+        assert channels == 6
+        assert slack_client._request.call_count == 3
+        slack_client._request.assert_called_with(
+            "POST",
+            "https://slack.com/api/channels.list",
+            {},
+            {"limit": 200, "token": token, "cursor": itercursor},
+        )
+
+    @pytest.mark.parametrize(
+        "slack_client", ({"body": ["channels_iter"] * 5 + ["channels"]},), indirect=True
+    )
+    async def test_iter_prefetch_bounded(self, slack_client):
+        async for _ in slack_client.iter(
+            methods.CHANNELS_LIST, prefetch=1
+        ):  # noQa: F841
+            await asyncio.sleep(0.01)
+            break
+
+        await asyncio.sleep(0.01)
+        # page being consumed, one buffered page and one waiting for space in the buffer
+        assert slack_client._request.call_count == 3
+
+    @pytest.mark.parametrize(
+        "slack_client",
+        ({"body": ["channels_iter", {"ok": False}], "status": [200, 500]},),
+        indirect=True,
+    )
+    async def test_iter_prefetch_error(self, slack_client):
+        channels = 0
+        with pytest.raises(exceptions.HTTPException):
+            async for _ in slack_client.iter(
+                methods.CHANNELS_LIST, prefetch=2
+            ):  # noQa: F841
+                channels += 1
+
+        assert channels == 2
+
+    async def test_iter_stream(self, slack_client, token, fake_responses):
+        responses = fake_responses.pages(3)
+        slack_client._request_chunks = responses.request_chunks
+
+        channels = [
+            c async for c in slack_client.iter(methods.CHANNELS_LIST, stream=True)
+        ]
+
+        assert channels == [{"id": 0}, {"id": 1}, {"id": 2}]
+        assert [call[3] for call in responses.calls] == [
+            {"limit": 200, "token": token},
+            {"limit": 200, "token": token, "cursor": "1"},
+            {"limit": 200, "token": token, "cursor": "2"},
+        ]
+
+    async def test_iter_stream_api_error(self, slack_client, fake_responses):
+        slack_client._request_chunks = fake_responses(
+            [(200, {"ok": False, "error": "invalid_auth"})]
+        ).request_chunks
+
+        with pytest.raises(exceptions.SlackAPIError):
+            async for _ in slack_client.iter(
+                methods.CHANNELS_LIST, stream=True
+            ):  # noQa: F841
+                pass
+
+    async def test_iter_stream_http_error(self, slack_client, fake_responses):
+        slack_client._request_chunks = fake_responses(
+            [(500, {"ok": False})]
+        ).request_chunks
+
+        with pytest.raises(exceptions.HTTPException):
+            async for _ in slack_client.iter(
+                methods.CHANNELS_LIST, stream=True
+            ):  # noQa: F841
+                pass
+
+    @pytest.mark.parametrize(
+        "slack_client",
+        ({"client_parameters": {"retry_policy": retry.RetryPolicy(backoff=0)}},),
+        indirect=True,
+    )
+    async def test_iter_stream_retry(self, slack_client, fake_responses):
+        responses = fake_responses.pages(2)
+        responses.insert(0, (503, {"ok": False}))
+        slack_client._request_chunks = responses.request_chunks
+
+        channels = [
+            c async for c in slack_client.iter(methods.CHANNELS_LIST, stream=True)
+        ]
+
+        assert channels == [{"id": 0}, {"id": 1}]
+        assert len(responses.calls) == 3
+
+    async def test_iter_stream_prefetch(self, slack_client):
+        with pytest.raises(ValueError):
+            async for _ in slack_client.iter(
+                methods.CHANNELS_LIST, stream=True, prefetch=1
+            ):  # noQa: F841
+                pass
+
+    @pytest.mark.parametrize(
+        "slack_client",
+        (
+            {
+                "body": [
+                    "channels_iter",
+                    "channels_iter",
+                    "channels",
+                    "channels_iter",
+                    "channels",
+                ]
+            },
+        ),
+        indirect=True,
+    )
+    async def test_iter_checkpoint(self, slack_client, token, itercursor, tmpdir):
+        store = checkpoint.FileCheckpointStore(str(tmpdir))
+        channels = 0
+        async for _ in slack_client.iter(
+            methods.CHANNELS_LIST, store=store
+        ):  # noQa: F841
+            channels += 1
+            if channels == 3:
+                break
+
+        state = checkpoint.IterState(methods.CHANNELS_LIST)
+        assert store.load(state.key).itervalue == itercursor
+
+        async for _ in slack_client.iter(
+            methods.CHANNELS_LIST, store=store
+        ):  # noQa: F841
+            channels += 1
+
+        assert channels == 5
+        assert slack_client._request.call_count == 3
+        slack_client._request.assert_called_with(
+            "POST",
+            "https://slack.com/api/channels.list",
+            {},
+            {"limit": 200, "token": token, "cursor": itercursor},
+        )
+        assert store.load(state.key) is None
+
+        async for _ in slack_client.iter(
+            methods.CHANNELS_LIST, store=store
+        ):  # noQa: F841
+            channels += 1
+
+        assert channels == 9
+        assert slack_client._request.call_count == 5
+
+    @pytest.mark.parametrize(
+        "slack_client",
+        ({"body": ["channels_iter", "channels_iter", "channels"]},),
+        indirect=True,
+    )
+    async def test_iter_checkpoint_prefetch(self, slack_client, tmpdir):
+        store = checkpoint.FileCheckpointStore(str(tmpdir))
+        async for _ in slack_client.iter(
+            methods.CHANNELS_LIST, store=store, prefetch=2
+        ):  # noQa: F841
+            await asyncio.sleep(0.01)
+            break
+
+        # pages were requested ahead but none was consumed
+        assert slack_client._request.call_count == 3
+        assert store.load(checkpoint.IterState(methods.CHANNELS_LIST).key) is None
+
+    @pytest.mark.parametrize("slack_client", ({"body": "channels"},), indirect=True)
+    async def test_iter_checkpoint_state(self, slack_client, token):
+        state = checkpoint.IterState(methods.CHANNELS_LIST, itervalue="abcd")
+        channels = [c async for c in slack_client.iter("ignored", state=state)]
+
+        assert len(channels) == 2
+        assert slack_client._request.call_args[0][3] == {
+            "limit": 200,
+            "token": token,
+            "cursor": "abcd",
+        }
+        assert state.done is True
+
+    async def test_iter_stream_checkpoint(self, slack_client, tmpdir, fake_responses):
+        store = checkpoint.FileCheckpointStore(str(tmpdir))
+        responses = fake_responses.pages(3)
+        responses.insert(2, responses[1])  # the interrupted page is requested again
+        slack_client._request_chunks = responses.request_chunks
+
+        async for channel in slack_client.iter(
+            methods.CHANNELS_LIST, stream=True, store=store
+        ):
+            if channel["id"] == 1:
+                break
+
+        state = store.load(checkpoint.IterState(methods.CHANNELS_LIST).key)
+        assert state.itervalue == "1"
+
+        channels = [
+            c
+            async for c in slack_client.iter(
+                methods.CHANNELS_LIST, stream=True, state=state, store=store
+            )
+        ]
+        assert channels == [{"id": 1}, {"id": 2}]
+        assert responses.calls[-2][3]["cursor"] == "1"
+        assert state.done is True
+        assert store.load(state.key) is None
+
+    async def test_iter_timeline(self, slack_client, fake_timeline):
+        history = fake_timeline(101)
+        slack_client._request = history.request
+        data = {"channel": "C00000001"}
+
+        messages = [
+            message["ts"]
+            async for message in slack_client.iter_timeline(
+                methods.CHANNELS_HISTORY, data, oldest="999", latest="1101", limit=7
+            )
+        ]
+
+        assert messages == history.timestamps[::-1]
+        assert data == {"channel": "C00000001"}
+        assert {body["oldest"] for body in history.requests} == {
+            "999.000000",
+            "1024.499999",
+            "1049.999999",
+            "1075.499999",
+        }
+
+    async def test_iter_timeline_error(self, slack_client, fake_timeline):
+        history = fake_timeline(20, fail_after="1005.000000")
+        slack_client._request = history.request
+
+        messages = []
+        with pytest.raises(exceptions.SlackAPIError):
+            async for message in slack_client.iter_timeline(
+                methods.CHANNELS_HISTORY, oldest="999", latest="1021", slices=2
+            ):
+                messages.append(message["ts"])
+
+        assert messages == history.timestamps[:9:-1]
+
+    async def test_harvest(self, slack_client, fake_history):
+        history = fake_history(pages=3)
+
+        async def _request(*args):
+            await asyncio.sleep(0)
+            return history(*args)
+
+        slack_client._request = _request
+        channels = [f"C{index}" for index in range(5)]
+        progress = []
+
+        items = [
+            item
+            async for item in slack_client.harvest(
+                methods.CONVERSATIONS_HISTORY,
+                channels,
+                concurrency=2,
+                max_active=3,
+                on_progress=progress.append,
+            )
+        ]
+
+        assert len(items) == 15
+        for channel in channels:
+            assert [i.item for i in items if i.channel == channel] == [
+                {"channel": channel, "page": page} for page in range(3)
+            ]
+        assert len(progress) == 15
+        assert {p.channel for p in progress if p.done} == set(channels)
+
+    async def test_harvest_error(self, slack_client, fake_history):
+        history = fake_history(pages=2)
+
+        async def _request(method, url, headers, body):
+            if body["channel"] == "C1":
+                return 200, b'{"ok": false, "error": "channel_not_found"}', {}
+            return history(method, url, headers, body)
+
+        slack_client._request = _request
+        progress = {}
+
+        async def on_progress(channel_progress):
+            progress[channel_progress.channel] = channel_progress
+
+        items = [
+            item
+            async for item in slack_client.harvest(
+                methods.CONVERSATIONS_HISTORY,
+                ["C0", "C1", "C2"],
+                on_progress=on_progress,
+            )
+        ]
+
+        assert {item.channel for item in items} == {"C0", "C2"}
+        assert len(items) == 4
+        assert isinstance(progress["C1"].error, exceptions.SlackAPIError)
+        assert progress["C1"].done is True
+        assert progress["C2"].error is None
+
+    @pytest.mark.parametrize(
+        "slack_client", ({"body": ["users", "channels"]},), indirect=True
+    )
+    async def test_warm_directory(self, slack_client):
+        directory = await slack_client.warm_directory()
+
+        assert directory.user_by_name("glinda")["id"] == "W07QCRPA4"
+        assert directory.channel("C00000002")["name"] == "fun"
+        assert slack_client._request.call_args[0][1] == (
+            "https://slack.com/api/conversations.list"
+        )
+        assert slack_client._request.call_args[0][3]["types"] == (
+            "public_channel,private_channel"
+        )
+
     @pytest.mark.parametrize(
         "slack_client", ({"body": ["auth_test", "users_info"]},), indirect=True
     )
@@ -172,11 +855,135 @@ class TestABC:
         bot_id = await slack_client._find_bot_id()
         assert bot_id == "B0AAA0A00"
 
+    @pytest.mark.parametrize(
+        "slack_client",
+        (
+            {
+                "body": ["auth_test", "users_info"],
+                "client_parameters": {"bootstrap_cache": cache.ResponseCache()},
+            },
+        ),
+        indirect=True,
+    )
+    async def test_find_bot_id_cached(self, slack_client):
+        assert await slack_client._find_bot_id() == "B0AAA0A00"
+        assert await slack_client._find_bot_id() == "B0AAA0A00"
+        assert slack_client._request.call_count == 2
+
+    @pytest.mark.parametrize("slack_client", ({"body": "rtm_connect"},), indirect=True)
+    async def test_rtm_bootstrap_shared(self, slack_client, tmpdir):
+        bootstrap_cache = cache.FileResponseCache(str(tmpdir))
+        bootstrap_cache.set(
+            cache.bootstrap_key(slack_client._token),
+            {"user_id": "U0AAA0A00", "bot_id": "B0AAA0A00"},
+        )
+        slack_client._bootstrap_cache = bootstrap_cache
+
+        async def incoming(url, bot_id):
+            yield (url, bot_id)
+
+        slack_client._incoming_from_rtm = incoming
+        events = []
+        async for event in slack_client.rtm():
+            events.append(event)
+            if len(events) == 2:
+                break
+
+        assert events == [("wss://testteam.slack.com/012345678910", "B0AAA0A00")] * 2
+        assert slack_client._request.call_count == 2
+        assert all(
+            call[0][1] == "https://slack.com/api/rtm.connect"
+            for call in slack_client._request.call_args_list
+        )
+
     @pytest.mark.parametrize("slack_client", ({"body": "rtm_connect"},), indirect=True)
     async def test_find_rtm_url(self, slack_client):
         url = await slack_client._find_rtm_url()
         assert url == "wss://testteam.slack.com/012345678910"
 
+    async def test_rtm_standby(self, slack_client, fake_connections):
+        connections = fake_connections(
+            [["hello", 1, "goodbye", 2, 3, 4], ["hello", 2, 3, 4, 5], ["hello"]]
+        )
+        slack_client._rtm = connections.rtm
+        slack_client._find_rtm_url = connections.find_url
+
+        delivered = []
+        iterator = slack_client.rtm(bot_id="B0", standby=True)
+        async for event in iterator:
+            delivered.append(event.get("ts", event["type"]))
+            if event.get("ts") == "5":
+                break
+        await iterator.aclose()
+
+        assert delivered.count("hello") == 2
+        assert sorted(ts for ts in delivered if ts != "hello") == [
+            "1",
+            "2",
+            "3",
+            "4",
+            "5",
+        ]
+        assert connections.urls == ["wss://0", "wss://1"]
+        assert connections.closed[0] < 6
+
+    async def test_rtm_standby_error(self, slack_client):
+        async def rtm(url):
+            yield json.dumps({"type": "hello"})
+            raise ConnectionError()
+
+        async def find_url():
+            return "wss://0"
+
+        slack_client._rtm = rtm
+        slack_client._find_rtm_url = find_url
+
+        delivered = []
+        with pytest.raises(ConnectionError):
+            async for event in slack_client.rtm(bot_id="B0", standby=True):
+                delivered.append(event["type"])
+
+        assert delivered == ["hello"]
+
+    async def test_rtm_standby_refresh(self, slack_client, fake_stream):
+        stream = fake_stream
+        slack_client._rtm = stream.rtm
+        slack_client._find_rtm_url = stream.find_url
+        slack_client.sleep = asyncio.sleep
+
+        delivered = []
+        clock = asyncio.ensure_future(stream.clock())
+        iterator = slack_client.rtm(bot_id="B0", refresh_interval=0.05)
+        async for event in iterator:
+            delivered.append(event.get("ts"))
+            if event.get("ts") == "15":
+                break
+        await iterator.aclose()
+        clock.cancel()
+
+        messages = [ts for ts in delivered if ts]
+        assert messages == [str(ts) for ts in range(1, 16)]
+        assert 2 < delivered.count(None) <= len(stream.urls)
+        assert stream.closed[0] < 15
+
+    async def test_rtm_standby_refresh_quiet(self, slack_client, fake_connections):
+        connections = fake_connections([["hello"]] * 20)
+        slack_client._rtm = connections.rtm
+        slack_client._find_rtm_url = connections.find_url
+        slack_client.sleep = asyncio.sleep
+
+        hellos = 0
+        iterator = slack_client.rtm(bot_id="B0", refresh_interval=0.02)
+        async for _ in iterator:
+            hellos += 1
+            if hellos == 5:
+                opened = len(connections.urls) - len(connections.closed)
+                break
+        await iterator.aclose()
+
+        assert opened <= 2
+        assert len(connections.closed) == len(connections.urls)
+
     async def test_incoming_rtm(self, slack_client, rtm_iterator):
         slack_client._rtm = rtm_iterator
 
@@ -188,6 +995,20 @@ class TestABC:
             events.append(event)
         assert len(events) > 0
 
+    @pytest.mark.parametrize(
+        "slack_client", ({"client_parameters": {"lazy_events": True}},), indirect=True
+    )
+    async def test_incoming_rtm_lazy(self, slack_client, rtm_iterator):
+        slack_client._rtm = rtm_iterator
+
+        events = []
+        async for event in slack_client._incoming_from_rtm(
+            "wss://testteam.slack.com/012345678910", "B0AAA0A00"
+        ):
+            assert event.raw is not None
+            events.append(event["type"])
+        assert events == ["channel_deleted", "pin_added"]
+
     @pytest.mark.parametrize("rtm_iterator", (("goodbye",),), indirect=True)
     async def test_incoming_rtm_reconnect(self, slack_client, rtm_iterator):
         slack_client._rtm = rtm_iterator
@@ -224,8 +1045,156 @@ class TestABC:
 
         assert len(events) == 0
 
+    async def test_dispatch(self, slack_client, event_router):
+        called = []
+
+        async def handler(event):
+            await asyncio.sleep(0.01)
+            called.append(("async", event["type"]))
+
+        def handler_sync(event):
+            called.append(("sync", event["type"]))
+
+        event_router.register("hello", handler)
+        event_router.register("hello", handler_sync)
+        event_router.register("pong", handler_sync)
+
+        errors = [
+            error
+            async for error in slack_client.dispatch(
+                _incoming("hello", "pong", "hello", "goodbye"), event_router
+            )
+        ]
+
+        assert errors == []
+        assert sorted(called) == [
+            ("async", "hello"),
+            ("async", "hello"),
+            ("sync", "hello"),
+            ("sync", "hello"),
+            ("sync", "pong"),
+        ]
+
+    async def test_dispatch_errors(self, slack_client, event_router):
+        exc = ValueError()
+
+        def handler(event):
+            raise exc
+
+        async def incoming():
+            yield slack.events.Event({"type": "hello"})
+            yield slack.events.Event({"type": "pong"})
+            yield slack.events.Event({})
+
+        event_router.register("hello", handler)
+        errors = [
+            error async for error in slack_client.dispatch(incoming(), event_router)
+        ]
+
+        assert len(errors) == 2
+        handler_error, router_error = sorted(errors, key=lambda e: e.handler is None)
+        assert handler_error.item["type"] == "hello"
+        assert handler_error.handler is handler
+        assert handler_error.error is exc
+        assert router_error.item == {}
+        assert router_error.handler is None
+        assert isinstance(router_error.error, KeyError)
+
+    async def test_dispatch_timeout(self, slack_client, event_router):
+        async def handler(event):
+            await asyncio.sleep(1)
+
+        event_router.register("hello", handler)
+        start = time.time()
+        errors = [
+            error
+            async for error in slack_client.dispatch(
+                _incoming("hello", "hello"), event_router, timeout=0.05
+            )
+        ]
+
+        assert time.time() - start < 0.5
+        assert len(errors) == 2
+        assert all(isinstance(error.error, TimeoutError) for error in errors)
+
+    async def test_dispatch_concurrency(self, slack_client, event_router):
+        running = []
+        maximum = []
+
+        async def handler(event):
+            running.append(event)
+            maximum.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(event)
+
+        event_router.register("hello", handler)
+        errors = [
+            error
+            async for error in slack_client.dispatch(
+                _incoming(*["hello"] * 10), event_router, concurrency=3
+            )
+        ]
+
+        assert errors == []
+        assert len(maximum) == 10
+        assert max(maximum) == 3
+
+    async def test_dispatch_backpressure(self, slack_client, event_router):
+        consumed = []
+        release = asyncio.Event()
+
+        async def incoming():
+            async for event in _incoming(*["hello"] * 10):
+                consumed.append(event)
+                yield event
+
+        async def handler(event):
+            await release.wait()
+
+        event_router.register("hello", handler)
+        errors = slack_client.dispatch(
+            incoming(), event_router, concurrency=2, backlog=3
+        )
+        task = asyncio.ensure_future(errors.__anext__())
+        await asyncio.sleep(0.05)
+
+        assert len(consumed) == 2 + 3 + 1
+        release.set()
+        with pytest.raises(StopAsyncIteration):
+            await task
+        assert len(consumed) == 10
+
+    async def test_dispatch_incoming_error(self, slack_client, event_router):
+        async def incoming():
+            yield slack.events.Event({"type": "hello"})
+            raise exceptions.SlackAPIError("error", {}, {})
+
+        event_router.register("hello", lambda event: None)
+        with pytest.raises(exceptions.SlackAPIError):
+            async for _ in slack_client.dispatch(incoming(), event_router):
+                pass
+
 
 class TestNoAsync:
+    @pytest.mark.parametrize(
+        "slack_client",
+        (
+            {
+                "client": SlackAPIRequest,
+                "client_parameters": {"cache": cache.ResponseCache()},
+            },
+        ),
+        indirect=True,
+    )
+    def test_query_cache(self, slack_client):
+        slack_client.query(methods.USERS_INFO, {"user": "U0"})
+        slack_client.query(methods.USERS_INFO, {"user": "U0"})
+        assert slack_client._request.call_count == 1
+
+        slack_client.invalidate(methods.USERS_INFO)
+        slack_client.query(methods.USERS_INFO, {"user": "U0"})
+        assert slack_client._request.call_count == 2
+
     @pytest.mark.parametrize(
         "slack_client", ({"client": SlackAPIRequest},), indirect=True
     )
@@ -269,6 +1238,100 @@ class TestNoAsync:
         slack_client.query("https://hooks.slack.com/abcdef", headers=custom_headers)
         assert slack_client._request.call_args[0][2] == called_headers
 
+    @pytest.mark.parametrize(
+        "slack_client",
+        (
+            {
+                "client": SlackAPIRequest,
+                "client_parameters": {"rate_limiter": ratelimit.RateLimiter()},
+            },
+        ),
+        indirect=True,
+    )
+    def test_query_rate_limiter(self, slack_client):
+        slack_client.sleep = asynctest.Mock()
+
+        slack_client.query(methods.RTM_CONNECT)
+        assert slack_client.sleep.call_count == 0
+
+        slack_client.query(methods.RTM_CONNECT)
+        assert slack_client.sleep.call_count == 1
+        assert 60 >= slack_client.sleep.call_args[0][0] > 59
+
+    @pytest.mark.parametrize(
+        "slack_client", ({"client": SlackAPIRequest},), indirect=True
+    )
+    @pytest.mark.parametrize("ordered", (True, False))
+    def test_query_many(self, slack_client, ordered):
+        lock = threading.Lock()
+        in_flight = []
+        max_in_flight = 0
+
+        def _request(method, url, headers, body):
+            nonlocal max_in_flight
+            with lock:
+                in_flight.append(body["user"])
+                max_in_flight = max(max_in_flight, len(in_flight))
+            time.sleep(0.1 if body["user"] == 0 else 0.02)
+            with lock:
+                in_flight.remove(body["user"])
+            if body["user"] == 2:
+                return 500, b'{"ok": false}', {"content-type": "application/json"}
+            return 200, b'{"ok": true}', {"content-type": "application/json"}
+
+        slack_client._request = _request
+        queries = [(methods.USERS_INFO, {"user": user}) for user in range(4)]
+        results = list(slack_client.query_many(queries, concurrency=2, ordered=ordered))
+
+        assert max_in_flight == 2
+        if ordered:
+            assert [result.index for result in results] == [0, 1, 2, 3]
+        else:
+            assert [result.index for result in results] == [1, 2, 3, 0]
+
+        for result in results:
+            if result.index == 2:
+                assert isinstance(result.error, exceptions.HTTPException)
+            else:
+                assert result.response == {"ok": True}
+
+    @pytest.mark.parametrize(
+        "slack_client", ({"client": SlackAPIRequest},), indirect=True
+    )
+    def test_query_many_json(self, slack_client):
+        queries = [(methods.USERS_INFO, {"user": "U0"})]
+        results = list(slack_client.query_many(queries, as_json=True))
+
+        assert results[0].response == {"ok": True}
+        _, _, headers, body = slack_client._request.call_args[0]
+        assert headers["Content-type"].startswith("application/json")
+        assert json.loads(body) == {"user": "U0"}
+
+    @pytest.mark.parametrize(
+        "slack_client",
+        (
+            {
+                "client": SlackAPIRequest,
+                "status": [200, 502, 200],
+                "body": ["channels_iter", {"ok": False}, "channels"],
+                "client_parameters": {"retry_policy": retry.RetryPolicy()},
+            },
+        ),
+        indirect=True,
+    )
+    def test_iter_retry(self, slack_client, token, itercursor):
+        slack_client.sleep = asynctest.Mock()
+
+        channels = 0
+        for _ in slack_client.iter(methods.CHANNELS_LIST):  # noQa: F841
+            channels += 1
+
+        assert channels == 4
+        assert slack_client._request.call_count == 3
+        assert slack_client.sleep.call_count == 1
+        for call in slack_client._request.call_args_list[1:]:
+            assert call[0][3] == {"limit": 200, "token": token, "cursor": itercursor}
+
     @pytest.mark.parametrize(
         "slack_client",
         ({"client": SlackAPIRequest, "body": ["channels_iter", "channels"]},),
@@ -288,6 +1351,217 @@ class TestNoAsync:
             {"limit": 200, "token": token, "cursor": itercursor},
         )
 
+    @pytest.mark.parametrize(
+        "slack_client",
+        (
+            {
+                "client": SlackAPIRequest,
+                "body": ["channels_iter", "channels_iter", "channels"],
+            },
+        ),
+        indirect=True,
+    )
+    def test_iter_prefetch(self, slack_client, token, itercursor):
+        channels = 0
+        for _ in slack_client.iter(methods.CHANNELS_LIST, prefetch=1):  # noQa: F841
+            channels += 1
+
+        assert channels == 6
+        assert slack_client._request.call_count == 3
+        slack_client._request.assert_called_with(
+            "POST",
+            "https://slack.com/api/channels.list",
+            {},
+            {"limit": 200, "token": token, "cursor": itercursor},
+        )
+
+    @pytest.mark.parametrize(
+        "slack_client",
+        (
+            {
+                "client": SlackAPIRequest,
+                "body": ["channels_iter", {"ok": False}],
+                "status": [200, 500],
+            },
+        ),
+        indirect=True,
+    )
+    def test_iter_prefetch_error(self, slack_client):
+        channels = 0
+        with pytest.raises(exceptions.HTTPException):
+            for _ in slack_client.iter(methods.CHANNELS_LIST, prefetch=2):  # noQa: F841
+                channels += 1
+
+        assert channels == 2
+
+    @pytest.mark.parametrize(
+        "slack_client", ({"client": SlackAPIRequest},), indirect=True
+    )
+    def test_iter_stream(self, slack_client, token, fake_responses):
+        responses = fake_responses.pages(3)
+        slack_client._request_chunks = responses.request_chunks_sync
+
+        channels = list(slack_client.iter(methods.CHANNELS_LIST, stream=True))
+
+        assert channels == [{"id": 0}, {"id": 1}, {"id": 2}]
+        assert responses.calls[-1][3] == {"limit": 200, "token": token, "cursor": "2"}
+
+    @pytest.mark.parametrize(
+        "slack_client", ({"client": SlackAPIRequest},), indirect=True
+    )
+    def test_iter_stream_error(self, slack_client, fake_responses):
+        slack_client._request_chunks = fake_responses(
+            [(500, {"ok": False})]
+        ).request_chunks_sync
+
+        with pytest.raises(exceptions.HTTPException):
+            list(slack_client.iter(methods.CHANNELS_LIST, stream=True))
+
+    @pytest.mark.parametrize(
+        "slack_client",
+        (
+            {
+                "client": SlackAPIRequest,
+                "body": ["channels_iter", "channels_iter", "channels"],
+            },
+        ),
+        indirect=True,
+    )
+    def test_iter_checkpoint(self, slack_client, token, itercursor, tmpdir):
+        store = checkpoint.FileCheckpointStore(str(tmpdir))
+        for index, _ in enumerate(
+            slack_client.iter(methods.CHANNELS_LIST, store=store)
+        ):
+            if index == 2:
+                break
+
+        state = store.load(checkpoint.IterState(methods.CHANNELS_LIST).key)
+        assert state.itervalue == itercursor
+
+        channels = list(slack_client.iter(methods.CHANNELS_LIST, store=store))
+        assert len(channels) == 2
+        assert slack_client._request.call_args[0][3]["cursor"] == itercursor
+        assert store.load(state.key) is None
+
+    @pytest.mark.parametrize(
+        "slack_client", ({"client": SlackAPIRequest},), indirect=True
+    )
+    def test_iter_timeline(self, slack_client, fake_timeline):
+        history = fake_timeline(101, sync=True)
+        slack_client._request = history.request
+
+        messages = [
+            message["ts"]
+            for message in slack_client.iter_timeline(
+                methods.CONVERSATIONS_HISTORY,
+                {"channel": "C00000001"},
+                oldest="999",
+                limit=7,
+                slices=3,
+            )
+        ]
+
+        assert messages == history.timestamps[::-1]
+        assert "cursor" in history.requests[-1]
+
+    @pytest.mark.parametrize(
+        "slack_client", ({"client": SlackAPIRequest},), indirect=True
+    )
+    def test_harvest(self, slack_client, fake_history):
+        slack_client._request = fake_history(pages=3)
+        channels = [f"C{index}" for index in range(10)]
+        progress = []
+
+        items = list(
+            slack_client.harvest(
+                methods.CONVERSATIONS_HISTORY,
+                channels,
+                concurrency=3,
+                max_active=4,
+                on_progress=progress.append,
+            )
+        )
+
+        assert len(items) == 30
+        for channel in channels:
+            assert [i.item["page"] for i in items if i.channel == channel] == [0, 1, 2]
+        assert len(progress) == 30
+        assert all(p.error is None for p in progress)
+
+    @pytest.mark.parametrize(
+        "slack_client", ({"client": SlackAPIRequest},), indirect=True
+    )
+    def test_harvest_error(self, slack_client, fake_history):
+        history = fake_history(pages=2)
+
+        def _request(method, url, headers, body):
+            if body["channel"] == "C1":
+                return 500, b"", {}
+            return history(method, url, headers, body)
+
+        slack_client._request = _request
+        progress = []
+
+        items = list(
+            slack_client.harvest(
+                methods.CONVERSATIONS_HISTORY,
+                ["C0", "C1", "C2"],
+                on_progress=progress.append,
+            )
+        )
+
+        assert len(items) == 4
+        errors = [p for p in progress if p.error]
+        assert [p.channel for p in errors] == ["C1"]
+        assert isinstance(errors[0].error, exceptions.HTTPException)
+
+    @pytest.mark.parametrize(
+        "slack_client",
+        ({"client": SlackAPIRequest, "body": ["users_iter", "users", "channels"]},),
+        indirect=True,
+    )
+    def test_warm_directory(self, slack_client):
+        directory = Directory()
+        assert slack_client.warm_directory(directory) is directory
+
+        assert directory.user("W012A3CDE")["name"] == "spengler"
+        assert directory.channel_by_name("fun") is not None
+        assert slack_client._request.call_count == 3
+
+    @pytest.mark.parametrize(
+        "slack_client", ({"client": SlackAPIRequest},), indirect=True
+    )
+    def test_iter_many(self, slack_client, fake_history):
+        slack_client._request = fake_history(pages=3)
+
+        iterations = [
+            (methods.CONVERSATIONS_HISTORY, {"channel": channel})
+            for channel in ("C1", "C2", "C3")
+        ]
+        items = list(slack_client.iter_many(iterations, concurrency=2))
+
+        assert len(items) == 9
+        for index, channel in enumerate(("C1", "C2", "C3")):
+            assert [item for i, item in items if i == index] == [
+                {"channel": channel, "page": page} for page in range(3)
+            ]
+
+    @pytest.mark.parametrize(
+        "slack_client", ({"client": SlackAPIRequest},), indirect=True
+    )
+    def test_iter_many_stop(self, slack_client, fake_history):
+        slack_client._request = fake_history(pages=100)
+        threads = threading.active_count()
+
+        iterations = [
+            (methods.CONVERSATIONS_HISTORY, {"channel": channel})
+            for channel in ("C1", "C2", "C3")
+        ]
+        for _ in slack_client.iter_many(iterations, concurrency=3):  # noQa: F841
+            break
+
+        assert threading.active_count() == threads
+
     @pytest.mark.parametrize(
         "slack_client",
         ({"client": SlackAPIRequest, "body": ["channels_iter", "channels"]},),
@@ -331,6 +1605,22 @@ class TestNoAsync:
         bot_id = slack_client._find_bot_id()
         assert bot_id == "B0AAA0A00"
 
+    @pytest.mark.parametrize(
+        "slack_client",
+        (
+            {
+                "client": SlackAPIRequest,
+                "body": ["auth_test", "users_info"],
+                "client_parameters": {"bootstrap_cache": cache.ResponseCache()},
+            },
+        ),
+        indirect=True,
+    )
+    def test_find_bot_id_cached(self, slack_client):
+        assert slack_client._find_bot_id() == "B0AAA0A00"
+        assert slack_client._find_bot_id() == "B0AAA0A00"
+        assert slack_client._request.call_count == 2
+
     @pytest.mark.parametrize(
         "slack_client",
         ({"client": SlackAPIRequest, "body": "rtm_connect"},),
@@ -418,6 +1708,41 @@ class TestRequest:
             > datetime.timedelta(seconds=delay)
         )
 
+    def test_create_session(self):
+        session = create_session(pool_maxsize=20, pool_block=True, max_retries=3)
+        adapter = session.get_adapter("https://slack.com/api/auth.test")
+        assert adapter._pool_maxsize == 20
+        assert adapter._pool_block is True
+        assert adapter.max_retries.total == 3
+        assert "socket_options" not in adapter.poolmanager.connection_pool_kw
+
+    def test_create_session_tcp_keepalive(self):
+        session = create_session(tcp_keepalive=30)
+        adapter = session.get_adapter("https://slack.com/api/auth.test")
+        socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+
+    def test_pool_stats(self, token):
+        slack_client = SlackAPIRequest(
+            session=create_session(pool_maxsize=4), token=token
+        )
+        assert slack_client.pool_stats() == []
+
+        adapter = slack_client._session.get_adapter("https://slack.com/api/auth.test")
+        pool = adapter.poolmanager.connection_from_url("https://slack.com/api")
+        connection = pool._get_conn()
+
+        stats = slack_client.pool_stats()
+        assert len(stats) == 1
+        assert stats[0].host == "slack.com"
+        assert stats[0].scheme == "https"
+        assert stats[0].maxsize == 4
+        assert stats[0].in_use == 1
+        assert stats[0].num_connections == 1
+
+        pool._put_conn(connection)
+        assert slack_client.pool_stats()[0].in_use == 0
+
     def test__request(self, token):
         with requests.Session() as session:
             slack_client = SlackAPIRequest(session=session, token=token)
@@ -455,6 +1780,321 @@ class TestAiohttp:
         assert response[0] == 200
         assert response[1] == b'{"ok":false,"error":"invalid_auth"}'
 
+    @pytest.mark.asyncio
+    async def test_iter_prefetch(self, token, fake_responses):
+        responses = fake_responses.pages(3)
+        slack_client = SlackAPIAiohttp(session=responses.session(), token=token)
+        channels = [
+            item async for item in slack_client.iter(methods.CHANNELS_LIST, prefetch=1)
+        ]
+
+        assert channels == [{"id": 0}, {"id": 1}, {"id": 2}]
+        assert len(responses.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_iter_prefetch_break(self, token, fake_responses):
+        responses = fake_responses.pages(5)
+        slack_client = SlackAPIAiohttp(session=responses.session(), token=token)
+        async for item in slack_client.iter(methods.CHANNELS_LIST, prefetch=2):
+            break
+        await asyncio.sleep(0.05)
+
+        assert item == {"id": 0}
+        assert len(responses.calls) <= 4
+
+    @pytest.mark.asyncio
+    async def test_iter_stream(self, token, fake_responses):
+        responses = fake_responses.pages(3)
+        slack_client = SlackAPIAiohttp(session=responses.session(), token=token)
+        channels = [
+            item async for item in slack_client.iter(methods.CHANNELS_LIST, stream=True)
+        ]
+
+        assert channels == [{"id": 0}, {"id": 1}, {"id": 2}]
+        assert responses.calls[-1][3]["cursor"] == "2"
+
+    @pytest.mark.asyncio
+    async def test_query_many_break(self, token, fake_users_info):
+        slack_client = SlackAPIAiohttp(session=None, token=token)
+        slack_client._request = fake_users_info()
+        queries = [(methods.USERS_INFO, {"user": f"U{i}"}) for i in range(10)]
+        async for result in slack_client.query_many(queries, concurrency=3):
+            break
+        await asyncio.sleep(0.05)
+
+        assert result.response["ok"]
+        assert len(slack_client._request.calls) <= 4
+
+    @pytest.mark.asyncio
+    async def test_harvest_break(self, token, fake_history):
+        history = fake_history(pages=2)
+
+        async def _request(*args):
+            await asyncio.sleep(0)
+            return history(*args)
+
+        slack_client = SlackAPIAiohttp(session=None, token=token)
+        slack_client._request = _request
+        async for item in slack_client.harvest(
+            methods.CONVERSATIONS_HISTORY, ["C0", "C1", "C2"], concurrency=2
+        ):
+            break
+        await asyncio.sleep(0.05)
+
+        assert item.channel in ("C0", "C1", "C2")
+
+    @pytest.mark.asyncio
+    async def test_query_coalesce(self, token, fake_users_info):
+        slack_client = SlackAPIAiohttp(session=None, token=token, coalesce=True)
+        slack_client._request = fake_users_info()
+        responses = await asyncio.gather(
+            *(slack_client.query(methods.USERS_INFO, {"user": "U0"}) for _ in range(3))
+        )
+
+        assert slack_client._request.calls == ["U0"]
+        assert all(response["user"]["id"] == "U0" for response in responses)
+        assert responses[0] is not responses[1]
+
+    @pytest.mark.asyncio
+    async def test_dispatch_timeout(self, token):
+        async def handler(event):
+            await asyncio.sleep(1)
+
+        async def handler_fast(event):
+            await asyncio.sleep(0)
+
+        router = slack.events.EventRouter()
+        router.register("hello", handler)
+        router.register("pong", handler_fast)
+        slack_client = SlackAPIAiohttp(session=None, token=token)
+        errors = [
+            error
+            async for error in slack_client.dispatch(
+                _incoming("hello", "pong"), router, timeout=0.05
+            )
+        ]
+
+        assert len(errors) == 1
+        assert errors[0].handler is handler
+        assert isinstance(errors[0].error, TimeoutError)
+
+    @pytest.mark.asyncio
+    async def test_rtm_standby_error(self, token):
+        async def rtm(url):
+            yield json.dumps({"type": "hello"})
+            raise ConnectionError()
+
+        slack_client = SlackAPIAiohttp(session=None, token=token)
+        slack_client._rtm = rtm
+        delivered = []
+        with pytest.raises(ConnectionError):
+            async for event in slack_client.rtm("wss://0", "B0", standby=True):
+                delivered.append(event["type"])
+
+        assert delivered == ["hello"]
+
+
+class TestRTMEngine:
+    def test_frames(self, fake_websocket):
+        engine = RTMEngine()
+        ws = fake_websocket()
+        connection = engine.add(ws, "wss://0")
+        ws.push('{"type": "hello"}', '{"type": "message", "ts": "1"}')
+
+        assert connection.frames.get(timeout=1) == (connection, '{"type": "hello"}')
+        assert connection.frames.get(timeout=1)[1] == '{"type": "message", "ts": "1"}'
+
+        engine.close(connection)
+        assert connection.frames.get(timeout=1) == (connection, None)
+        assert ws.closed
+
+    def test_connections_one_thread(self, fake_websocket):
+        engine = RTMEngine()
+        frames = queue.Queue()
+        sockets = [fake_websocket() for _ in range(3)]
+        connections = [
+            engine.add(ws, f"wss://{i}", frames) for i, ws in enumerate(sockets)
+        ]
+        thread = engine._thread
+
+        for index, ws in enumerate(sockets):
+            ws.push(str(index))
+        received = {frames.get(timeout=1) for _ in sockets}
+
+        assert received == {
+            (connection, str(i)) for i, connection in enumerate(connections)
+        }
+        assert engine._thread is thread
+        assert len(engine) == 3
+        engine.stop()
+
+    def test_partial_frame(self, fake_websocket):
+        engine = RTMEngine()
+        frames = queue.Queue()
+        sock, remote = socket.socketpair()
+        stalled = websocket.WebSocket()
+        stalled.sock, stalled.connected = sock, True
+        slow = engine.add(stalled, "wss://0", frames)
+        ws = fake_websocket()
+        fast = engine.add(ws, "wss://1", frames)
+
+        frame = websocket.ABNF(
+            fin=1, opcode=websocket.ABNF.OPCODE_TEXT, mask=0, data=b'{"type": "hello"}'
+        ).format()
+        remote.sendall(frame[:5])
+        time.sleep(0.05)
+        ws.push("1")
+        assert frames.get(timeout=1) == (fast, "1")
+
+        remote.sendall(frame[5:])
+        assert frames.get(timeout=1) == (slow, '{"type": "hello"}')
+        engine.stop()
+        remote.close()
+
+    def test_codec(self, fake_websocket, recording_codec):
+        engine = RTMEngine(ping_interval=0, poll_interval=0.01)
+        ws = fake_websocket()
+        connection = engine.add(ws, "wss://0", codec=recording_codec)
+        _wait_for(lambda: ws.sent)
+        ws.push('{"type": "pong", "reply_to": 1}', '{"type": "hello"}')
+
+        assert connection.frames.get(timeout=1)[1] == '{"type": "hello"}'
+        assert recording_codec.dumped[0] == {"id": 1, "type": "ping"}
+        assert '{"type": "pong", "reply_to": 1}' in recording_codec.loaded
+        engine.stop()
+
+    def test_remote_close(self, fake_websocket):
+        engine = RTMEngine()
+        ws = fake_websocket()
+        connection = engine.add(ws)
+        thread = engine._thread
+        ws.remote.close()
+
+        assert list(connection) == []
+        thread.join(1)
+        assert not thread.is_alive()
+        assert len(engine) == 0
+
+    def test_bounded(self, fake_websocket):
+        engine = RTMEngine(buffer=1)
+        ws = fake_websocket()
+        connection = engine.add(ws)
+        ws.push("0", "1", "2")
+
+        assert [connection.frames.get(timeout=1)[1] for _ in range(3)] == [
+            "0",
+            "1",
+            "2",
+        ]
+        engine.close(connection)
+
+    def test_control_frames(self, fake_websocket):
+        engine = RTMEngine()
+        frames = queue.Queue()
+        idle, busy = fake_websocket(), fake_websocket()
+        idle_connection = engine.add(idle, "wss://0", frames)
+        engine.add(busy, "wss://1", frames)
+
+        idle.push("PING")
+        time.sleep(0.05)
+        busy.push("0")
+        start = time.monotonic()
+
+        assert frames.get(timeout=1)[1] == "0"
+        assert time.monotonic() - start < 0.5
+        assert not idle.closed
+
+        idle.push("CLOSE")
+        assert frames.get(timeout=1) == (idle_connection, None)
+        engine.stop()
+
+    def test_full_queue(self, fake_websocket):
+        engine = RTMEngine(buffer=1)
+        slow, fast = fake_websocket(), fake_websocket()
+        slow_connection = engine.add(slow)
+        fast_connection = engine.add(fast)
+
+        slow.push("0", "1", "2")
+        _wait_for(lambda: slow_connection.backlog)
+        fast.push("a")
+
+        assert fast_connection.frames.get(timeout=0.5)[1] == "a"
+        assert [slow_connection.frames.get(timeout=1)[1] for _ in range(3)] == [
+            "0",
+            "1",
+            "2",
+        ]
+        engine.stop()
+
+    def test_ping(self, fake_websocket):
+        engine = RTMEngine(ping_interval=0.05, ping_timeout=0.5, poll_interval=0.01)
+        ws = fake_websocket()
+        connection = engine.add(ws)
+
+        _wait_for(lambda: ws.sent)
+        assert json.loads(ws.sent[0]) == {"id": 1, "type": "ping"}
+
+        ws.push('{"type": "pong", "reply_to": 1}', "0")
+        assert connection.frames.get(timeout=1)[1] == "0"
+        assert connection.ping_sent is None
+        engine.close(connection)
+
+    def test_ping_timeout(self, fake_websocket):
+        engine = RTMEngine(ping_interval=0.02, ping_timeout=0.05, poll_interval=0.01)
+        ws = fake_websocket()
+        connection = engine.add(ws)
+
+        assert connection.frames.get(timeout=1) == (connection, None)
+        assert ws.sent
+        assert ws.closed
+
+    def test_rtm(self, token, fake_websocket):
+        engine = RTMEngine()
+        ws = fake_websocket()
+        engine.connect = lambda url, codec: engine.add(ws, url, None, codec)
+        slack_client = SlackAPIRequest(token=token, rtm_engine=engine)
+        ws.push(
+            '{"type": "hello"}',
+            '{"type": "message", "channel": "C0", "bot_id": "B0", "ts": "1"}',
+            '{"type": "message", "channel": "C0", "ts": "2"}',
+        )
+
+        incoming = slack_client.rtm("wss://0", "B0")
+        assert next(incoming)["type"] == "hello"
+        assert next(incoming)["ts"] == "2"
+        incoming.close()
+
+        _wait_for(lambda: ws.closed)
+
+    def test_rtm_standby(self, token, fake_websocket):
+        engine = RTMEngine()
+        sockets = [fake_websocket(), fake_websocket()]
+        opened = []
+
+        def connect(url, frames, codec):
+            opened.append(url)
+            return engine.add(sockets[len(opened) - 1], url, frames, codec)
+
+        engine.connect = connect
+        slack_client = SlackAPIRequest(token=token, rtm_engine=engine)
+        slack_client._find_rtm_url = lambda: "wss://1"
+        message = '{{"type": "message", "channel": "C0", "ts": "{}"}}'
+        sockets[0].push('{"type": "hello"}', message.format(1), '{"type": "goodbye"}')
+        sockets[0].push(message.format(2))
+        sockets[1].push('{"type": "hello"}', message.format(2), message.format(3))
+
+        delivered = []
+        incoming = slack_client.rtm("wss://0", "B0", standby=True)
+        for event in incoming:
+            delivered.append(event.get("ts", event["type"]))
+            if len(delivered) == 5:
+                break
+        incoming.close()
+
+        assert opened == ["wss://0", "wss://1"]
+        assert sorted(delivered) == ["1", "2", "3", "hello", "hello"]
+        _wait_for(lambda: all(ws.closed for ws in sockets))
+
 
 class TestTrio:
     def test_sleep(self, token):
@@ -484,6 +2124,152 @@ class TestTrio:
 
         assert trio.run(test_function) == (200, b'{"ok":false,"error":"invalid_auth"}')
 
+    def test_iter_prefetch(self, token, fake_responses):
+        async def test_function():
+            slack_client = SlackAPITrio(session=asks.Session(), token=token)
+            slack_client._request = fake_responses.pages(3, trio.sleep).request
+            return [
+                item
+                async for item in slack_client.iter(methods.CHANNELS_LIST, prefetch=1)
+            ]
+
+        assert trio.run(test_function) == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+    def test_iter_timeline(self, token, fake_timeline):
+        history = fake_timeline(50)
+
+        async def test_function():
+            slack_client = SlackAPITrio(session=asks.Session(), token=token)
+            slack_client._request = history.request
+            return [
+                message["ts"]
+                async for message in slack_client.iter_timeline(
+                    methods.CHANNELS_HISTORY, oldest="999", latest="1051", limit=5
+                )
+            ]
+
+        assert trio.run(test_function) == history.timestamps[::-1]
+
+    def test_harvest(self, token, fake_history):
+        history = fake_history(pages=2)
+
+        async def _request(*args):
+            await trio.sleep(0)
+            return history(*args)
+
+        async def test_function():
+            slack_client = SlackAPITrio(session=asks.Session(), token=token)
+            slack_client._request = _request
+            return [
+                item
+                async for item in slack_client.harvest(
+                    methods.CONVERSATIONS_HISTORY, ["C0", "C1", "C2"], concurrency=2
+                )
+            ]
+
+        items = trio.run(test_function)
+        assert sorted((item.channel, item.item["page"]) for item in items) == [
+            (channel, page) for channel in ("C0", "C1", "C2") for page in (0, 1)
+        ]
+
+    def test_query_coalesce(self, token, fake_users_info):
+        async def test_function():
+            slack_client = SlackAPITrio(
+                session=asks.Session(), token=token, coalesce=True
+            )
+            slack_client._request = fake_users_info(trio.sleep)
+            async with trio.open_nursery() as nursery:
+                for _ in range(3):
+                    nursery.start_soon(
+                        slack_client.query, methods.USERS_INFO, {"user": "U0"}
+                    )
+            return slack_client._request.calls
+
+        assert trio.run(test_function) == ["U0"]
+
+    def test_dispatch_timeout(self, token):
+        async def handler(event):
+            await trio.sleep(1)
+
+        async def handler_fast(event):
+            await trio.sleep(0)
+
+        async def test_function():
+            router = slack.events.EventRouter()
+            router.register("hello", handler)
+            router.register("pong", handler_fast)
+            slack_client = SlackAPITrio(session=asks.Session(), token=token)
+            return [
+                error
+                async for error in slack_client.dispatch(
+                    _incoming("hello", "pong"), router, timeout=0.05
+                )
+            ]
+
+        errors = trio.run(test_function)
+        assert len(errors) == 1
+        assert errors[0].handler is handler
+        assert isinstance(errors[0].error, TimeoutError)
+
+    def test_iter_prefetch_break(self, token, fake_responses):
+        async def test_function():
+            slack_client = SlackAPITrio(session=asks.Session(), token=token)
+            slack_client._request = fake_responses.pages(5, trio.sleep).request
+            async for item in slack_client.iter(methods.CHANNELS_LIST, prefetch=2):
+                break
+            await trio.sleep(0.05)
+            return item
+
+        assert trio.run(test_function) == {"id": 0}
+
+    def test_query_many_break(self, token, fake_users_info):
+        async def test_function():
+            slack_client = SlackAPITrio(session=asks.Session(), token=token)
+            slack_client._request = fake_users_info(trio.sleep)
+            queries = [(methods.USERS_INFO, {"user": f"U{i}"}) for i in range(10)]
+            async for response in slack_client.query_many(queries, concurrency=3):
+                break
+            await trio.sleep(0.05)
+            return response
+
+        assert trio.run(test_function).response["ok"]
+
+    def test_harvest_break(self, token, fake_history):
+        history = fake_history(pages=2)
+
+        async def _request(*args):
+            await trio.sleep(0)
+            return history(*args)
+
+        async def test_function():
+            slack_client = SlackAPITrio(session=asks.Session(), token=token)
+            slack_client._request = _request
+            async for item in slack_client.harvest(
+                methods.CONVERSATIONS_HISTORY, ["C0", "C1", "C2"], concurrency=2
+            ):
+                break
+            await trio.sleep(0.05)
+            return item
+
+        assert trio.run(test_function).channel in ("C0", "C1", "C2")
+
+    def test_dispatch_break(self, token):
+        async def handler(event):
+            raise ValueError(event["type"])
+
+        async def test_function():
+            router = slack.events.EventRouter()
+            router.register("hello", handler)
+            slack_client = SlackAPITrio(session=asks.Session(), token=token)
+            async for error in slack_client.dispatch(
+                _incoming("hello", "hello", "hello"), router
+            ):
+                break
+            await trio.sleep(0.05)
+            return error
+
+        assert isinstance(trio.run(test_function).error, ValueError)
+
 
 class TestCurio:
     def test_sleep(self, token):
@@ -512,3 +2298,65 @@ class TestCurio:
             return response[0], response[1]
 
         assert curio.run(test_function) == (200, b'{"ok":false,"error":"invalid_auth"}')
+
+    def test_iter_prefetch(self, token, fake_responses):
+        async def test_function():
+            slack_client = SlackAPICurio(session=asks.Session(), token=token)
+            slack_client._request = fake_responses.pages(3, curio.sleep).request
+            return [
+                item
+                async for item in slack_client.iter(methods.CHANNELS_LIST, prefetch=1)
+            ]
+
+        assert curio.run(test_function) == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+    def test_query_coalesce(self, token, fake_users_info):
+        async def test_function():
+            slack_client = SlackAPICurio(
+                session=asks.Session(), token=token, coalesce=True
+            )
+            slack_client._request = fake_users_info(curio.sleep)
+            async with curio.TaskGroup() as group:
+                for _ in range(3):
+                    await group.spawn(
+                        slack_client.query, methods.USERS_INFO, {"user": "U0"}
+                    )
+            return slack_client._request.calls
+
+        assert curio.run(test_function) == ["U0"]
+
+    def test_dispatch_timeout(self, token):
+        async def handler(event):
+            await curio.sleep(1)
+
+        async def handler_fast(event):
+            await curio.sleep(0)
+
+        async def test_function():
+            router = slack.events.EventRouter()
+            router.register("hello", handler)
+            router.register("pong", handler_fast)
+            slack_client = SlackAPICurio(session=asks.Session(), token=token)
+            return [
+                error
+                async for error in slack_client.dispatch(
+                    _incoming("hello", "pong"), router, timeout=0.05
+                )
+            ]
+
+        errors = curio.run(test_function)
+        assert len(errors) == 1
+        assert errors[0].handler is handler
+        assert isinstance(errors[0].error, TimeoutError)
+
+
+def _wait_for(condition, timeout=1):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+async def _incoming(*types):
+    for type_ in types:
+        yield slack.events.Event({"type": type_})
@@ -0,0 +1,81 @@
+import pytest
+from slack import methods, ratelimit
+
+
+class TestTokenBucket:
+    def test_reserve(self):
+        bucket = ratelimit.TokenBucket(rate=1, capacity=2, now=0)
+        assert bucket.reserve(now=0) == 0
+        assert bucket.reserve(now=0) == 0
+        assert bucket.reserve(now=0) == 1
+        assert bucket.reserve(now=0) == 2
+
+    def test_refill(self):
+        bucket = ratelimit.TokenBucket(rate=2, capacity=1, now=0)
+        assert bucket.reserve(now=0) == 0
+        assert bucket.reserve(now=0) == 0.5
+        assert bucket.reserve(now=10) == 0
+
+    def test_refill_capacity(self):
+        bucket = ratelimit.TokenBucket(rate=1, capacity=2, now=0)
+        bucket.reserve(now=100)
+        bucket.reserve(now=100)
+        assert bucket.reserve(now=100) == 1
+
+
+class TestRateLimiter:
+    def test_find_tier(self):
+        assert ratelimit.find_tier(methods.RTM_CONNECT) == 1
+        assert ratelimit.find_tier(methods.CHAT_POST_MESSAGE) == "special"
+        assert ratelimit.find_tier("https://slack.com/api/users.list") == 2
+        assert ratelimit.find_tier("https://hooks.slack.com/abcdef") is None
+
+    @pytest.mark.parametrize("tier", ratelimit.TIERS)
+    def test_methods_tiers(self, tier):
+        assert any(item.value.tier == tier for item in methods)
+
+    def test_reserve_tier(self, token):
+        limiter = ratelimit.RateLimiter()
+        url = methods.USERS_LIST.value.url
+        assert limiter.reserve(url, token, now=0) == 0
+        assert limiter.reserve(url, token, now=0) == pytest.approx(3)
+        assert limiter.reserve(url, token, now=0) == pytest.approx(6)
+
+    def test_reserve_per_method(self, token):
+        limiter = ratelimit.RateLimiter()
+        assert limiter.reserve(methods.USERS_LIST.value.url, token, now=0) == 0
+        assert limiter.reserve(methods.USERS_INFO.value.url, token, now=0) == 0
+
+    def test_reserve_per_token(self):
+        limiter = ratelimit.RateLimiter()
+        assert limiter.reserve(methods.USERS_LIST.value.url, "abc", now=0) == 0
+        assert limiter.reserve(methods.USERS_LIST.value.url, "def", now=0) == 0
+
+    def test_reserve_burst(self, token):
+        limiter = ratelimit.RateLimiter(burst=2)
+        url = methods.RTM_CONNECT.value.url
+        assert limiter.reserve(url, token, now=0) == 0
+        assert limiter.reserve(url, token, now=0) == 0
+        assert limiter.reserve(url, token, now=0) == pytest.approx(60)
+
+    def test_reserve_custom_tiers(self, token):
+        limiter = ratelimit.RateLimiter(tiers={2: 60})
+        url = methods.USERS_LIST.value.url
+        limiter.reserve(url, token, now=0)
+        assert limiter.reserve(url, token, now=0) == pytest.approx(1)
+
+    def test_reserve_unknown_url(self, token):
+        limiter = ratelimit.RateLimiter()
+        url = "https://hooks.slack.com/abcdef"
+        assert limiter.reserve(url, token, now=0) == 0
+        assert limiter.reserve(url, token, now=0) == 0
+
+    def test_reserve_token_rate(self, token):
+        limiter = ratelimit.RateLimiter(token_rate=30)
+        assert limiter.reserve(methods.USERS_LIST.value.url, token, now=0) == 0
+        assert limiter.reserve(
+            methods.USERS_INFO.value.url, token, now=0
+        ) == pytest.approx(2)
+        assert limiter.reserve(
+            "https://hooks.slack.com/abcdef", token, now=0
+        ) == pytest.approx(4)
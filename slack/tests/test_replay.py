@@ -0,0 +1,42 @@
+import pytest
+from slack import replay
+
+
+class TestReplayCache:
+    def test_add(self):
+        cache = replay.ReplayCache()
+        assert cache.add("a", expires_at=10, now=0) is True
+        assert cache.add("a", expires_at=10, now=5) is False
+        assert cache.add("b", expires_at=10, now=5) is True
+        assert len(cache) == 2
+
+    def test_expire(self):
+        cache = replay.ReplayCache()
+        cache.add("a", expires_at=10, now=0)
+        cache.add("b", expires_at=20, now=0)
+
+        assert cache.add("c", expires_at=30, now=15) is True
+        assert len(cache) == 2
+        assert cache.add("a", expires_at=40, now=15) is True
+
+    def test_expire_out_of_order(self):
+        cache = replay.ReplayCache()
+        cache.add("a", expires_at=20, now=0)
+        cache.add("b", expires_at=10, now=0)
+
+        assert cache.add("b", expires_at=30, now=15) is True
+        assert cache.add("b", expires_at=30, now=16) is False
+
+    def test_maxsize(self):
+        cache = replay.ReplayCache(maxsize=2)
+        cache.add("a", expires_at=10, now=0)
+        cache.add("b", expires_at=10, now=0)
+        cache.add("c", expires_at=10, now=0)
+
+        assert len(cache) == 2
+        assert cache.add("a", expires_at=10, now=0) is True
+        assert cache.add("c", expires_at=10, now=0) is False
+
+    def test_abstract(self):
+        with pytest.raises(NotImplementedError):
+            replay.AbstractReplayCache().add("a", 10)
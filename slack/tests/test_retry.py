@@ -0,0 +1,41 @@
+import pytest
+from slack import retry, exceptions
+
+
+class TestRetryPolicy:
+    def test_rate_limited(self):
+        policy = retry.RetryPolicy()
+        exc = exceptions.RateLimited(12, "ratelimited", 429, {}, {})
+        assert policy.delay(1, exc) == 12
+
+    @pytest.mark.parametrize("status", retry.RETRY_STATUSES)
+    def test_server_error(self, status):
+        policy = retry.RetryPolicy(backoff=1, jitter=False)
+        exc = exceptions.HTTPException(status, {}, {})
+        assert policy.delay(1, exc) == 1
+        assert policy.delay(2, exc) == 2
+        assert policy.delay(3, exc) == 4
+
+    def test_server_error_max_backoff(self):
+        policy = retry.RetryPolicy(
+            backoff=1, max_backoff=3, max_attempts=10, jitter=False
+        )
+        exc = exceptions.HTTPException(500, {}, {})
+        assert policy.delay(8, exc) == 3
+
+    def test_server_error_jitter(self):
+        policy = retry.RetryPolicy(backoff=1)
+        exc = exceptions.HTTPException(500, {}, {})
+        for _ in range(100):
+            assert 0 <= policy.delay(3, exc) <= 4
+
+    def test_client_error(self):
+        policy = retry.RetryPolicy()
+        exc = exceptions.HTTPException(400, {}, {})
+        assert policy.delay(1, exc) is None
+
+    def test_max_attempts(self):
+        policy = retry.RetryPolicy(max_attempts=2)
+        exc = exceptions.RateLimited(12, "ratelimited", 429, {}, {})
+        assert policy.delay(1, exc) == 12
+        assert policy.delay(2, exc) is None
@@ -4,9 +4,15 @@ import logging
 
 import mock
 import pytest
-from slack import sansio, methods, exceptions
+from slack import replay, sansio, methods, exceptions
 from slack.events import Event
 
+SIGNED_BODY = """{"token":"abcdefghijkl","team_id":"T000000","api_app_id":"A000000","event":{},"type":"event_callback","authed_teams":["T000000"],"event_id":"AAAAAAA","event_time":1111111111}"""
+SIGNED_HEADERS = {
+    "X-Slack-Request-Timestamp": "1534688291",
+    "X-Slack-Signature": "v0=ac720e09cb1ecb0baa17bea5638fa3d11fc177576dd364e05475d6dbc620c696",
+}
+
 
 class TestRequest:
     def test_prepare_request(self, token):
@@ -88,6 +94,13 @@ class TestRequest:
         assert "Content-type" in headers
         assert headers["Content-type"] == "application/json; charset=utf-8"
 
+    def test_prepare_request_codec(self, token, recording_codec):
+        _, body, _ = sansio.prepare_request(
+            methods.AUTH_TEST, {"foo": "bar"}, {}, {}, token, codec=recording_codec
+        )
+        assert body == '{"foo": "bar"}'
+        assert recording_codec.dumped == [{"foo": "bar"}]
+
     def test_prepare_request_body_message(self, token, slack_message):
 
         msg = Event.from_http(slack_message)
@@ -343,6 +356,49 @@ class TestResponse:
         decoded_body = sansio.decode_body(headers, body)
         assert decoded_body == {"test-string": "hello", "test-bool": True}
 
+    def test_decode_body_codec(self, recording_codec):
+        body = b'{"test-string":"hello"}'
+        headers = {"content-type": "application/json; charset=utf-8"}
+        decoded_body = sansio.decode_body(headers, body, recording_codec)
+        assert decoded_body == {"test-string": "hello"}
+        assert recording_codec.loaded == [body]
+
+    def test_decode_body_codec_charset(self, recording_codec):
+        body = '{"test-string":"h\xe9llo"}'.encode("latin-1")
+        headers = {"content-type": "application/json; charset=latin-1"}
+        decoded_body = sansio.decode_body(headers, body, recording_codec)
+        assert decoded_body == {"test-string": "h\xe9llo"}
+        assert recording_codec.loaded == ['{"test-string":"h\xe9llo"}']
+
+    @pytest.mark.parametrize(
+        "content_type,result",
+        (
+            ("application/json", ("application/json", "utf-8")),
+            ("application/json; charset=utf-8", ("application/json", "utf-8")),
+            ("application/json;charset=ISO-8859-1", ("application/json", "ISO-8859-1")),
+            ('text/plain; charset="latin-1"', ("text/plain", "latin-1")),
+            ("Text/HTML; foo=bar; Charset=ascii", ("text/html", "ascii")),
+            ("text/plain; charset=", ("text/plain", "utf-8")),
+            ("text/plain;", ("text/plain", "utf-8")),
+        ),
+    )
+    def test_parse_content_type(self, content_type, result):
+        assert sansio.parse_content_type({"content-type": content_type}) == result
+
+    def test_parse_content_type_no_header(self):
+        assert sansio.parse_content_type({}) == (None, "utf-8")
+        assert sansio.parse_content_type({"content-type": ""}) == (None, "utf-8")
+
+    def test_parse_content_type_cached(self):
+        sansio._parse_content_type_header.cache_clear()
+        headers = {"content-type": "application/json; charset=utf-8"}
+        sansio.parse_content_type(headers)
+        sansio.parse_content_type(headers)
+
+        cache = sansio._parse_content_type_header.cache_info()
+        assert cache.misses == 1
+        assert cache.hits == 1
+
     def test_decode_response(self):
         headers = {"content-type": "application/json; charset=utf-8"}
         data = b'{"ok": true, "hello": "world"}'
@@ -373,6 +429,43 @@ class TestResponse:
         next_ = sansio.decode_iter_request(data)
         assert next_ == latest
 
+    def test_decode_iter_request_timeline_no_latest(self):
+        data = {"has_more": True, "messages": [{"ts": "2.000000"}, {"ts": "1.000000"}]}
+        assert sansio.decode_iter_request(data) == "1.000000"
+
+        data = {"has_more": False, "messages": [{"ts": "1.000000"}]}
+        assert sansio.decode_iter_request(data) is None
+
+    def test_split_timeline(self):
+        windows = sansio.split_timeline("100", 103, 3)
+        assert windows == [
+            ("101.999999", "103.000000"),
+            ("100.999999", "102.000000"),
+            ("100.000000", "101.000000"),
+        ]
+
+    def test_split_timeline_disjoint(self):
+        windows = sansio.split_timeline("1534688291.000010", "1534688291.000050", 7)
+        covered = []
+        for microsecond in range(0, 60):
+            timestamp = 1534688291 + microsecond / 1000000
+            covered.append(
+                sum(float(old) < timestamp < float(new) for old, new in windows)
+            )
+
+        assert covered == [0] * 11 + [1] * 39 + [0] * 10
+
+    def test_split_timeline_small(self):
+        windows = sansio.split_timeline("100.000000", "100.000002", 10)
+        assert windows == [("100.000000", "100.000002")]
+
+    @pytest.mark.parametrize(
+        "oldest, latest, slices", ((2, 1, 4), (1, 1, 4), (1, 2, 0))
+    )
+    def test_split_timeline_invalid(self, oldest, latest, slices):
+        with pytest.raises(ValueError):
+            sansio.split_timeline(oldest, latest, slices)
+
     @mock.patch("time.time", mock.MagicMock(return_value=1534688291))
     def test_validate_request_signature_ok(self):
         headers = {
@@ -410,6 +503,70 @@ class TestResponse:
                 body=body, headers=headers, signing_secret="mysupersecret"
             )
 
+    @pytest.mark.parametrize(
+        "body",
+        (
+            SIGNED_BODY.encode("utf-8"),
+            bytearray(SIGNED_BODY.encode("utf-8")),
+            memoryview(SIGNED_BODY.encode("utf-8")),
+            [SIGNED_BODY[:20].encode("utf-8"), SIGNED_BODY[20:].encode("utf-8")],
+        ),
+        ids=("bytes", "bytearray", "memoryview", "chunks"),
+    )
+    @mock.patch("time.time", mock.MagicMock(return_value=1534688291))
+    def test_validate_request_signature_bytes(self, body):
+        sansio.validate_request_signature(
+            body=body, headers=SIGNED_HEADERS, signing_secret=b"mysupersecret"
+        )
+
+    @mock.patch("time.time", mock.MagicMock(return_value=1534688291))
+    def test_signature_validator_reuse(self):
+        validator = sansio.SignatureValidator("mysupersecret")
+        for _ in range(3):
+            validator.validate(SIGNED_BODY.encode("utf-8"), SIGNED_HEADERS)
+
+        with pytest.raises(exceptions.InvalidSlackSignature):
+            validator.validate(b"{}", SIGNED_HEADERS)
+
+        validator.validate(SIGNED_BODY, SIGNED_HEADERS)
+
+    def test_signature_validator_max_age(self):
+        validator = sansio.SignatureValidator("mysupersecret", max_age=60)
+        with mock.patch("time.time", mock.MagicMock(return_value=1534688291 + 61)):
+            with pytest.raises(exceptions.InvalidTimestamp):
+                validator.validate(SIGNED_BODY, SIGNED_HEADERS)
+
+    def test_signature_validator_signature(self):
+        validator = sansio.SignatureValidator("mysupersecret")
+        assert (
+            validator.signature(b"1534688291", SIGNED_BODY.encode("utf-8"))
+            == SIGNED_HEADERS["X-Slack-Signature"]
+        )
+
+    @mock.patch("time.time", mock.MagicMock(return_value=1534688291))
+    def test_validate_request_signature_replayed(self):
+        cache = replay.ReplayCache()
+        sansio.validate_request_signature(
+            SIGNED_BODY, SIGNED_HEADERS, "mysupersecret", replay_cache=cache
+        )
+        with pytest.raises(exceptions.ReplayedRequest):
+            sansio.validate_request_signature(
+                SIGNED_BODY, SIGNED_HEADERS, "mysupersecret", replay_cache=cache
+            )
+
+        sansio.validate_request_signature(SIGNED_BODY, SIGNED_HEADERS, "mysupersecret")
+
+    @mock.patch("time.time", mock.MagicMock(return_value=1534688291))
+    def test_signature_validator_replay_invalid_signature(self):
+        cache = replay.ReplayCache()
+        validator = sansio.SignatureValidator("mysupersecret", replay_cache=cache)
+        with pytest.raises(exceptions.InvalidSlackSignature):
+            validator.validate(b"{}", SIGNED_HEADERS)
+
+        assert len(cache) == 0
+        validator.validate(SIGNED_BODY, SIGNED_HEADERS)
+        assert len(cache) == 1
+
 
 class TestIncomingEvent:
     @pytest.mark.parametrize("slack_event", ("bot", "bot_edit"), indirect=True)
@@ -421,6 +578,29 @@ class TestIncomingEvent:
         ev = Event.from_http(slack_event)
         assert sansio.discard_event(ev, "B0AAA0A01") is False
 
+    def test_discard_lazy_event(self, recording_codec):
+        skip = Event.from_rtm(
+            json.dumps({"type": "reconnect_url", "url": "wss://"}),
+            recording_codec,
+            lazy=True,
+        )
+        assert sansio.discard_event(skip, "B0AAA0A00") is True
+
+        message = Event.from_rtm(
+            json.dumps({"type": "message", "bot_id": "B0AAA0A01"}),
+            recording_codec,
+            lazy=True,
+        )
+        assert sansio.discard_event(message, "B0AAA0A00") is False
+        assert recording_codec.loaded == []
+
+        bot_message = Event.from_rtm(
+            json.dumps({"type": "message", "bot_id": "B0AAA0A00"}).encode(),
+            recording_codec,
+            lazy=True,
+        )
+        assert sansio.discard_event(bot_message, "B0AAA0A00") is True
+
     def test_no_need_reconnect(self, slack_event):
         ev = Event.from_http(slack_event)
         assert sansio.need_reconnect(ev) is False
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+from slack import stream
+
+DOCUMENT = {
+    "ok": True,
+    "nested": {"members": ["not", "this", "one"], "text": 'a "]}[{" string'},
+    "members": [
+        {"id": "U000AA000", "name": 'name with "quotes" and ]}', "tz_offset": -3600},
+        {"id": "U000AA001", "profile": {"fields": [1, 2.5, None, True, False]}},
+        "string",
+        1234,
+        -1.5e3,
+        None,
+        [],
+        {},
+    ],
+    "response_metadata": {"next_cursor": "abcd"},
+}
+
+
+def _feed(decoder, raw, size):
+    items = []
+    for index in range(0, len(raw), size):
+        items.extend(decoder.feed(raw[index : index + size]))
+    return items
+
+
+class TestItemDecoder:
+    @pytest.mark.parametrize("size", (1, 2, 3, 7, 64, 100000))
+    @pytest.mark.parametrize("indent", (None, 2))
+    def test_items(self, size, indent):
+        raw = json.dumps(DOCUMENT, indent=indent).encode("utf-8")
+        decoder = stream.ItemDecoder("members")
+
+        assert _feed(decoder, raw, size) == DOCUMENT["members"]
+        document = decoder.close()
+        assert document == {**DOCUMENT, "members": [{}]}
+        assert decoder.document is document
+
+    def test_items_codec(self, recording_codec):
+        raw = json.dumps({"ok": True, "members": [{"id": 1}, {"id": 2}]}).encode()
+        decoder = stream.ItemDecoder("members", recording_codec)
+
+        assert _feed(decoder, raw, 5) == [{"id": 1}, {"id": 2}]
+        assert recording_codec.loaded == [b'{"id": 1}', b'{"id": 2}']
+
+    def test_items_utf8(self):
+        raw = json.dumps({"members": ["é", "日本"]}, ensure_ascii=False).encode()
+        decoder = stream.ItemDecoder("members")
+
+        assert _feed(decoder, raw, 1) == ["é", "日本"]
+
+    def test_buffer_bounded(self):
+        raw = json.dumps({"members": [{"id": i} for i in range(1000)]}).encode()
+        decoder = stream.ItemDecoder("members")
+
+        for index in range(0, len(raw), 16):
+            decoder.feed(raw[index : index + 16])
+            assert len(decoder._buffer) < 32
+
+    def test_empty(self):
+        decoder = stream.ItemDecoder("members")
+        assert decoder.feed(b'{"ok": true, "members": []}') == []
+        assert decoder.close() == {"ok": True, "members": []}
+
+    def test_no_items(self):
+        decoder = stream.ItemDecoder("members")
+        assert decoder.feed(b'{"ok": false, "error": "invalid_auth"}') == []
+        assert decoder.close() == {"ok": False, "error": "invalid_auth"}
+
+    def test_incomplete(self):
+        decoder = stream.ItemDecoder("members")
+        assert decoder.feed(b'{"ok": true, "members": [1, 2') == [1]
+        with pytest.raises(ValueError):
+            decoder.close()
+
+    def test_not_an_object(self):
+        decoder = stream.ItemDecoder("members")
+        with pytest.raises(ValueError):
+            decoder.feed(b"[1, 2]")